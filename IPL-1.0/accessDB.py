@@ -1,12 +1,106 @@
-import pymongo
+import threading
+import time
 
-connection = pymongo.MongoClient('localhost', 27017)
+# Players from the Mongo collection, the alternative to accessJSON's bundled
+# data (player_profiles picks one; IPL_PLAYERS=mongo selects this). A roster
+# is fetched with one $in query, projected to the fields the engines read
+# (not the byBatsman/byBowler breakdowns), and kept in `cache` until it
+# expires or is invalidated. pymongo is only needed once a query is made.
 
-def getPlayerInfo(initials):
-	db = connection['cricmanagerrecent'] #db = connection['cricmanager']
-	document = db['playerInfo']
+HOST = 'localhost'
+PORT = 27017
+DATABASE = 'cricmanagerrecent' #'cricmanager'
+COLLECTION = 'playerInfo'
+
+FIELDS = ('playerInitials', 'displayName', 'batStyle', 'bowlStyle',
+	'batRunsTotal', 'batBallsTotal', 'batOutsTotal', 'batOutTypes', 'batRunDenominations',
+	'bowlRunsTotal', 'bowlBallsTotal', 'bowlOutsTotal', 'bowlOutTypes', 'bowlRunDenominations',
+	'bowlNoballs', 'bowlWides', 'catches', 'runnedOut', 'captained', 'wicketkeeper', 'matches',
+	'overNumbers', 'position')
+PROJECTION = dict({field: 1 for field in FIELDS}, _id=0)
+
+# seconds a fetched player is reused before the collection is asked again
+TTL = 300
+
+# the MongoClient (it pools its own connections), made on first use
+connection = None
+_connectionLock = threading.Lock()
+
+
+def collection():
+	global connection
+	with _connectionLock:
+		if connection is None:
+			import pymongo
+			connection = pymongo.MongoClient(HOST, PORT)
+	return connection[DATABASE][COLLECTION]
+
+
+class PlayerCache:
+	"""{displayName: document}, all dropped together when `ttl` seconds are up or on
+	invalidate(); each fresh start is a new `version`."""
+
+	def __init__(self, ttl=TTL, clock=time.monotonic):
+		self.ttl = ttl
+		self.clock = clock
+		self.version = 0
+		self.players = {}
+		self.expires = clock() + ttl
+		self.lock = threading.Lock()
+
+	def _reset(self):
+		self.version += 1
+		self.players = {}
+		self.expires = self.clock() + self.ttl
+
+	def _current(self):
+		if self.clock() >= self.expires:
+			self._reset()
+		return self.version
+
+	def currentVersion(self):
+		with self.lock:
+			return self._current()
 
+	def invalidate(self):
+		with self.lock:
+			self._reset()
+
+	def lookup(self, names):
+		"""(version, {name: document} cached, [names not cached])"""
+		with self.lock:
+			version = self._current()
+			found = {name: self.players[name] for name in names if name in self.players}
+			return version, found, [name for name in names if name not in found]
+
+	def store(self, version, players):
+		# fetched under `version`; dropped if the cache has moved on since
+		with self.lock:
+			if self._current() == version:
+				self.players.update(players)
+
+
+cache = PlayerCache()
+
+
+def getPlayers(names):
+	"""{displayName: document} for the names found, the uncached ones fetched with one
+	query. Documents are shared with the cache: read them, don't change them."""
+	version, found, missing = cache.lookup(list(dict.fromkeys(names)))
+	if missing:
+		fetched = {doc['displayName']: doc
+			for doc in collection().find({'displayName': {'$in': missing}}, PROJECTION)}
+		cache.store(version, fetched)
+		found.update(fetched)
+	return found
+
+
+def version():
+	return cache.currentVersion()
+
+
+def getPlayerInfo(initials):
 	# fetch = document.find_one({"playerInitials": initials})
-	fetch = document.find_one({"displayName": initials}) #may be same for some
+	fetch = getPlayers([initials]).get(initials) #may be same for some
 
 	return fetch
\ No newline at end of file
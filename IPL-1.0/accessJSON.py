@@ -1,10 +1,32 @@
-import json
+import player_store
 
-with open("data/playerInfoProcessed.json") as f:
-	data = json.load(f)
+# {name: player}; memory-mapped from the compiled store (player_store.py), which is
+# rebuilt from the JSON whenever the JSON changes
+data = player_store.load("data/playerInfoProcessed.json", "data/playerInfoProcessed.bin")
+# (version, data), replaced as one by install() so a version is never read with another version's data
+_snapshot = (0, data)
 
 def getPlayerInfo(initials):
 	# fetch = document.find_one({"playerInitials": initials})
 	fetch = data[initials] #may be same for some
 
-	return fetch 
\ No newline at end of file
+	return fetch 
+
+def getPlayers(names):
+	# without the byBatsman/byBowler breakdowns, which no engine reads (as accessDB.PROJECTION)
+	players = _snapshot[1]
+	if isinstance(players, player_store.PlayerStore):
+		return {name: players.summary(name) for name in names if name in players}
+	return {name: {k: v for k, v in players[name].items() if k not in player_store.BREAKDOWNS}
+			for name in names if name in players}
+
+# bumped by every install()
+def version():
+	return _snapshot[0]
+
+def install(players):
+	# swap in reloaded data (data_registry.py); returns its version
+	global data, _snapshot
+	_snapshot = (_snapshot[0] + 1, players)
+	data = players
+	return _snapshot[0]
\ No newline at end of file
@@ -0,0 +1,499 @@
+import math
+from collections import namedtuple
+
+# The situational adjustments delivery() makes to a ball's run weights
+# (den, keyed '0'..'6') and out chance before drawing the outcome.
+#
+# adjust() is the chain itself, as innings1()/innings2() wrote it inline; a
+# straight run of tests is the quickest way to do this one ball at a time
+# in CPython. The same rules are also written out as data (the Rule tables
+# below) and compiled into tables indexed by situation buckets: phase of
+# the innings (balls bowled), wickets band, batter-set band (balls faced,
+# strike rate), recent form and rate band (the run rate in the first
+# innings, the required rate in the chase). batch_engine applies those to
+# thousands of matches at once, so both engines share one set of
+# coefficients; tests/test_adjustments.py checks the tables against adjust().
+
+Situation = namedtuple("Situation", "balls wickets batBalls sr outs rate rrr rrro")
+
+# A rule adds adjust * coefficient to each of `steps` ((run key, coefficient)
+# pairs, applied in order) and `out` to the out chance, where adjust is drawn
+# from uniform(lo, hi) and then has `offset` added.
+#   kind "six":   the first-overs six clamp: out chance down by 0.07 (not
+#                 below 0) and the draw capped at den['6']
+#   kind "chase": the draw and out get the required-rate term rrro*1.1/1000
+Rule = namedtuple("Rule", "when lo hi steps out offset kind", defaults=(0, 0, None))
+
+# Thresholds of every test the chain makes, as cuts where `value >= cut`
+# flips, so a feature's band is bisect_right(cuts, value). A strict
+# `value > t` test is cut at the next float above t.
+def _above(threshold):
+    return math.nextafter(threshold, math.inf)
+
+
+BALL_CUTS = (12, 36, 61, 80, 86, 102, 103, 105, 106)
+WICKET_CUTS = (1, 3, 5, 7)
+BAT_BALL_CUTS = (8, 16, 21, 30, 31, 41)
+FORM_CUTS = (2,)
+SR_CUTS = (110, 120, 135, _above(145))
+RATE_CUTS = (1.1, 1.17)
+RRR_CUTS = (1.5,)
+RRRO_CUTS = (8, _above(10.4), 12, _above(12), _above(15))
+
+SIX_TRANSFER = (('6', -1), ('0', 1/3), ('1', 2/3))
+
+FORM_RULES = (
+    Rule(lambda s: s.balls < 105 and s.outs < 2, 0.02, 0.04, (('0', -(1/2)), ('1', -(1/2)), ('2', 1/2), ('4', 1/2))),
+    Rule(lambda s: s.balls < 105 and s.outs >= 2, 0.02, 0.04,
+         (('0', 1.1/2), ('0', 0.9/2), ('4', -(1/2)), ('6', -(1/2))), -0.02, 0.018),
+)
+
+
+def _batter_rules(inningsNo):
+    return (
+        Rule(lambda s: s.batBalls < 8 and s.balls < 80, -0.01, 0.03,
+             (('0', 1.5/3), ('1', 1/3), ('2', 0.5/3), ('4', -(0.5/3)), ('6', -(1.5/3))), -0.015),
+        Rule(lambda s: s.batBalls > 15 and s.batBalls < 30, 0.03, 0.07, (('0', -(1/3)), ('4', 1/3))),
+        Rule(lambda s: s.batBalls > 20 and s.sr < 110, 0.05, 0.08, (('0', 1.5/3), ('1', 0.5/3), ('6', 2/3)), 0.05),
+        Rule(lambda s: s.batBalls > 40 and s.sr < (120 if inningsNo == 1 else 135), 0.06, 0.09,
+             (('0', (1.2 if inningsNo == 1 else 1.5)/3), ('1', 0.7/3), ('6', 1.8/3)), 0.04),
+        Rule(lambda s: s.batBalls > 30 and s.sr > 145 and (s.wickets < 5) or s.balls > 102, 0.06, 0.09,
+             (('0', -(1/3)), ('1', -(1.5/3)), ('4', 1.6/3), ('6', 1.9/3)), 0 if inningsNo == 1 else 0.02),
+    )
+
+
+def _first_innings_late(s):
+    return s.balls > 105 and s.rate < 1.17
+
+
+FIRST_INNINGS_RULES = (
+    Rule(_first_innings_late, 0.06, 0.09, (('0', 1.2/3), ('1', -(1.6/3)), ('4', 1.4/3), ('6', 2.1/3)), 0.03),
+    Rule(lambda s: not _first_innings_late(s) and s.balls > 60 and s.rate < 1.1, 0.06, 0.09,
+         (('0', -(1.2/3)), ('1', -(0.8/3)), ('4', 1/3), ('6', 1/3)), 0.02),
+    Rule(lambda s: s.balls < 12, 0.02, 0.05, SIX_TRANSFER, kind="six"),
+    Rule(lambda s: 12 <= s.balls < 36 and s.wickets == 0, 0.05, 0.11, (('0', -(2/3)), ('1', -(1/3)), ('4', 2/3), ('6', 1/3))),
+    Rule(lambda s: 12 <= s.balls < 36 and s.wickets != 0, 0.02, 0.08,
+         (('0', -(2/3)), ('1', -(1/3)), ('4', 2.5/3), ('6', 0.5/3)), -0.03),
+    Rule(lambda s: 36 <= s.balls < 102 and s.wickets < 3, 0.05, 0.11,
+         (('0', -(1.5/3)), ('1', -(1/3)), ('4', 1.5/3), ('6', 1/3))),
+    Rule(lambda s: 36 <= s.balls < 102 and s.wickets >= 3, 0.02, 0.07,
+         (('0', -(1.6/3)), ('1', -(1.2/3)), ('4', 2.1/3), ('6', 0.9/3)), -0.03),
+    Rule(lambda s: s.balls >= 102 and s.wickets < 7, 0.07, 0.1,
+         (('0', -(0.4/3)), ('1', -(1/3)), ('4', 1.4/3), ('6', 1.8/3)), 0.01),
+    Rule(lambda s: s.balls >= 102 and s.wickets >= 7, 0.07, 0.09,
+         (('0', -(0.4/3)), ('1', -(1.8/3)), ('4', 1.5/3), ('6', 1.5/3)), 0.01),
+)
+
+
+def _middle(s):
+    return 36 <= s.balls < 102
+
+
+CHASE_RULES = (
+    Rule(lambda s: s.balls < 12 and s.rrr < 1.5, 0.02, 0.05, SIX_TRANSFER, kind="six"),
+    Rule(lambda s: 12 <= s.balls < 36 and s.rrro < 8, 0.05, 0.09, (('6', -(2/3)), ('4', -(1/3)), ('1', 1)), -0.04),
+    Rule(lambda s: 12 <= s.balls < 36 and 8 <= s.rrro <= 10.4, 0.04, 0.08,
+         (('6', 0.6/3), ('4', 1/3), ('0', 1/3), ('1', -(1/3)), ('2', -(0.6/3))), -0.03),
+    Rule(lambda s: 12 <= s.balls < 36 and s.rrro > 10.4, 0.04, 0.08,
+         (('6', 1.5/3), ('4', 1/3), ('0', 0.5/3), ('1', -(2/3)), ('2', -(1/3))), 0.02, kind="chase"),
+    Rule(lambda s: _middle(s) and s.rrro < 8 and s.wickets < 3, 0.05, 0.09,
+         (('6', -(0.8/3)), ('0', -(1/3)), ('2', 1/3), ('1', 1.5/3)), -0.02),
+    Rule(lambda s: _middle(s) and s.rrro < 8 and s.wickets >= 3, 0.05, 0.09, (('1', 1),), -0.04),
+    Rule(lambda s: _middle(s) and 8 <= s.rrro <= 10.4 and s.wickets < 3, 0.6, 0.08,
+         (('6', 1/3), ('4', 1.15/3), ('0', 0.1/3), ('1', -(1/3)), ('2', -(1/3))), 0.015),
+    Rule(lambda s: _middle(s) and 8 <= s.rrro <= 10.4 and s.wickets >= 3, 0.04, 0.08,
+         (('6', 0.95/3), ('4', 1.12/3), ('0', 0.2/3), ('1', -(0.9/3)), ('2', -(0.7/3))), 0.01),
+    Rule(lambda s: _middle(s) and 10.4 < s.rrro < 12 and s.wickets < 3, 0.075, 0.1,
+         (('6', 1.5/3), ('4', 1.5/3), ('0', 0.5/3), ('1', -(1.5/3)), ('2', -(1.5/3)), ('3', -(0.7/3))), 0.025),
+    Rule(lambda s: _middle(s) and 10.4 < s.rrro < 12 and s.wickets >= 3, 0.06, 0.1,
+         (('6', 1.4/3), ('4', 1/3), ('0', 0.6/3), ('1', -(1.1/3)), ('2', -(1.1/3)), ('3', -(0.7/3))), 0.035),
+    Rule(lambda s: _middle(s) and 12 <= s.rrro <= 15 and s.balls > 85 and s.wickets < 3, 0.065, 0.115,
+         (('6', 1.5/3), ('4', 1.2/3), ('0', 1.4/3), ('1', -(1.2/3)), ('2', -(1.7/3)), ('3', -(0.9/3))), 0.04),
+    Rule(lambda s: _middle(s) and 12 <= s.rrro <= 15 and s.balls > 85 and s.wickets >= 3, 0.05, 0.1,
+         (('6', 1.2/3), ('4', 0.8/3), ('0', 1.2/3), ('1', -(1.2/3)), ('2', -(1.6/3)), ('3', -(0.9/3))), 0.05),
+    Rule(lambda s: _middle(s) and 12 <= s.rrro <= 15 and s.balls <= 85, 0.05, 0.1,
+         (('6', 1.3/3), ('4', 1/3), ('0', 1.2/3), ('1', -(1.2/3)), ('2', -(1.6/3)), ('3', -(0.9/3))), 0.03),
+    Rule(lambda s: _middle(s) and s.rrro > 15 and s.wickets < 3, 0.075, 0.125,
+         (('6', 2/3), ('4', 1.5/3), ('0', 1.8/3), ('1', -(1.2/3)), ('2', -(1.6/3)), ('3', -(0.9/3))), 0.05),
+    Rule(lambda s: _middle(s) and s.rrro > 15 and s.wickets >= 3, 0.07, 0.12,
+         (('6', 1.8/3), ('4', 1.5/3), ('0', 1.8/3), ('1', -(1.6/3)), ('2', -(1.7/3)), ('3', -(0.9/3))), 0.04),
+    Rule(lambda s: s.balls >= 102 and (s.wickets < 7 or s.rrro > 12), 0.07, 0.1,
+         (('0', 1.8/3), ('1', -(1/3)), ('4', 1.45/3), ('6', 1.85/3)), 0.032),
+    Rule(lambda s: s.balls >= 102 and not (s.wickets < 7 or s.rrro > 12), 0.07, 0.09,
+         (('0', -(1.2/3)), ('1', -(1.8/3)), ('4', 1.5/3), ('6', 1.5/3)), 0.028),
+)
+
+
+def _points(cuts):
+    # a value inside each band: just below the first cut, then each cut
+    return (cuts[0] - 1,) + cuts
+
+
+def _compile(rules, axes, build, interned):
+    # axes: the cuts of the table's features; build maps one value per band
+    # to the Situation the rules are tested on. The table is nested lists,
+    # one level per feature, down to an index into `interned`, the distinct
+    # rule tuples.
+    def walk(values, rest):
+        if not rest:
+            s = build(*values)
+            fired = tuple(rule for rule in rules if rule.when(s))
+            return interned.setdefault(fired, len(interned))
+        return [walk(values + (value,), rest[1:]) for value in _points(rest[0])]
+
+    return walk((), axes)
+
+
+class AdjustmentTables:
+    """The Rule tables of one innings (1, or 2 for the chase), compiled by bucket.
+
+    form, batter and team are nested lists indexed by the bands of their
+    features (bisect_right of the value in each cut list, in the order
+    below), down to an index into `rules`, the distinct tuples of rules that
+    fire together. `order` is every rule of the innings in the chain's order.
+
+        form    BALL_CUTS, FORM_CUTS (wickets in the recent-form window)
+        batter  BALL_CUTS, WICKET_CUTS, BAT_BALL_CUTS, SR_CUTS
+        team    BALL_CUTS, WICKET_CUTS, RATE_CUTS                (innings 1)
+                BALL_CUTS, WICKET_CUTS, RRR_CUTS, RRRO_CUTS      (innings 2)
+    """
+
+    def __init__(self, inningsNo):
+        self.inningsNo = inningsNo
+        interned = {}
+        batterRules = _batter_rules(inningsNo)
+        self.form = _compile(FORM_RULES, (BALL_CUTS, FORM_CUTS),
+                             lambda b, o: Situation(b, None, None, None, o, None, None, None), interned)
+        self.batter = _compile(batterRules, (BALL_CUTS, WICKET_CUTS, BAT_BALL_CUTS, SR_CUTS),
+                               lambda b, w, bb, sr: Situation(b, w, bb, sr, None, None, None, None), interned)
+        if inningsNo == 1:
+            teamRules = FIRST_INNINGS_RULES
+            self.team = _compile(teamRules, (BALL_CUTS, WICKET_CUTS, RATE_CUTS),
+                                 lambda b, w, rate: Situation(b, w, None, None, None, rate, None, None), interned)
+        else:
+            teamRules = CHASE_RULES
+            self.team = _compile(teamRules, (BALL_CUTS, WICKET_CUTS, RRR_CUTS, RRRO_CUTS),
+                                 lambda b, w, rrr, rrro: Situation(b, w, None, None, None, None, rrr, rrro), interned)
+        self.rules = list(interned)
+        self.order = FORM_RULES + batterRules + teamRules
+
+
+TABLES = {1: AdjustmentTables(1), 2: AdjustmentTables(2)}
+
+
+def adjust(inningsNo, den, outAvg, rng, balls, wickets, batBalls, batRuns, formOuts, runs, target=None):
+    """Apply the situational adjustments to `den` in place; returns the new out chance.
+
+    batBalls/batRuns are the striker's, formOuts the wickets in the recent-form
+    window, target the chase target (innings 2 only).
+    """
+    denAvg = den
+    if(balls < 105):
+        adjust_last10 = rng.uniform(0.02,0.04)
+        if(formOuts < 2):
+            denAvg['0'] -= adjust_last10 * (1/2)
+            denAvg['1'] -= adjust_last10 * (1/2)
+            denAvg['2'] += adjust_last10 * (1/2)
+            denAvg['4'] += adjust_last10 * (1/2)
+        else:
+            adjust_last10 += 0.018
+            denAvg['0'] += adjust_last10 * (1.1/2)
+            denAvg['0'] += adjust_last10 * (0.9/2)
+            denAvg['4'] -= adjust_last10 * (1/2)
+            denAvg['6'] -= adjust_last10 * (1/2)
+            outAvg -= 0.02
+
+    if(batBalls < 8 and balls < 80):
+        adjust = rng.uniform(-0.01, 0.03)
+        outAvg -= 0.015
+        denAvg['0'] += adjust * (1.5/3)
+        denAvg['1'] += adjust * (1/3)
+        denAvg['2'] += adjust * (0.5/3)
+        denAvg['4'] -= adjust * (0.5/3)
+        denAvg['6'] -= adjust * (1.5/3)
+
+    if(batBalls > 15 and batBalls < 30):
+        adjust = rng.uniform(0.03, 0.07)
+        denAvg['0'] -= adjust * (1/3)
+        denAvg['4'] += adjust * (1/3)
+
+    if(batBalls > 20 and (batRuns / batBalls) < 110):
+        adjust = rng.uniform(0.05, 0.08)
+        denAvg['0'] += adjust * (1.5/3)
+        denAvg['1'] += adjust * (0.5/3)
+        denAvg['6'] += adjust * (2/3)
+        outAvg += 0.05
+
+    if inningsNo == 1:
+        if(batBalls > 40 and (batRuns / batBalls) < 120):
+            adjust = rng.uniform(0.06, 0.09)
+            denAvg['0'] += adjust * (1.2/3)
+            denAvg['1'] += adjust * (0.7/3)
+            denAvg['6'] += adjust * (1.8/3)
+            outAvg += 0.04
+    else:
+        if(batBalls > 40 and (batRuns / batBalls) < 135):
+            adjust = rng.uniform(0.06, 0.09)
+            denAvg['0'] += adjust * (1.5/3)
+            denAvg['1'] += adjust * (0.7/3)
+            denAvg['6'] += adjust * (1.8/3)
+            outAvg += 0.04
+
+    if(batBalls > 30 and (batRuns / batBalls) > 145 and (wickets < 5) or balls > 102):
+        adjust = rng.uniform(0.06, 0.09)
+        denAvg['0'] -= adjust * (1/3)
+        denAvg['1'] -= adjust * (1.5/3)
+        denAvg['4'] += adjust * (1.6/3)
+        denAvg['6'] += adjust * (1.9/3)
+        if inningsNo == 2:
+            outAvg += 0.02
+
+    if inningsNo == 1:
+        return _first_innings(denAvg, outAvg, rng, balls, wickets, runs)
+    return _chase(denAvg, outAvg, rng, balls, wickets, runs, target)
+
+
+def _first_innings(denAvg, outAvg, rng, balls, wickets, runs):
+    if(balls > 105 and (runs / balls) < 1.17):
+        adjust = rng.uniform(0.06, 0.09)
+        denAvg['0'] += adjust * (1.2/3)
+        denAvg['1'] -= adjust * (1.6/3)
+        denAvg['4'] += adjust * (1.4/3)
+        denAvg['6'] += adjust * (2.1/3)
+        outAvg += 0.03
+
+    elif(balls > 60 and (runs/balls) < 1.1):
+        adjust = rng.uniform(0.06, 0.09)
+        denAvg['0'] -= adjust * (1.2/3)
+        denAvg['1'] -= adjust * (0.8/3)
+        denAvg['4'] += adjust * (1/3)
+        denAvg['6'] += adjust * (1/3)
+        outAvg += 0.02
+
+    if(balls < 12):
+        sixAdjustment = rng.uniform(0.02, 0.05)
+        if(outAvg < 0.07):
+            outAvg = 0
+        else:
+            outAvg = outAvg - 0.07
+
+        if(sixAdjustment > denAvg['6']):
+            sixAdjustment = denAvg['6']
+
+        denAvg['6'] -= sixAdjustment
+        denAvg['0'] += sixAdjustment * (1/3)
+        denAvg['1'] += sixAdjustment * (2/3)
+
+    elif(balls >= 12 and balls < 36):
+        if(wickets == 0):
+            defenseAndOneAdjustment = rng.uniform(0.05, 0.11)
+            denAvg['0'] -= defenseAndOneAdjustment * (2/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1/3)
+            denAvg['4'] += defenseAndOneAdjustment * (2/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1/3)
+        else:
+            defenseAndOneAdjustment = rng.uniform(0.02, 0.08)
+            denAvg['0'] -= defenseAndOneAdjustment * (2/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1/3)
+            denAvg['4'] += defenseAndOneAdjustment * (2.5/3)
+            denAvg['6'] += defenseAndOneAdjustment * (0.5/3)
+            outAvg -= 0.03
+
+    elif(balls >= 36 and balls < 102):
+        if(wickets < 3):
+            defenseAndOneAdjustment = rng.uniform(0.05, 0.11)
+            denAvg['0'] -= defenseAndOneAdjustment * (1.5/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1/3)
+            denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1/3)
+        else:
+            defenseAndOneAdjustment = rng.uniform(0.02, 0.07)
+            denAvg['0'] -= defenseAndOneAdjustment * (1.6/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1.2/3)
+            denAvg['4'] += defenseAndOneAdjustment * (2.1/3)
+            denAvg['6'] += defenseAndOneAdjustment * (0.9/3)
+            outAvg -= 0.03
+
+    else:
+        if(wickets < 7):
+            defenseAndOneAdjustment = rng.uniform(0.07, 0.1)
+            denAvg['0'] -= defenseAndOneAdjustment * (0.4/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1/3)
+            denAvg['4'] += defenseAndOneAdjustment * (1.4/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1.8/3)
+            outAvg += 0.01
+        else:
+            defenseAndOneAdjustment = rng.uniform(0.07, 0.09)
+            denAvg['0'] -= defenseAndOneAdjustment * (0.4/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1.8/3)
+            denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1.5/3)
+            outAvg += 0.01
+    return outAvg
+
+
+def _chase(denAvg, outAvg, rng, balls, wickets, runs, target):
+    rrr = (target - runs) / (120 - balls)
+
+    if(balls < 12):
+        if(rrr < 1.5):
+            sixAdjustment = rng.uniform(0.02, 0.05)
+            if(outAvg < 0.07):
+                outAvg = 0
+            else:
+                outAvg = outAvg - 0.07
+
+            if(sixAdjustment > denAvg['6']):
+                sixAdjustment = denAvg['6']
+
+            denAvg['6'] -= sixAdjustment
+            denAvg['0'] += sixAdjustment * (1/3)
+            denAvg['1'] += sixAdjustment * (2/3)
+
+    elif(balls < 36):
+        rrro = rrr*6
+        if(rrro < 8):
+            adjust = rng.uniform(0.05, 0.09)
+            denAvg['6'] -= adjust * (2/3)
+            denAvg['4'] -= adjust * (1/3)
+            denAvg['1'] += adjust
+            outAvg -= 0.04
+
+        elif(rrro >= 8 and rrro <= 10.4):
+            adjust = rng.uniform(0.04, 0.08)
+            denAvg['6'] += adjust * (0.6/3)
+            denAvg['4'] += adjust * (1/3)
+            denAvg['0'] += adjust * (1/3)
+            denAvg['1'] -= adjust * (1/3)
+            denAvg['2'] -= adjust * (0.6/3)
+            outAvg -= 0.03
+
+        else:
+            adjust = rng.uniform(0.04,0.08)
+            adjust += (rrro*1.1)/1000
+            denAvg['6'] += adjust * (1.5/3)
+            denAvg['4'] += adjust * (1/3)
+            denAvg['0'] += adjust * (0.5/3)
+            denAvg['1'] -= adjust * (2/3)
+            denAvg['2'] -= adjust * (1/3)
+            outAvg += (0.02 + ((rrro*1.1)/1000))
+
+    elif(balls >= 36 and balls < 102):
+        rrro = rrr*6
+        if(rrro < 8):
+            if(wickets < 3):
+                adjust = rng.uniform(0.05, 0.09)
+                denAvg['6'] -= adjust * (0.8/3)
+                denAvg['0'] -= adjust * (1/3)
+                denAvg['2'] += adjust * (1/3)
+                denAvg['1'] += adjust * (1.5/3)
+                outAvg -= 0.02
+            else:
+                adjust = rng.uniform(0.05, 0.09)
+                denAvg['1'] += adjust
+                outAvg -= 0.04
+
+        elif(rrro >= 8 and rrro <= 10.4):
+            if(wickets < 3):
+                adjust = rng.uniform(0.6, 0.08)
+                denAvg['6'] += adjust * (1/3)
+                denAvg['4'] += adjust * (1.15/3)
+                denAvg['0'] += adjust * (0.1/3)
+                denAvg['1'] -= adjust * (1/3)
+                denAvg['2'] -= adjust * (1/3)
+                outAvg += 0.015
+            else:
+                adjust = rng.uniform(0.04, 0.08)
+                denAvg['6'] += adjust * (0.95/3)
+                denAvg['4'] += adjust * (1.12/3)
+                denAvg['0'] += adjust * (0.2/3)
+                denAvg['1'] -= adjust * (0.9/3)
+                denAvg['2'] -= adjust * (0.7/3)
+                outAvg += 0.01
+
+        elif(rrro > 10.4 and rrro < 12):
+            if(wickets < 3):
+                adjust = rng.uniform(0.075, 0.1)
+                denAvg['6'] += adjust * (1.5/3)
+                denAvg['4'] += adjust * (1.5/3)
+                denAvg['0'] += adjust * (0.5/3)
+                denAvg['1'] -= adjust * (1.5/3)
+                denAvg['2'] -= adjust * (1.5/3)
+                denAvg['3'] -= adjust * (0.7/3)
+                outAvg += 0.025
+            else:
+                adjust = rng.uniform(0.06, 0.1)
+                denAvg['6'] += adjust * (1.4/3)
+                denAvg['4'] += adjust * (1/3)
+                denAvg['0'] += adjust * (0.6/3)
+                denAvg['1'] -= adjust * (1.1/3)
+                denAvg['2'] -= adjust * (1.1/3)
+                denAvg['3'] -= adjust * (0.7/3)
+                outAvg += 0.035
+
+        elif(rrro >= 12 and rrro <= 15):
+            if(balls > 85):
+                if(wickets < 3):
+                    adjust = rng.uniform(0.065, 0.115)
+                    denAvg['6'] += adjust * (1.5/3)
+                    denAvg['4'] += adjust * (1.2/3)
+                    denAvg['0'] += adjust * (1.4/3)
+                    denAvg['1'] -= adjust * (1.2/3)
+                    denAvg['2'] -= adjust * (1.7/3)
+                    denAvg['3'] -= adjust * (0.9/3)
+                    outAvg += 0.04
+                else:
+                    adjust = rng.uniform(0.05, 0.1)
+                    denAvg['6'] += adjust * (1.2/3)
+                    denAvg['4'] += adjust * (0.8/3)
+                    denAvg['0'] += adjust * (1.2/3)
+                    denAvg['1'] -= adjust * (1.2/3)
+                    denAvg['2'] -= adjust * (1.6/3)
+                    denAvg['3'] -= adjust * (0.9/3)
+                    outAvg += 0.05
+            else:
+                adjust = rng.uniform(0.05, 0.1)
+                denAvg['6'] += adjust * (1.3/3)
+                denAvg['4'] += adjust * (1/3)
+                denAvg['0'] += adjust * (1.2/3)
+                denAvg['1'] -= adjust * (1.2/3)
+                denAvg['2'] -= adjust * (1.6/3)
+                denAvg['3'] -= adjust * (0.9/3)
+                outAvg += 0.03
+        else:
+            if(wickets < 3):
+                adjust = rng.uniform(0.075, 0.125)
+                denAvg['6'] += adjust * (2/3)
+                denAvg['4'] += adjust * (1.5/3)
+                denAvg['0'] += adjust * (1.8/3)
+                denAvg['1'] -= adjust * (1.2/3)
+                denAvg['2'] -= adjust * (1.6/3)
+                denAvg['3'] -= adjust * (0.9/3)
+                outAvg += 0.05
+            else:
+                adjust = rng.uniform(0.07, 0.12)
+                denAvg['6'] += adjust * (1.8/3)
+                denAvg['4'] += adjust * (1.5/3)
+                denAvg['0'] += adjust * (1.8/3)
+                denAvg['1'] -= adjust * (1.6/3)
+                denAvg['2'] -= adjust * (1.7/3)
+                denAvg['3'] -= adjust * (0.9/3)
+                outAvg += 0.04
+
+    else:
+        rrro = rrr*6
+        if(wickets < 7 or rrro > 12):
+            defenseAndOneAdjustment = rng.uniform(0.07, 0.1)
+            denAvg['0'] += defenseAndOneAdjustment * (1.8/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1/3)
+            denAvg['4'] += defenseAndOneAdjustment * (1.45/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1.85/3)
+            outAvg += 0.032
+        else:
+            defenseAndOneAdjustment = rng.uniform(0.07, 0.09)
+            denAvg['0'] -= defenseAndOneAdjustment * (1.2/3)
+            denAvg['1'] -= defenseAndOneAdjustment * (1.8/3)
+            denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
+            denAvg['6'] += defenseAndOneAdjustment * (1.5/3)
+            outAvg += 0.028
+    return outAvg
@@ -1,6 +1,12 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify # Ensure jsonify is here
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, Response, stream_with_context # Ensure jsonify is here
 import json
+import ball_events
+import data_registry
 import mainconnect # Import the game logic from mainconnect.py
+import player_store
+import result_cache
+import rosters
+import win_probability
 # from match_simulator import MatchSimulator # MatchSimulator is no longer actively used for new game initiation from UI
 import os
 import copy # For deepcopy if needed by process_batting_innings
@@ -23,6 +29,12 @@ ACTION_COSTS = {
     'ball_by_ball': 50
 }
 
+# Win probability rollouts
+# Both run in the request's own process (workers=1): a pool would fork the
+# threaded server, data-registry poller included, on every request
+REPLAY_WIN_PROBABILITY_ROLLOUTS = 20 # Per ball, when a replay is saved (about 1s a match on one CPU)
+MAX_WIN_PROBABILITY_ROLLOUTS = 20000 # Cap for /api/win_probability
+
 # Database Configuration
 DATABASE_FILE = os.path.join(app.root_path, 'ipl_points.db')
 
@@ -58,6 +70,23 @@ if not os.path.exists(TMP_LOG_DIR):
     except OSError as e:
         logging.error(f"Error creating temporary log directory {TMP_LOG_DIR}: {e}")
 
+# Seeded matches already played (see result_cache.py)
+RESULT_CACHE_DIR = os.path.join(app.root_path, 'result_cache')
+RESULT_CACHE = result_cache.ResultCache(entries=128, directory=RESULT_CACHE_DIR, maxBytes=256 << 20)
+
+# teams.json resolved against the player data now, so unknown players are
+# reported at startup rather than in the middle of a request (rosters.py)
+try:
+    rosters.index()
+except (OSError, json.JSONDecodeError) as e:
+    logging.error(f"Could not build the roster index: {e}")
+
+# Player and team data picked up while the app runs (see data_registry.py);
+# its snapshot's dataHash keys the result cache
+DATA = data_registry.DataRegistry(os.path.join(app.root_path, player_store.SOURCE),
+                                  os.path.join(app.root_path, player_store.STORE),
+                                  os.path.join(app.root_path, rosters.TEAMS_FILE)).start()
+
 # Initialize Database on startup
 # This should be after all app config but before routes
 with app.app_context():
@@ -66,8 +95,7 @@ with app.app_context():
 # --- Helper Functions ---
 def load_teams():
     try:
-        with open('teams/teams.json', 'r') as f:
-            return json.load(f)
+        return rosters.index().teams
     except FileNotFoundError:
         logging.error("teams/teams.json not found.")
         return {}
@@ -119,6 +147,25 @@ def process_batting_innings(bat_tracker_original):
             if any_other_batted :
                 stats['how_out'] = "DNB"
     return bat_tracker, wickets
+
+def replay_data(team1_code, team2_code, match_results, teams_data):
+    # what the ball-by-ball replay page reads, saved as JSON in TMP_LOG_DIR
+    processed_bat_tracker1, wickets1_fallen = process_batting_innings(match_results.get("innings1Battracker", {}))
+    processed_bat_tracker2, wickets2_fallen = process_batting_innings(match_results.get("innings2Battracker", {}))
+    return {
+        "toss_msg": match_results.get("tossMsg"), "team1_code": team1_code, "team2_code": team2_code,
+        "team1_data": teams_data.get(team1_code, {}), "team2_data": teams_data.get(team2_code, {}),
+        "innings1_log": match_results.get("innings1Log", []), "innings2_log": match_results.get("innings2Log", []),
+        "innings1_bat_team": match_results.get("innings1BatTeam"), "innings2_bat_team": match_results.get("innings2BatTeam"),
+        "innings1_runs": match_results.get("innings1Runs"), "innings1_wickets": wickets1_fallen,
+        "innings1_balls": match_results.get("innings1Balls", 0),
+        "innings2_runs": match_results.get("innings2Runs"), "innings2_wickets": wickets2_fallen,
+        "innings2_balls": match_results.get("innings2Balls", 0),
+        "win_msg": match_results.get("winMsg"), "winner": match_results.get("winner"),
+        "innings1_battracker": processed_bat_tracker1, "innings2_battracker": processed_bat_tracker2,
+        "innings1_bowltracker": match_results.get("innings1Bowltracker", {}),
+        "innings2_bowltracker": match_results.get("innings2Bowltracker", {})
+    }
 # --- End Helper Functions ---
 
 scores_dir_path = os.path.join(os.getcwd(), "scores")
@@ -143,13 +190,19 @@ def generate_scorecard():
     team1_code = request.form.get('selectedTeam1')
     team2_code = request.form.get('selectedTeam2')
     simulation_type = request.form.get('simulation_type')
+    seed = request.form.get('seed') or None # optional; a seeded match is cached
+
+    if seed is not None:
+        try: seed = int(seed)
+        except ValueError: return redirect(url_for('index', error_message="The seed must be a whole number."))
 
     if not team1_code or not team2_code: return redirect(url_for('index', error_message="Please select two teams."))
     if team1_code == team2_code: return redirect(url_for('index', error_message="Please select two different teams."))
     if not simulation_type: return redirect(url_for('index', error_message="Please select a simulation type."))
 
     if simulation_type == 'direct':
-        match_results = mainconnect.game(manual=False, sentTeamOne=team1_code, sentTeamTwo=team2_code, switch="webapp")
+        match_results = result_cache.game(RESULT_CACHE, team1_code, team2_code, switch="webapp", seed=seed,
+                                          dataHash=DATA.snapshot.dataHash)
 
         team1_s_name = teams_data.get(team1_code, {}).get('name', team1_code)
         team2_s_name = teams_data.get(team2_code, {}).get('name', team2_code)
@@ -177,28 +230,14 @@ def generate_scorecard():
         return render_template('index.html', teams=teams_data, scorecard_data=scorecard_data_for_template)
 
     elif simulation_type == 'ball_by_ball':
-        match_results = mainconnect.game(manual=False, sentTeamOne=team1_code, sentTeamTwo=team2_code, switch="webapp_full_log")
-        innings1_battracker_original = match_results.get("innings1Battracker", {})
-        innings2_battracker_original = match_results.get("innings2Battracker", {})
-        processed_bat_tracker1, wickets1_fallen = process_batting_innings(innings1_battracker_original)
-        processed_bat_tracker2, wickets2_fallen = process_batting_innings(innings2_battracker_original)
-        team1_full_data = teams_data.get(team1_code, {})
-        team2_full_data = teams_data.get(team2_code, {})
-
-        full_match_data_to_save = {
-            "toss_msg": match_results.get("tossMsg"), "team1_code": team1_code, "team2_code": team2_code,
-            "team1_data": team1_full_data, "team2_data": team2_full_data,
-            "innings1_log": match_results.get("innings1Log", []), "innings2_log": match_results.get("innings2Log", []),
-            "innings1_bat_team": match_results.get("innings1BatTeam"), "innings2_bat_team": match_results.get("innings2BatTeam"),
-            "innings1_runs": match_results.get("innings1Runs"), "innings1_wickets": wickets1_fallen,
-            "innings1_balls": match_results.get("innings1Balls", 0),
-            "innings2_runs": match_results.get("innings2Runs"), "innings2_wickets": wickets2_fallen,
-            "innings2_balls": match_results.get("innings2Balls", 0),
-            "win_msg": match_results.get("winMsg"), "winner": match_results.get("winner"),
-            "innings1_battracker": processed_bat_tracker1, "innings2_battracker": processed_bat_tracker2,
-            "innings1_bowltracker": match_results.get("innings1Bowltracker", {}),
-            "innings2_bowltracker": match_results.get("innings2Bowltracker", {})
-        }
+        match_results = result_cache.game(RESULT_CACHE, team1_code, team2_code, switch="webapp_full_log", seed=seed,
+                                          dataHash=DATA.snapshot.dataHash)
+        full_match_data_to_save = replay_data(team1_code, team2_code, match_results, teams_data)
+
+        try:
+            win_probability.annotate_replay(full_match_data_to_save, rollouts=REPLAY_WIN_PROBABILITY_ROLLOUTS, workers=1)
+        except Exception as e: # The replay still works without it
+            logging.error(f"Error computing win probabilities for replay: {e}")
 
         match_id = str(uuid.uuid4())
         tmp_file_path = os.path.join(TMP_LOG_DIR, f"match_log_{match_id}.json")
@@ -388,5 +427,51 @@ def deduct_coins():
         if conn:
             conn.close()
 
+@app.route('/api/win_probability', methods=['POST'])
+def api_win_probability():
+    # Body: {"state": {...}} (see win_probability.py), {"gameState": MatchSimulator.get_game_state()}
+    # or {"log": [...mainconnect log entries...], "inningsNo", "battingTeam", "bowlingTeam", "target"}
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Missing match state"}), 400
+    try:
+        if 'state' in data:
+            state = data['state']
+        elif 'gameState' in data:
+            state = win_probability.state_from_game_state(data['gameState'])
+        elif 'log' in data:
+            state = win_probability.state_from_log(data['log'], data['inningsNo'], data['battingTeam'],
+                                                   data['bowlingTeam'], data.get('target'))
+        else:
+            return jsonify({"error": "Expected one of state, gameState or log"}), 400
+        rollouts = int(data.get('rollouts', 2000))
+        if not (0 < rollouts <= MAX_WIN_PROBABILITY_ROLLOUTS):
+            return jsonify({"error": f"rollouts must be between 1 and {MAX_WIN_PROBABILITY_ROLLOUTS}"}), 400
+        return jsonify(win_probability.win_probability(state, rollouts=rollouts, workers=1))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"error": "Invalid match state", "details": str(e)}), 400
+    except Exception as e:
+        app.logger.error(f"Unexpected error in /api/win_probability: {e}")
+        return jsonify({"error": "An unexpected error occurred", "details": str(e)}), 500
+
+@app.route('/api/stream_match', methods=['GET'])
+def api_stream_match():
+    # Server-sent events, one per ball_events event, sent while the match is
+    # played: /api/stream_match?team1=csk&team2=mi[&seed=7]
+    teams_data = load_teams()
+    team1_code = request.args.get('team1', '').lower()
+    team2_code = request.args.get('team2', '').lower()
+    if team1_code not in teams_data or team2_code not in teams_data or team1_code == team2_code:
+        return jsonify({"error": "Expected two different teams"}), 400
+    try:
+        seed = int(request.args['seed']) if 'seed' in request.args else None
+    except ValueError:
+        return jsonify({"error": "seed must be an integer"}), 400
+
+    def events():
+        for event in mainconnect.streamGame(team1_code, team2_code, "webapp", seed=seed):
+            yield f"event: {type(event).__name__}\ndata: {json.dumps(ball_events.to_dict(event))}\n\n"
+    return Response(stream_with_context(events()), mimetype='text/event-stream')
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
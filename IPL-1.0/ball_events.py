@@ -0,0 +1,55 @@
+from collections import namedtuple
+
+# What mainconnect.streamGame()/streamMatch() and MatchSimulator.stream()
+# yield while a match is being played, so a consumer (an SSE endpoint, a live
+# rollout, a log writer) can handle each ball as it happens instead of
+# waiting for the whole match:
+#
+#   Ball        one delivery: innings (1/2), the over label ("3.4"), striker,
+#               bowler, runs it added to the total (extras included), extra
+#               ("wide") or None, how the batter got out or None ("caught",
+#               "bowled", "runOut", ...), then the score and wickets after it
+#   InningsEnd  after an innings' last ball: the batting side and its total
+#   MatchEnd    after the second innings: winner ("tie" on a tie), the result
+#               message, and what the engine returns for a whole match
+#               (scorecard.MatchResult, or MatchSimulator.get_game_state())
+#
+# The events are plain tuples; to_dict() gives the JSON-ready form.
+
+Ball = namedtuple("Ball", "innings over batsman bowler runs extra out score wickets")
+InningsEnd = namedtuple("InningsEnd", "innings team score wickets balls")
+MatchEnd = namedtuple("MatchEnd", "winner winMsg result")
+
+
+def to_dict(event):
+    """{"type": "Ball", ...fields}; MatchEnd leaves out the full result."""
+    fields = event._asdict()
+    fields.pop("result", None)
+    return {"type": type(event).__name__, **fields}
+
+
+def from_log_entry(innings, over, entry, previousScore):
+    """The Ball for one mainconnect InningsLog entry.
+
+    The outcome is read back from the ballLog codes the ball added to the
+    bowler's and striker's trackers (see match_log.InningsLog.record), as
+    doipl.py does for the season stats.
+    """
+    code = entry['bowl'][-1][-1].split(":", 1)[1]
+    extra = "wide" if code == "WD" else None
+    out = None
+    if code.endswith("-runout"):
+        out = "runOut"
+    elif code == "W":
+        how = entry['bat'][-1][-1].split(":", 1)[1].split("-")[1]
+        out = "caught" if how == "CaughtBy" else how
+    return Ball(innings, over, entry['batsman'], entry['bowler'], entry['runs'] - previousScore,
+                extra, out, entry['runs'], entry['wickets'])
+
+
+def from_simulator_entry(innings, entry):
+    """The Ball for one MatchSimulator ball log entry."""
+    extra = entry['extra_type'].lower() if entry['is_extra'] else None
+    out = entry['wicket_details']['type'] if entry['is_wicket'] else None
+    return Ball(innings, entry['over_str'], entry['batsman_initial'], entry['bowler_initial'],
+                entry['total_runs_ball'], extra, out, entry['score_after_ball'], entry['wickets_after_ball'])
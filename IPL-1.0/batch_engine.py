@@ -0,0 +1,487 @@
+import math
+
+import numpy as np
+
+import adjustments
+import output_sinks
+import rosters
+import seeding
+from adjustments import (BALL_CUTS, WICKET_CUTS, BAT_BALL_CUTS, FORM_CUTS, SR_CUTS, RATE_CUTS, RRR_CUTS,
+                         RRRO_CUTS)
+from bowling_scheduler import BowlerScheduler
+from pair_matrix import PITCH_EFFECT
+from recent_form import DEFAULT_WINDOW
+
+# Vectorised Monte Carlo version of mainconnect.innings1()/innings2() for
+# projections: N independent matches of one fixture advance together, one
+# NumPy step per delivery across every match still in play. Per-match state
+# (score, wickets, balls, striker/non-striker/next batter, per-batter balls
+# and runs, recent-form ring buffer) lives in arrays; batter and bowler rates
+# come from the compiled player profiles as (team, player, outcome) arrays.
+#
+# The ball model is a port of delivery()/getOutcome(): the same pitch effect,
+# the same situational adjustments (applied from adjustments.py's Rule
+# tables, which are checked against mainconnect's chain), the same "wicket
+# only on a drawn dot" rule and run-out runs, and a wicket brings in the
+# next unused batter as BattingOrder does. One thing is
+# deliberately simpler than mainconnect: bowlers follow one 20-over
+# BowlerScheduler plan per team, without the economy checks mainconnect makes
+# against the live bowlerTracker, so bowler quotas are identical across matches.
+# equivalence_check() measures how closely the scores and results follow
+# mainconnect for a fixture.
+#
+# simulate_states() plays matches on from given mid-match states (score,
+# batters in and out, bowler overs) instead of from the toss; the rollouts
+# behind win_probability use it.
+
+RUN_KEYS = ('0', '1', '2', '3', '4', '5', '6')
+OUT_KEYS = ('caught', 'runOut', 'bowled', 'lbw', 'hitwicket', 'stumped')
+RUNOUT = OUT_KEYS.index('runOut')
+
+class TeamArrays:
+    """One side's batting order and bowling attack as NumPy arrays."""
+
+    def __init__(self, code, profiles):
+        self.code = code
+        order = sorted(profiles, key=lambda k: k['posAvg'])
+        self.batters = [p['playerInitials'] for p in order]
+        self.batDen = np.array([[p['batRunDenominationsObject'][k] for k in RUN_KEYS] for p in order])
+        self.batOut = np.array([p['batOutsRate'] for p in order])
+        self.batOutTypes = np.array([[p['batOutTypesObject'][k] for k in OUT_KEYS] for p in order])
+        self.runoutChance = np.array([p['runnedOut'] / p['batBallsTotal'] if p['batOutsTotal'] != 0 else 0.01
+                                      for p in order])
+
+        bowling = sorted(profiles, key=lambda k: k['bowlOutsRate'])
+        bowling.reverse()
+        bowling = bowling[0:7]
+        self.bowlers = [p['playerInitials'] for p in bowling]
+        self.bowlDen = np.array([[p['bowlRunDenominationsObject'][k] for k in RUN_KEYS] for p in bowling])
+        self.bowlOut = np.array([p['bowlOutsRate'] for p in bowling])
+        self.bowlOutTypes = np.array([[p['bowlOutTypesObject'][k] for k in OUT_KEYS] for p in bowling])
+        self.wideRate = np.array([p['bowlWideRate'] for p in bowling])
+        self.attack = bowling
+        self.plan = bowling_plan(self)
+
+
+def runout_share(batting, bowling):
+    # P(run out | out) for every batter x bowler pair: getOutcome draws the
+    # dismissal from the averaged out types with 'runOut' replaced by the
+    # batter's run-out chance.
+    avg = (batting.batOutTypes[:, None, :] + bowling.bowlOutTypes[None, :, :]) / 2
+    avg[:, :, RUNOUT] = batting.runoutChance[:, None]
+    return avg[:, :, RUNOUT] / avg.sum(axis=2)
+
+
+def bowling_plan(team, start=0, bowled=None, last=None):
+    # The scheduler's plan as bowler indexes, -1 for overs before `start`;
+    # `bowled` (initials -> overs) and `last` resume a mid-innings state.
+    plan = BowlerScheduler(team.attack, bowled=bowled, last=last).plan(start)
+    return np.array([-1 if ini is None else team.bowlers.index(ini) for ini in plan])
+
+
+def load_team(code, teamsFile='teams/teams.json'):
+    return TeamArrays(code, rosters.index(teamsFile).profiles(code))
+
+
+class BatchResult:
+    """Per-match outcome arrays for N simulations of one fixture.
+
+    innings1/innings2 hold runs, wickets and balls arrays plus batRuns and
+    batBalls (match x batting position). winner is 0 for team1, 1 for team2
+    and 2 for a tie; team1BattedFirst says which side innings1 belongs to.
+    """
+
+    def __init__(self, team1, team2, team1BattedFirst, innings1, innings2, winner):
+        self.team1 = team1
+        self.team2 = team2
+        self.team1BattedFirst = team1BattedFirst
+        self.innings1 = innings1
+        self.innings2 = innings2
+        self.winner = winner
+
+    def __len__(self):
+        return len(self.winner)
+
+    def win_rates(self):
+        n = len(self.winner)
+        return {self.team1: float(np.count_nonzero(self.winner == 0)) / n,
+                self.team2: float(np.count_nonzero(self.winner == 1)) / n,
+                "tie": float(np.count_nonzero(self.winner == 2)) / n}
+
+
+def _uniform(rng, a, b, n):
+    # random.uniform(a, b) semantics, including the a > b case
+    return a + (b - a) * rng.random(n)
+
+
+def _fresh_start(sides, batTeam):
+    # Per-match innings state before the first ball. Batters are positions in
+    # TeamArrays.batters; order is the sequence they come in and nextBat the
+    # index into it of the next one; plan is the bowler for each over.
+    n = len(batTeam)
+    plans = np.stack([sides[0].plan, sides[1].plan])
+    return {"runs": np.zeros(n, dtype=np.int64), "wickets": np.zeros(n, dtype=np.int64),
+            "balls": np.zeros(n, dtype=np.int64), "striker": np.zeros(n, dtype=np.int64),
+            "nonStriker": np.ones(n, dtype=np.int64), "nextBat": np.full(n, 2, dtype=np.int64),
+            "order": np.tile(np.arange(11), (n, 1)), "batBalls": np.zeros((n, 11), dtype=np.int64),
+            "batRuns": np.zeros((n, 11), dtype=np.int64), "plan": plans[1 - batTeam]}
+
+
+def _innings(rng, inningsNo, sides, runoutShare, batTeam, spin, target, formWindow, start=None):
+    n = len(batTeam)
+    bowlTeam = 1 - batTeam
+    if start is None:
+        start = _fresh_start(sides, batTeam)
+    runs = start["runs"].copy()
+    balls = start["balls"].copy()
+    wickets = start["wickets"].copy()
+    striker = start["striker"].copy()
+    nonStriker = start["nonStriker"].copy()
+    nextBat = start["nextBat"].copy()
+    order = start["order"]
+    plan = start["plan"]
+    batBalls = start["batBalls"].copy()
+    batRuns = start["batRuns"].copy()
+    formOuts = np.zeros(n, dtype=np.int64)
+    formCount = np.zeros(n, dtype=np.int64)
+    formBuf = np.zeros((n, formWindow), dtype=np.int64) if formWindow is not None else None
+
+    batDen = np.stack([sides[0].batDen, sides[1].batDen])
+    batOut = np.stack([sides[0].batOut, sides[1].batOut])
+    bowlDen = np.stack([sides[0].bowlDen, sides[1].bowlDen])
+    bowlOut = np.stack([sides[0].bowlOut, sides[1].bowlOut])
+    wideRate = np.stack([sides[0].wideRate, sides[1].wideRate])
+
+    cOut, c0, c1, c4, c6 = PITCH_EFFECT[inningsNo]
+    effect = (1.0 - spin) / 2
+    pitchDen = np.zeros((n, 7))
+    pitchDen[:, 0] = effect * c0
+    pitchDen[:, 1] = effect * c1
+    pitchDen[:, 4] = effect * c4
+    pitchDen[:, 6] = effect * c6
+    pitchOut = effect * cOut
+
+    def record_form(idx, out):
+        if formBuf is not None:
+            pos = formCount[idx] % formWindow
+            formOuts[idx] -= formBuf[idx, pos]
+            formBuf[idx, pos] = out
+        formOuts[idx] += out
+        formCount[idx] += 1
+
+    for over in range(int(balls.min()) // 6 if n else 20, 20):
+        # strike changes ends at the start of every over after the first
+        turn = balls == over * 6
+        if over != 0:
+            striker[turn], nonStriker[turn] = nonStriker[turn], striker[turn]
+        bowler = plan[:, over]
+        while True:
+            live = (balls < (over + 1) * 6) & (wickets < 10)
+            if target is not None:
+                live &= runs < target
+            idx = np.flatnonzero(live)
+            if len(idx) == 0:
+                break
+
+            bt, bl = bowlTeam[idx], bowler[idx]
+            wide = wideRate[bt, bl] > rng.random(len(idx))
+            runs[idx[wide]] += 1
+            idx = idx[~wide]
+            if len(idx) == 0:
+                continue
+            k = len(idx)
+            bt, bl, st = bowlTeam[idx], bowler[idx], striker[idx]
+            bat = batTeam[idx]
+
+            den = (batDen[bat, st] + bowlDen[bt, bl] + pitchDen[idx]) / 2
+            outAvg = (batOut[bat, st] + bowlOut[bt, bl] + pitchOut[idx]) / 2
+            b = balls[idx]
+            r = runs[idx]
+            w = wickets[idx]
+            bb = batBalls[idx, st]
+            sr = batRuns[idx, st] / np.maximum(bb, 1)
+
+            # situational adjustments, from the same Rule tables as mainconnect's chain
+            if inningsNo == 1:
+                rate, rrr = r / np.maximum(b, 1), None
+            else:
+                rate, rrr = None, (target[idx] - r) / (120 - b)
+            _adjust(ADJUSTMENTS[inningsNo], lambda lo, hi: _uniform(rng, lo, hi, k), den, outAvg,
+                    b, w, bb, sr, formOuts[idx], rate, rrr)
+
+            # getOutcome
+            total = den.sum(axis=1)
+            decider = total * rng.random(k)
+            ends = np.cumsum(den, axis=1)
+            hit = (ends - den <= decider[:, None]) & (decider[:, None] < ends)
+            drawn = hit.any(axis=1)
+            outcome = np.where(drawn, hit.argmax(axis=1), -1)
+            balls[idx] += 1
+
+            scoring = outcome > 0
+            si = idx[scoring]
+            value = outcome[scoring]
+            runs[si] += value
+            batRuns[si, striker[si]] += value
+            batBalls[si, striker[si]] += 1
+            record_form(si, 0)
+            odd = si[value % 2 == 1]
+            striker[odd], nonStriker[odd] = nonStriker[odd], striker[odd]
+
+            dot = outcome == 0
+            probOut = np.zeros(k)
+            probOut[dot] = outAvg[dot] * (total[dot] / den[dot, 0])
+            out = dot & (probOut > rng.random(k))
+            dotOnly = idx[dot & ~out]
+            batBalls[dotOnly, striker[dotOnly]] += 1
+            record_form(dotOnly, 0)
+
+            oi = idx[out]
+            if len(oi):
+                runOut = runoutShare[batTeam[oi], striker[oi], bowler[oi]] > rng.random(len(oi))
+                extra = np.where(runOut, rng.integers(0, 3, len(oi)), 0)
+                runs[oi] += extra
+                batRuns[oi, striker[oi]] += extra
+                batBalls[oi, striker[oi]] += 1
+                wickets[oi] += 1
+                record_form(oi, 1)
+                more = oi[wickets[oi] < 10]
+                striker[more] = order[more, nextBat[more]]
+                nextBat[more] += 1
+
+    return {"runs": runs, "wickets": wickets, "balls": balls, "batRuns": batRuns, "batBalls": batBalls}
+
+
+def _band(cuts, values):
+    # bisect_right of every value
+    return np.searchsorted(cuts, values, side='right')
+
+
+class _AdjustmentArrays:
+    """adjustments.AdjustmentTables as arrays, for looking up many situations at once."""
+
+    def __init__(self, tables):
+        self.form = np.array(tables.form)
+        self.batter = np.array(tables.batter)
+        self.team = np.array(tables.team)
+        # fires[t, r]: rule r of tables.order is in the rule tuple t
+        self.fires = np.array([[rule in fired for rule in tables.order] for fired in tables.rules])
+        self.rules = [(rule, [(int(key), coefficient) for key, coefficient in rule.steps]) for rule in tables.order]
+
+
+ADJUSTMENTS = {inningsNo: _AdjustmentArrays(tables) for inningsNo, tables in adjustments.TABLES.items()}
+
+
+def _adjust(arrays, uniform, den, outAvg, b, w, bb, sr, formOuts, rate=None, rrr=None):
+    """adjustments.adjust() for a vector of situations: den (k x 7) and outAvg
+    change in place. uniform(lo, hi) gives one draw per situation; rate is
+    the run rate (innings 1), rrr the required rate (innings 2)."""
+    ball, wicket = _band(BALL_CUTS, b), _band(WICKET_CUTS, w)
+    fires = arrays.fires
+    fired = fires[arrays.form[ball, _band(FORM_CUTS, formOuts)]]
+    fired |= fires[arrays.batter[ball, wicket, _band(BAT_BALL_CUTS, bb), _band(SR_CUTS, sr)]]
+    if rrr is None:
+        rrro = None
+        fired |= fires[arrays.team[ball, wicket, _band(RATE_CUTS, rate)]]
+    else:
+        rrro = rrr*6
+        fired |= fires[arrays.team[ball, wicket, _band(RRR_CUTS, rrr), _band(RRRO_CUTS, rrro)]]
+
+    for r, (rule, steps) in enumerate(arrays.rules):
+        m = fired[:, r]
+        if not m.any():
+            continue
+        adjust = uniform(rule.lo, rule.hi)
+        if rule.kind == "six":
+            adjust = np.minimum(adjust, den[:, 6])
+            outAvg[m] = np.maximum(outAvg[m] - 0.07, 0)
+        elif rule.kind == "chase":
+            adjust = adjust + (rrro*1.1)/1000
+        elif rule.offset:
+            adjust = adjust + rule.offset
+        for key, coefficient in steps:
+            den[m, key] += adjust[m] * coefficient
+        if rule.kind == "chase":
+            outAvg[m] += (rule.out + ((rrro[m]*1.1)/1000))
+        elif rule.out:
+            outAvg[m] += rule.out
+
+
+def simulate_fixture(team1, team2, n, seed=None, formWindow=DEFAULT_WINDOW, teamsFile='teams/teams.json'):
+    """Play `n` independent matches of team1 v team2 on a dusty pitch."""
+    rng = np.random.default_rng(seed)
+    sides = (load_team(team1, teamsFile), load_team(team2, teamsFile))
+    # indexed by the batting side; the bowlers are the other side's
+    runoutShares = np.stack([runout_share(sides[0], sides[1]), runout_share(sides[1], sides[0])])
+
+    # doToss() sends team1 in first with probability 1/2 whatever the pitch
+    team1BattedFirst = rng.random(n) < 0.5
+    batFirst = np.where(team1BattedFirst, 0, 1)
+    spin = _dusty_spin(rng, n)
+
+    innings1 = _innings(rng, 1, sides, runoutShares, batFirst, spin, None, formWindow)
+    target = innings1["runs"] + 1
+    innings2 = _innings(rng, 2, sides, runoutShares, 1 - batFirst, spin, target, formWindow)
+
+    chased = innings2["runs"] >= target
+    tied = innings2["runs"] == target - 1
+    winner = np.where(chased, 1 - batFirst, np.where(tied, 2, batFirst))
+    return BatchResult(team1, team2, team1BattedFirst, innings1, innings2, winner)
+
+
+def _dusty_spin(rng, n):
+    # pitchInfo() for "dusty"; innings only use the spin factor
+    return 1 + 0.5*(rng.random(n) * (rng.random(n) - rng.random(n))) - _uniform(rng, 0.1, 0.16, n)
+
+
+def _load_state(start, rows, batting, bowling, state):
+    # Overwrite `rows` of a _fresh_start() dict with one mid-innings state
+    # (see win_probability for the format). Batters who have not come in yet
+    # follow in batting-position order.
+    position = {ini: i for i, ini in enumerate(batting.batters)}
+    batted = [position[ini] for ini in state.get("batted", ()) if ini in position]
+    for ini in (state.get("striker"), state.get("nonStriker")):
+        if ini in position and position[ini] not in batted:
+            batted.append(position[ini])
+    order = batted + [p for p in range(len(batting.batters)) if p not in batted]
+    nextBat = len(batted)
+    current = []
+    for ini in (state.get("striker"), state.get("nonStriker")):
+        if ini in position:
+            current.append(position[ini])
+        else:
+            # the new batter after a wicket is not known yet (or the side is all out)
+            current.append(order[min(nextBat, len(order) - 1)])
+            nextBat += 1
+
+    for key in ("runs", "wickets", "balls"):
+        start[key][rows] = state[key]
+    start["striker"][rows], start["nonStriker"][rows] = current
+    start["nextBat"][rows] = nextBat
+    start["order"][rows] = order
+    for ini, value in state.get("batterRuns", {}).items():
+        if ini in position:
+            start["batRuns"][rows, position[ini]] = value
+    for ini, value in state.get("batterBalls", {}).items():
+        if ini in position:
+            start["batBalls"][rows, position[ini]] = value
+
+    bowled = {ini: -(-value // 6) for ini, value in state.get("bowlerBalls", {}).items()}
+    over = min(state["balls"] // 6, 19)
+    current = state.get("bowler")
+    if current in bowling.bowlers:
+        if state["balls"] % 6 == 0:
+            bowled[current] = bowled.get(current, 0) + 1
+        plan = bowling_plan(bowling, start=over + 1, bowled=bowled, last=current)
+        plan[over] = bowling.bowlers.index(current)
+    else:
+        plan = bowling_plan(bowling, start=over, bowled=bowled, last=state.get("lastBowler"))
+    start["plan"][rows] = plan
+
+
+def simulate_states(states, rollouts, seed=None, formWindow=DEFAULT_WINDOW, teamsFile='teams/teams.json'):
+    """Play each mid-match state to the end `rollouts` times, in one pass.
+
+    Every state must be from the same fixture. Rows of the result are
+    state-major: rows i*rollouts to (i+1)*rollouts - 1 continue states[i].
+    innings1 only holds the first-innings total for rows whose state was
+    already in the chase. The pitch is redrawn per row and the recent-form
+    window starts empty.
+    """
+    rng = np.random.default_rng(seed)
+    teams = (states[0]["battingTeam"], states[0]["bowlingTeam"])
+    sides = (load_team(teams[0], teamsFile), load_team(teams[1], teamsFile))
+    runoutShares = np.stack([runout_share(sides[0], sides[1]), runout_share(sides[1], sides[0])])
+
+    batting = []
+    for state in states:
+        if {state["battingTeam"], state["bowlingTeam"]} != set(teams):
+            raise ValueError(f"state for {state['battingTeam']} v {state['bowlingTeam']} "
+                             f"in a batch for {teams[0]} v {teams[1]}")
+        batting.append(teams.index(state["battingTeam"]))
+    batting = np.repeat(batting, rollouts)
+    chasing = np.repeat([state["inningsNo"] == 2 for state in states], rollouts)
+    batFirst = np.where(chasing, 1 - batting, batting)
+    n = len(batFirst)
+    spin = _dusty_spin(rng, n)
+
+    start1 = _fresh_start(sides, batFirst)
+    start2 = _fresh_start(sides, 1 - batFirst)
+    target = np.zeros(n, dtype=np.int64)
+    for i, state in enumerate(states):
+        rows = slice(i * rollouts, (i + 1) * rollouts)
+        side = teams.index(state["battingTeam"])
+        if state["inningsNo"] == 2:
+            _load_state(start2, rows, sides[side], sides[1 - side], state)
+            target[rows] = state["target"]
+        else:
+            _load_state(start1, rows, sides[side], sides[1 - side], state)
+
+    first = ~chasing
+    played = _innings(rng, 1, sides, runoutShares, batFirst[first], spin[first], None, formWindow,
+                      {key: value[first] for key, value in start1.items()})
+    target[first] = played["runs"] + 1
+    innings1 = {key: np.zeros((n,) + value.shape[1:], dtype=value.dtype) for key, value in played.items()}
+    for key, value in played.items():
+        innings1[key][first] = value
+    innings1["runs"][chasing] = target[chasing] - 1
+    innings2 = _innings(rng, 2, sides, runoutShares, 1 - batFirst, spin, target, formWindow, start2)
+
+    chased = innings2["runs"] >= target
+    tied = innings2["runs"] == target - 1
+    winner = np.where(chased, 1 - batFirst, np.where(tied, 2, batFirst))
+    return BatchResult(teams[0], teams[1], batFirst == 0, innings1, innings2, winner)
+
+
+def _ks_test(a, b):
+    # two-sample Kolmogorov-Smirnov statistic with its asymptotic p-value
+    a = np.sort(np.asarray(a))
+    b = np.sort(np.asarray(b))
+    grid = np.concatenate([a, b])
+    cdfA = np.searchsorted(a, grid, side='right') / len(a)
+    cdfB = np.searchsorted(b, grid, side='right') / len(b)
+    d = float(np.max(np.abs(cdfA - cdfB)))
+    ne = len(a) * len(b) / (len(a) + len(b))
+    lam = (math.sqrt(ne) + 0.12 + 0.11 / math.sqrt(ne)) * d
+    p = 2 * sum((-1) ** (j - 1) * math.exp(-2 * j * j * lam * lam) for j in range(1, 101))
+    return d, min(max(p, 0.0), 1.0)
+
+
+def equivalence_check(team1, team2, referenceGames=200, batchGames=20000, seed=None, alpha=0.001):
+    """Compare simulate_fixture() with mainconnect on the same fixture.
+
+    Runs `referenceGames` matches through mainconnect.playMatch and
+    `batchGames` through the batch engine, then applies a two-sample KS test
+    to each innings' runs and wickets and a two-proportion z-test to team1's
+    win rate. `passed` is true when no test rejects at `alpha`. A seed
+    fixes both sides of the comparison.
+    """
+    import mainconnect
+
+    reference = {"innings1Runs": [], "innings2Runs": [], "innings1Wickets": [], "innings2Wickets": [], "team1Wins": 0}
+    for game in range(referenceGames):
+        ctx = mainconnect.MatchContext(output_sinks.NullSink(), rng=seeding.match_rng(seed, team1, team2, "reference", game))
+        result = mainconnect.playMatch(ctx, team1, team2, "dusty")
+        for inn in ("1", "2"):
+            reference[f"innings{inn}Runs"].append(result[f"innings{inn}Runs"])
+            reference[f"innings{inn}Wickets"].append(result[f"innings{inn}Log"][-1]['wickets'])
+        reference["team1Wins"] += result['winner'] == team1
+
+    batch = simulate_fixture(team1, team2, batchGames, seed=seed)
+    report = {}
+    for inn, innings in (("1", batch.innings1), ("2", batch.innings2)):
+        for metric in ("Runs", "Wickets"):
+            key = f"innings{inn}{metric}"
+            d, p = _ks_test(reference[key], innings[metric.lower()])
+            report[key] = {"referenceMean": float(np.mean(reference[key])), "batchMean": float(np.mean(innings[metric.lower()])),
+                           "ks": d, "pValue": p}
+
+    p1 = reference["team1Wins"] / referenceGames
+    p2 = batch.win_rates()[team1]
+    pooled = (reference["team1Wins"] + p2 * batchGames) / (referenceGames + batchGames)
+    se = math.sqrt(max(pooled * (1 - pooled), 1e-12) * (1 / referenceGames + 1 / batchGames))
+    z = (p1 - p2) / se
+    report["team1WinRate"] = {"referenceMean": p1, "batchMean": p2, "z": z,
+                              "pValue": math.erfc(abs(z) / math.sqrt(2))}
+    report["passed"] = all(v["pValue"] > alpha for v in report.values() if isinstance(v, dict))
+    return report
@@ -0,0 +1,35 @@
+class BattingOrder:
+    """Who walks in next: a pointer into the batting order plus the players already in.
+
+    mainconnect's playerDismissed() used to walk the order from the top after
+    every wicket looking for someone who had not faced a ball, which is
+    O(players) per wicket and could send back in a batter who had been run
+    out without facing or the non-striker who had not had the strike yet.
+    Here the pointer only moves forward, skipping anyone already in (a name
+    listed twice), so each call is amortised O(1).
+
+    `key` maps an entry of `order` to something hashable (entries are plain
+    initials in MatchSimulator, dicts in mainconnect).
+    """
+
+    __slots__ = ("order", "used", "_key", "_next")
+
+    def __init__(self, order, key=None):
+        self.order = list(order)
+        self._key = key if key is not None else (lambda entry: entry)
+        self.used = set()
+        self._next = 0
+
+    def next_batter(self):
+        """The next unused entry of the order (now marked used), or None when nobody is left."""
+        while self._next < len(self.order) and self._key(self.order[self._next]) in self.used:
+            self._next += 1
+        if self._next == len(self.order):
+            return None
+        entry = self.order[self._next]
+        self._next += 1
+        self.used.add(self._key(entry))
+        return entry
+
+    def remaining(self):
+        return sum(1 for entry in self.order[self._next:] if self._key(entry) not in self.used)
@@ -0,0 +1,238 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import mainconnect
+import output_sinks
+import season
+from match_simulator import MatchSimulator
+
+# Timings of the project's hot paths, saved as JSON and checked against a
+# stored baseline so a slowdown shows up before it is deployed.
+#
+#   game                      mainconnect.game(): matches/s and balls/s
+#   simulator                 MatchSimulator.simulate_one_ball(): µs per ball
+#   process_batting_innings   app.process_batting_innings() per innings
+#   generate_scorecard        POST /generate_scorecard, played and cached
+#   replay_json               size of a saved replay and time to serialise it
+#   season                    a whole season (season.run_season, one process)
+#
+# Every match is seeded, so a run plays the same matches as the baseline's.
+# `scale` multiplies the number of repetitions (--quick is 0.1).
+#
+#   python benchmarks.py                          run, write bench_results.json, compare
+#   python benchmarks.py --only game simulator --quick
+#   python benchmarks.py --save-baseline          make this run the new baseline
+
+BASELINE = "benchmarks_baseline.json"
+# a metric this much worse than the baseline is a regression
+TOLERANCE = 0.25
+
+FIXTURES = [("csk", "mi"), ("rcb", "kkr"), ("dc", "srh"), ("rr", "pbks")]
+
+
+def metric(value, unit, higherIsBetter):
+    return {"value": round(value, 6), "unit": unit, "higherIsBetter": higherIsBetter}
+
+
+def _count(base, scale):
+    return max(1, int(round(base * scale)))
+
+
+def _matches(n, switch="bench"):
+    # n seeded matches round the fixtures, with no commentary
+    return [mainconnect.game(False, *FIXTURES[i % len(FIXTURES)], switch, seed=i, sink=output_sinks.NullSink())
+            for i in range(n)]
+
+
+_app = None
+
+
+def web_app():
+    # Importing app clears scores/ under the working directory, so that
+    # happens in an empty one. The result cache is swapped for an in-memory
+    # one so the benchmark leaves nothing on disk.
+    global _app
+    if _app is None:
+        here = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                import app
+            finally:
+                os.chdir(here)
+        import result_cache
+        app.RESULT_CACHE = result_cache.ResultCache()
+        _app = app
+    return _app
+
+
+def bench_game(scale):
+    n = _count(40, scale)
+    start = time.perf_counter()
+    results = _matches(n)
+    elapsed = time.perf_counter() - start
+    balls = sum(len(r["innings1Log"]) + len(r["innings2Log"]) for r in results)
+    return {"matchesPerSec": metric(n / elapsed, "matches/s", True),
+            "ballsPerSec": metric(balls / elapsed, "balls/s", True)}
+
+
+def bench_simulator(scale):
+    latencies = []
+    with _quiet():
+        for i in range(_count(10, scale)):
+            sim = MatchSimulator(*FIXTURES[i % len(FIXTURES)], seed=i)
+            sim.perform_toss()
+            while not sim.game_over:
+                start = time.perf_counter()
+                sim.simulate_one_ball()
+                latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {"perBallUs": metric(sum(latencies) / len(latencies) * 1e6, "µs", False),
+            "p95BallUs": metric(latencies[int(len(latencies) * 0.95)] * 1e6, "µs", False)}
+
+
+def bench_process_batting_innings(scale):
+    app = web_app()
+    trackers = [r[key] for r in _matches(8) for key in ("innings1Battracker", "innings2Battracker")]
+    rounds = _count(200, scale)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for tracker in trackers:
+            app.process_batting_innings(tracker)
+    elapsed = time.perf_counter() - start
+    return {"perInningsUs": metric(elapsed / (rounds * len(trackers)) * 1e6, "µs", False)}
+
+
+def bench_generate_scorecard(scale):
+    app = web_app()
+    client = app.app.test_client()
+    n = _count(20, scale)
+
+    def post(i, seed):
+        team1, team2 = FIXTURES[i % len(FIXTURES)]
+        form = {"selectedTeam1": team1, "selectedTeam2": team2, "simulation_type": "direct"}
+        if seed is not None:
+            form["seed"] = str(seed)
+        response = client.post("/generate_scorecard", data=form)
+        assert response.status_code == 200, response.status_code
+
+    with _quiet():
+        start = time.perf_counter()
+        for i in range(n):
+            post(i, None)
+        played = time.perf_counter() - start
+        post(0, 1)
+        start = time.perf_counter()
+        for _ in range(n):
+            post(0, 1)
+        cached = time.perf_counter() - start
+    return {"playedMs": metric(played / n * 1e3, "ms", False),
+            "cachedMs": metric(cached / n * 1e3, "ms", False)}
+
+
+def bench_replay_json(scale):
+    app = web_app()
+    teams = app.load_teams()
+    replays = [app.replay_data(res["innings1BatTeam"], res["innings2BatTeam"], res, teams) for res in _matches(8)]
+    rounds = _count(20, scale)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        sizes = [len(json.dumps(replay)) for replay in replays]
+    elapsed = time.perf_counter() - start
+    return {"bytes": metric(sum(sizes) / len(sizes), "bytes", False),
+            "serializeMs": metric(elapsed / (rounds * len(replays)) * 1e3, "ms", False)}
+
+
+def bench_season(scale):
+    seasons = _count(3, scale)
+    start = time.perf_counter()
+    for seed in range(seasons):
+        season.run_season(seed=seed, workers=1)
+    return {"seasonSec": metric((time.perf_counter() - start) / seasons, "s", False)}
+
+
+BENCHMARKS = {
+    "game": bench_game,
+    "simulator": bench_simulator,
+    "process_batting_innings": bench_process_batting_innings,
+    "generate_scorecard": bench_generate_scorecard,
+    "replay_json": bench_replay_json,
+    "season": bench_season,
+}
+
+
+@contextlib.contextmanager
+def _quiet():
+    # MatchSimulator and app log (up to WARNING for thin player data) on every match
+    logging.disable(logging.WARNING)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def run(names=None, scale=1.0):
+    """Run the named benchmarks (all by default); {"python", "platform", "scale", "benchmarks"}."""
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = BENCHMARKS[name](scale)
+    return {"python": platform.python_version(), "platform": platform.platform(), "scale": scale,
+            "benchmarks": results}
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Metrics in both runs that got worse by more than `tolerance`: [(benchmark, metric, baseline, now)]."""
+    regressions = []
+    for name, metrics in results["benchmarks"].items():
+        for key, now in metrics.items():
+            before = baseline.get("benchmarks", {}).get(name, {}).get(key)
+            if before is None or before["value"] == 0:
+                continue
+            change = now["value"] / before["value"] - 1
+            worse = -change if now["higherIsBetter"] else change
+            if worse > tolerance:
+                regressions.append((name, key, before["value"], now["value"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the hot paths and compare them with a baseline.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="a tenth of the repetitions")
+    parser.add_argument("--out", default="bench_results.json", help="where to write this run")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run to --baseline instead")
+    args = parser.parse_args(argv)
+
+    results = run(args.only, 0.1 if args.quick else 1.0)
+    for name, metrics in results["benchmarks"].items():
+        for key, m in metrics.items():
+            print(f"{name:24} {key:14} {m['value']:>14.3f} {m['unit']}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to make one")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    for name, key, before, now in regressions:
+        print(f"REGRESSION {name} {key}: {before:.3f} -> {now:.3f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
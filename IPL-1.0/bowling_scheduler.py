@@ -0,0 +1,124 @@
+OVERS = 20
+QUOTA = 4
+POWERPLAY_END = 6  # overs 0-5
+DEATH_START = 17  # overs 17-19
+DEATH_SPECIALISTS = 3
+
+# Per phase: overs a bowler keeps his end for, and the runs per ball that
+# take him off early.
+SPELL = {"powerplay": 2, "middle": 3, "death": QUOTA}
+EXPENSIVE = {"powerplay": 1.7, "middle": 1.5, "death": None}
+
+
+def phase(over):
+    if over < POWERPLAY_END:
+        return "powerplay"
+    if over < DEATH_START:
+        return "middle"
+    return "death"
+
+
+class BowlerScheduler:
+    """Picks the bowler of every over of an innings (0-based overs).
+
+    Replaces the powerplay/middle/death pickers of innings1()/innings2(), which
+    retried random picks until one fitted and could spin forever when quotas
+    were tight. Here the preference order for each over is worked out once
+    from the bowlers' overNumbersObject (the three death specialists, by the
+    19th over, go first at the death and last in the middle overs). A pick
+    keeps the bowler at that end on while his spell is short and cheap enough,
+    otherwise takes the most preferred bowler who is under the quota, did not
+    bowl the previous over and still leaves the rest of the innings coverable
+    under both rules, so it never fails and costs O(bowlers^2) per over.
+
+    `bowling` is the attack as player profiles; `bowled` (initials -> overs)
+    and `last` resume from a mid-innings state. Picks are deterministic.
+    """
+
+    def __init__(self, bowling, quota=QUOTA, bowled=None, last=None, overs=OVERS):
+        self.bowlers = [p['playerInitials'] for p in bowling]
+        self.quota = quota
+        self.totalOvers = overs
+        self._index = {ini: b for b, ini in enumerate(self.bowlers)}
+        self.overs = [0] * len(bowling)
+        for ini, count in (bowled or {}).items():
+            if ini in self._index:
+                self.overs[self._index[ini]] = count
+        self.last = self._index.get(last)
+        self.history = {}  # over -> bowler index
+
+        pref = [[p['overNumbersObject'][str(over + 1)] for over in range(overs)] for p in bowling]
+        death = sorted(range(len(bowling)), key=lambda b: bowling[b]['overNumbersObject']['19'], reverse=True)
+        self.death = set(death[:DEATH_SPECIALISTS])
+        self.preference = []
+        for over in range(overs):
+            stage = phase(over)
+            if stage == "death":
+                key = lambda b: (b not in self.death, -pref[b][over])
+            elif stage == "middle":
+                key = lambda b: (b in self.death, -pref[b][over])
+            else:
+                key = lambda b: -pref[b][over]
+            self.preference.append(sorted(range(len(bowling)), key=key))
+
+    def _feasible(self, over, pick):
+        # can overs over+1.. still be shared out with `pick` bowling `over`?
+        # No two in a row lets a bowler take at most ceil(R/2) of R overs,
+        # and `pick`, who cannot open them, at most floor(R/2).
+        remaining = self.totalOvers - over - 1
+        cover = 0
+        for b, used in enumerate(self.overs):
+            left = self.quota - used - (b == pick)
+            cover += min(left, remaining // 2 if b == pick else (remaining + 1) // 2)
+        return cover >= remaining
+
+    def _eligible(self, over, b):
+        return self.overs[b] < self.quota and b != self.last and self._feasible(over, b)
+
+    def _keeps_end(self, over, b, bowlerTracker):
+        stage = phase(over)
+        if phase(over - 2) != stage or self.overs[b] >= SPELL[stage]:
+            return False
+        if EXPENSIVE[stage] is None or bowlerTracker is None:
+            return True
+        tracker = bowlerTracker[self.bowlers[b]]
+        return tracker['balls'] == 0 or tracker['runs'] / tracker['balls'] <= EXPENSIVE[stage]
+
+    def choose(self, over, bowlerTracker=None):
+        """Index of the bowler for `over`, without recording it."""
+        atEnd = self.history.get(over - 2)
+        if atEnd is not None and self._eligible(over, atEnd) and self._keeps_end(over, atEnd, bowlerTracker):
+            return atEnd
+        ranked = self.preference[over]
+        if phase(over) == "middle":
+            # keep a death specialist's last over for the death
+            for b in ranked:
+                if b != atEnd and (b not in self.death or self.overs[b] < self.quota - 1) and self._eligible(over, b):
+                    return b
+        for b in ranked:
+            if b != atEnd and self._eligible(over, b):
+                return b
+        for b in ranked:
+            if self._eligible(over, b):
+                return b
+        # only reachable from a resumed state that already broke the rules
+        return min((b for b in range(len(self.bowlers)) if b != self.last), key=lambda b: self.overs[b])
+
+    def record(self, over, b):
+        self.history[over] = b
+        self.overs[b] += 1
+        self.last = b
+
+    def pick(self, over, bowlerTracker=None):
+        """Initials of the bowler for `over`, recorded as bowling it.
+
+        With the innings' bowlerTracker an expensive bowler is taken off
+        before his spell is up.
+        """
+        b = self.choose(over, bowlerTracker)
+        self.record(over, b)
+        return self.bowlers[b]
+
+    def plan(self, start=0):
+        """Bowler initials for overs start..19 (None before `start`), recorded."""
+        return [None] * start + [self.pick(over) for over in range(start, self.totalOvers)]
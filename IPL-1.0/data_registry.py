@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+
+import accessJSON
+import player_profiles
+import player_store
+import result_cache
+import rosters
+
+# Player and team data picked up while the app runs, instead of on restart.
+# A background thread polls the files' mtimes; when one changes it loads the
+# new players (player_store rebuilds the compiled store), checks teams.json
+# against them, and only then installs the players in accessJSON as one
+# swap. Everything keyed by the data version follows on its own:
+#
+#   accessJSON.version()   player_profiles and MatchSimulator recompile
+#                          profiles, rosters.index() re-resolves the teams
+#   Snapshot.dataHash      result_cache keys (pass it as dataHash)
+#
+# A match takes its profiles once, when it starts, and profiles are
+# read-only, so a match in flight finishes on the data it started with. A
+# reload that fails (a half-written file, say) is logged and the running
+# data stays.
+
+Snapshot = namedtuple("Snapshot", "version players dataHash")
+
+# seconds between looks at the files
+INTERVAL = 2.0
+
+
+class DataRegistry:
+    def __init__(self, playersFile=player_store.SOURCE, storeFile=player_store.STORE,
+                 teamsFile=rosters.TEAMS_FILE, interval=INTERVAL):
+        self.playersFile = playersFile
+        self.storeFile = storeFile
+        self.teamsFile = teamsFile
+        self.interval = interval
+        self._reloadLock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stamps = self.stamps()
+        self.snapshot = Snapshot(accessJSON.version(), accessJSON.data,
+                                 result_cache.data_hash((playersFile, teamsFile)))
+
+    def stamps(self):
+        stamps = []
+        for path in (self.playersFile, self.teamsFile):
+            st = os.stat(path)
+            stamps.append((st.st_mtime_ns, st.st_size))
+        return stamps
+
+    def check(self):
+        """Reload if a file changed since the last look; whether it did."""
+        if self.stamps() == self._stamps:
+            return False
+        self.reload()
+        return True
+
+    def reload(self):
+        """Load both files and swap them in; the new Snapshot."""
+        with self._reloadLock:
+            stamps = self.stamps()
+            dataHash = result_cache.data_hash((self.playersFile, self.teamsFile))
+            playersChanged = stamps[0] != self._stamps[0]
+            players = player_store.load(self.playersFile, self.storeFile) if playersChanged else self.snapshot.players
+            # a teams.json that doesn't parse stops the reload here, before anything is swapped
+            with open(self.teamsFile, encoding='utf-8') as f:
+                roster = rosters.RosterIndex(json.load(f), players)
+            version = accessJSON.install(players) if playersChanged else self.snapshot.version
+            self._stamps = stamps
+            self.snapshot = Snapshot(version, players, dataHash)
+            # rebuilt for the new data (reporting unresolved players), and the
+            # rostered players compiled now rather than in the next request
+            rosters.index(self.teamsFile)
+            if player_profiles.backend is accessJSON:
+                player_profiles.get_profiles([name for names in roster.names.values() for name in names
+                                              if name in players])
+            logging.info(f"Player and team data reloaded (version {version})")
+            return self.snapshot
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logging.exception("Reloading the player and team data failed; keeping the loaded data")
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="data-registry", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
@@ -1,9 +1,8 @@
 import os
-import sys
-import random
+import seeding
 from mainconnect import game
+from season import SeasonTable
 from tabulate import tabulate
-import copy
 
 # Ensure scores directory exists
 dir_path = os.path.join(os.getcwd(), "scores")
@@ -14,18 +13,15 @@ for f in os.listdir(dir_path):
     os.remove(os.path.join(dir_path, f))
 
 teams = ['dc', 'csk', 'rcb', 'mi', 'kkr', 'pbks', 'rr', 'srh']
-points = {}
-battingInfo = {}
-bowlingInfo = {}
-
-# Initialize points table
-for team in teams:
-    points[team] = {
-        "P": 0, "W": 0, "L": 0, "T": 0,
-        "runsScored": 0, "ballsFaced": 0,
-        "runsConceded": 0, "ballsBowled": 0,
-        "pts": 0
-    }
+
+# IPL_SEED=<int> replays a season exactly: every match gets its own stream
+# derived from the seed and its fixture (see seeding.py).
+# `python season.py --seed <int>` plays the same season without the prompts
+# or commentary, with the league matches spread over a process pool.
+SEASON_SEED = int(os.environ["IPL_SEED"]) if os.environ.get("IPL_SEED") else None
+commentary = seeding.match_rng(SEASON_SEED, "commentary")
+# points table and player aggregates, kept by the same rules as season.py
+table = SeasonTable(teams)
 
 battingf = 0
 bowlingf = 0
@@ -89,23 +85,10 @@ commentary_lines = {
     ]
 }
 
-def display_points_table():
-    pointsTabulate = []
-    for team in points:
-        data = points[team]
-        nrr = 0
-        if data['ballsFaced'] > 0 and data['ballsBowled'] > 0:
-            nrr = (data['runsScored'] / data['ballsFaced']) * 6 - (data['runsConceded'] / data['ballsBowled']) * 6
-        row = [team.upper(), data['P'], data['W'], data['L'], data['T'], round(nrr, 2), data['pts']]
-        pointsTabulate.append(row)
-    pointsTabulate = sorted(pointsTabulate, key=lambda x: (x[6], x[5]), reverse=True)
-    print("\nCurrent Points Table:")
-    print(tabulate(pointsTabulate, headers=["Team", "Played", "Won", "Lost", "Tied", "NRR", "Points"], tablefmt="grid"))
-
 def display_top_players():
     battingTabulate = []
-    for b in battingInfo:
-        c = battingInfo[b]
+    for b in table.batting:
+        c = table.batting[b]
         outs = sum(1 for bl in c['ballLog'] if "W" in bl)
         avg = round(c['runs'] / outs, 2) if outs else float('inf')
         sr = round((c['runs'] / c['balls']) * 100, 2) if c['balls'] else 0
@@ -116,8 +99,8 @@ def display_top_players():
     print(tabulate(battingTabulate, headers=["Player", "Runs", "Average", "Strike Rate"], tablefmt="grid"))
 
     bowlingTabulate = []
-    for b in bowlingInfo:
-        c = bowlingInfo[b]
+    for b in table.bowling:
+        c = table.bowling[b]
         economy = round((c['runs'] / c['balls']) * 6, 2) if c['balls'] else float('inf')
         bowlingTabulate.append([b, c['wickets'], economy])
     bowlingTabulate = sorted(bowlingTabulate, key=lambda x: x[1], reverse=True)[:3]
@@ -179,10 +162,10 @@ def display_ball_by_ball(innings_log, innings_num, team_name, runs, balls, wicke
     for event in innings_log:
         outcome = event['event'].split()[-2]  # Extract outcome (e.g., '4', 'W', 'Wide')
         commentary_key = outcome if outcome in commentary_lines else ('wicket' if 'W' in outcome else '0')
-        print(f"Ball {event['balls']}: {event['event']} - {random.choice(commentary_lines[commentary_key])}")
+        print(f"Ball {event['balls']}: {event['event']} - {commentary.choice(commentary_lines[commentary_key])}")
     overs = f"{balls // 6}.{balls % 6}"
     print(f"\nInnings Total: {runs}/{wickets} in {overs} overs")
-    print(random.choice(commentary_lines['innings_end']))
+    print(commentary.choice(commentary_lines['innings_end']))
     
     # Display scorecard after innings
     display_scorecard(bat_tracker, bowl_tracker, team_name, innings_num)
@@ -196,9 +179,9 @@ for i in range(len(teams)):
         try:
             input("Press Enter to start the match...")
             
-            print(random.choice(commentary_lines['start']))
+            print(commentary.choice(commentary_lines['start']))
             
-            resList = game(False, team1, team2)
+            resList = game(False, team1, team2, seed=SEASON_SEED)
 
             # Display ball-by-ball and innings summary for both innings
             for innings, team_key, runs_key, balls_key, bat_tracker_key, bowl_tracker_key in [
@@ -217,7 +200,7 @@ for i in range(len(teams)):
                 )
 
             print(f"\nResult: {resList['winMsg']}")
-            print(random.choice(commentary_lines['end']))
+            print(commentary.choice(commentary_lines['end']))
 
             # Track batting/bowling format win
             if "runs" in resList['winMsg']:
@@ -225,65 +208,10 @@ for i in range(len(teams)):
             else:
                 bowlingf += 1
 
-            # Update batting stats
-            for bat_map in [('innings1Battracker', 'innings1BatTeam'), ('innings2Battracker', 'innings2BatTeam')]:
-                bat_tracker = resList[bat_map[0]]
-                for player in bat_tracker:
-                    if player not in battingInfo:
-                        battingInfo[player] = copy.deepcopy(bat_tracker[player])
-                        battingInfo[player]['innings'] = 1
-                        battingInfo[player]['scoresArray'] = [int(battingInfo[player]['runs'])]
-                    else:
-                        battingInfo[player]['balls'] += bat_tracker[player]['balls']
-                        battingInfo[player]['runs'] += bat_tracker[player]['runs']
-                        battingInfo[player]['ballLog'] += bat_tracker[player]['ballLog']
-                        battingInfo[player]['innings'] += 1
-                        battingInfo[player]['scoresArray'].append(int(bat_tracker[player]['runs']))
-
-            # Update bowling stats
-            for bowl_map in [('innings1Bowltracker',), ('innings2Bowltracker',)]:
-                bowl_tracker = resList[bowl_map[0]]
-                for player in bowl_tracker:
-                    if player not in bowlingInfo:
-                        bowlingInfo[player] = copy.deepcopy(bowl_tracker[player])
-                        bowlingInfo[player]['matches'] = 1
-                    else:
-                        bowlingInfo[player]['balls'] += bowl_tracker[player]['balls']
-                        bowlingInfo[player]['runs'] += bowl_tracker[player]['runs']
-                        bowlingInfo[player]['ballLog'] += bowl_tracker[player]['ballLog']
-                        bowlingInfo[player]['wickets'] += bowl_tracker[player]['wickets']
-                        bowlingInfo[player]['matches'] += 1
-
-            # Points Table Update
-            teamA = resList['innings1BatTeam']
-            teamB = resList['innings2BatTeam']
-            teamARuns, teamABalls = resList['innings1Runs'], resList['innings1Balls']
-            teamBRuns, teamBBalls = resList['innings2Runs'], resList['innings2Balls']
-            winner = resList['winner']
-            loser = team1 if winner == team2 else team2
-
-            for t in [team1, team2]:
-                points[t]['P'] += 1
-
-            if winner == "tie":
-                for t in [team1, team2]:
-                    points[t]['T'] += 1
-                    points[t]['pts'] += 1
-            else:
-                points[winner]['W'] += 1
-                points[loser]['L'] += 1
-                points[winner]['pts'] += 2
-
-            points[teamA]['runsScored'] += teamARuns
-            points[teamB]['runsScored'] += teamBRuns
-            points[teamA]['runsConceded'] += teamBRuns
-            points[teamB]['runsConceded'] += teamARuns
-            points[teamA]['ballsFaced'] += teamABalls
-            points[teamB]['ballsFaced'] += teamBBalls
-            points[teamA]['ballsBowled'] += teamBBalls
-            points[teamB]['ballsBowled'] += teamABalls
-
-            display_points_table()
+            table.add(team1, team2, resList)
+
+            print("\nCurrent Points Table:")
+            print(table.points_card())
             display_top_players()
 
             # Pause after match to keep console open
@@ -295,16 +223,17 @@ for i in range(len(teams)):
             continue
 
 # POINTS TABLE (Final)
-display_points_table()
+print("\nCurrent Points Table:")
+print(table.points_card())
 
 # === PLAYOFFS ===
 def playoffs(team1, team2, matchtag):
     print(f"\n{matchtag.upper()} - {team1.upper()} vs {team2.upper()}")
     try:
         input("Press Enter to start the playoff match...")
-        print(random.choice(commentary_lines['start']))
+        print(commentary.choice(commentary_lines['start']))
         
-        res = game(False, team1.lower(), team2.lower(), matchtag)
+        res = game(False, team1.lower(), team2.lower(), matchtag, seed=SEASON_SEED)
         
         for innings, team_key, runs_key, balls_key, bat_tracker_key, bowl_tracker_key in [
             ('innings1Log', 'innings1BatTeam', 'innings1Runs', 'innings1Balls', 'innings1Battracker', 'innings1Bowltracker'),
@@ -322,39 +251,15 @@ def playoffs(team1, team2, matchtag):
             )
         
         print(f"\nResult: {res['winMsg'].upper()}")
-        print(random.choice(commentary_lines['end']))
+        print(commentary.choice(commentary_lines['end']))
 
         winner = res['winner']
         loser = team1 if winner == team2 else team2
 
-        for bat_map in ['innings1Battracker', 'innings2Battracker']:
-            tracker = res[bat_map]
-            for player in tracker:
-                if player not in battingInfo:
-                    battingInfo[player] = copy.deepcopy(tracker[player])
-                    battingInfo[player]['innings'] = 1
-                    battingInfo[player]['scoresArray'] = [int(tracker[player]['runs'])]
-                else:
-                    battingInfo[player]['balls'] += tracker[player]['balls']
-                    battingInfo[player]['runs'] += tracker[player]['runs']
-                    battingInfo[player]['ballLog'] += tracker[player]['ballLog']
-                    battingInfo[player]['innings'] += 1
-                    battingInfo[player]['scoresArray'].append(int(tracker[player]['runs']))
-
-        for bowl_map in ['innings1Bowltracker', 'innings2Bowltracker']:
-            tracker = res[bowl_map]
-            for player in tracker:
-                if player not in bowlingInfo:
-                    bowlingInfo[player] = copy.deepcopy(tracker[player])
-                    bowlingInfo[player]['matches'] = 1
-                else:
-                    bowlingInfo[player]['balls'] += tracker[player]['balls']
-                    bowlingInfo[player]['runs'] += tracker[player]['runs']
-                    bowlingInfo[player]['ballLog'] += tracker[player]['ballLog']
-                    bowlingInfo[player]['wickets'] += tracker[player]['wickets']
-                    bowlingInfo[player]['matches'] += 1
+        table.add(team1, team2, res, league=False)
 
-        display_points_table()
+        print("\nCurrent Points Table:")
+        print(table.points_card())
         display_top_players()
 
         # Pause after playoff match
@@ -368,13 +273,9 @@ def playoffs(team1, team2, matchtag):
         return team1, team2  # Default to team1 as winner to continue playoffs
 
 # PLAYOFF SEQUENCE
-pointsTabulate = sorted(
-    [[team, points[team]['pts'], (points[team]['runsScored'] / points[team]['ballsFaced']) * 6 - (points[team]['runsConceded'] / points[team]['ballsBowled']) * 6]
-     for team in points],
-    key=lambda x: (x[1], x[2]), reverse=True
-)
-q1 = [pointsTabulate[0][0], pointsTabulate[1][0]]
-elim = [pointsTabulate[2][0], pointsTabulate[3][0]]
+standings = table.standings()
+q1 = [standings[0], standings[1]]
+elim = [standings[2], standings[3]]
 
 finalists = []
 
@@ -390,34 +291,11 @@ finalWinner, _ = playoffs(finalists[0], finalists[1], "Final")
 print(f"\n🏆 {finalWinner.upper()} WINS THE IPL!!!")
 
 # === SAVE FINAL STATS ===
-battingTabulate = []
-for b in battingInfo:
-    c = battingInfo[b]
-    outs = sum(1 for bl in c['ballLog'] if "W" in bl)
-    avg = round(c['runs'] / outs, 2) if outs else "NA"
-    sr = round((c['runs'] / c['balls']) * 100, 2) if c['balls'] else "NA"
-    battingTabulate.append([b, c['innings'], c['runs'], avg, max(c['scoresArray']), sr, c['balls']])
-
-battingTabulate = sorted(battingTabulate, key=lambda x: x[2], reverse=True)
-
-bowlingTabulate = []
-for b in bowlingInfo:
-    c = bowlingInfo[b]
-    overs = f"{c['balls'] // 6}.{c['balls'] % 6}" if c['balls'] else "0"
-    economy = round((c['runs'] / c['balls']) * 6, 2) if c['balls'] else "NA"
-    bowlingTabulate.append([b, c['wickets'], overs, c['runs'], economy])
-
-bowlingTabulate = sorted(bowlingTabulate, key=lambda x: x[1], reverse=True)
-
 with open(os.path.join(dir_path, "batStats.txt"), "w") as f:
-    sys.stdout = f
-    print(tabulate(battingTabulate, headers=["Player", "Innings", "Runs", "Average", "Highest", "SR", "Balls"], tablefmt="grid"))
-    sys.stdout = sys.__stdout__
+    print(table.batting_card(), file=f)
 
 with open(os.path.join(dir_path, "bowlStats.txt"), "w") as f:
-    sys.stdout = f
-    print(tabulate(bowlingTabulate, headers=["Player", "Wickets", "Overs", "Runs Conceded", "Economy"], tablefmt="grid"))
-    sys.stdout = sys.__stdout__
+    print(table.bowling_card(), file=f)
 
 print("bat", battingf, "bowl", bowlingf)
 input("\nPress Enter to exit...")
\ No newline at end of file
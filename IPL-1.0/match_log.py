@@ -0,0 +1,86 @@
+import bisect
+import copy
+
+
+class InningsLog(list):
+    """Ball-by-ball log for one innings of mainconnect.game().
+
+    Each entry is the dict the replay page reads (event, balls, runs, wickets,
+    batsman, batter1, batter2, bowler) plus the change that ball made to the
+    striker's and bowler's trackers:
+
+        "bat":  [runs, balls, [ballLog additions]]
+        "bowl": [runs, balls, wickets, [ballLog additions]]
+
+    Full tracker snapshots are only kept as checkpoints (before the first ball,
+    at the end of every over and when the innings ends), so the log grows
+    linearly with the innings instead of deep-copying every tracker on every
+    ball. trackers_at() rebuilds the state after any ball from the checkpoint
+    before it.
+    """
+
+    def __init__(self, entries=()):
+        super().__init__(entries)
+        self.checkpoints = {}  # index of last ball included -> (batterTracker, bowlerTracker)
+        self._checkpoint_keys = []
+        self._seen = {}  # tracker id -> counters at the last recorded ball
+
+    def checkpoint(self, batterTracker, bowlerTracker):
+        key = len(self) - 1
+        if key in self.checkpoints:
+            return
+        self._checkpoint_keys.append(key)
+        self.checkpoints[key] = (copy.deepcopy(batterTracker), copy.deepcopy(bowlerTracker))
+
+    def record(self, entry, batterTracker, bowlerTracker):
+        bat = batterTracker.get(entry.get('batsman'))
+        if bat is not None:
+            delta = self._delta(('bat', entry['batsman']), bat, ('runs', 'balls'))
+            if delta:
+                entry['bat'] = delta
+        bowl = bowlerTracker.get(entry.get('bowler'))
+        if bowl is not None:
+            delta = self._delta(('bowl', entry['bowler']), bowl, ('runs', 'balls', 'wickets'))
+            if delta:
+                entry['bowl'] = delta
+        self.append(entry)
+
+    def _delta(self, key, tracker, fields):
+        previous = self._seen.get(key)
+        current = [tracker[f] for f in fields] + [len(tracker['ballLog'])]
+        self._seen[key] = current
+        if previous is None:
+            previous = [0] * len(current)
+        if current == previous:
+            return None
+        counts = [c - p for c, p in zip(current[:-1], previous[:-1])]
+        return counts + [tracker['ballLog'][previous[-1]:]]
+
+    def trackers_at(self, index):
+        """Batter and bowler trackers as they were right after ball `index`."""
+        if index < 0:
+            index += len(self)
+        if not self._checkpoint_keys:
+            raise ValueError("InningsLog has no starting checkpoint")
+        pos = bisect.bisect_right(self._checkpoint_keys, index) - 1
+        start = self._checkpoint_keys[max(pos, 0)]
+        batterTracker, bowlerTracker = copy.deepcopy(self.checkpoints[start])
+        for entry in self[start + 1:index + 1]:
+            apply_delta(entry, batterTracker, bowlerTracker)
+        return batterTracker, bowlerTracker
+
+
+def apply_delta(entry, batterTracker, bowlerTracker):
+    if 'bat' in entry:
+        runs, balls, log = entry['bat']
+        tracker = batterTracker[entry['batsman']]
+        tracker['runs'] += runs
+        tracker['balls'] += balls
+        tracker['ballLog'].extend(log)
+    if 'bowl' in entry:
+        runs, balls, wickets, log = entry['bowl']
+        tracker = bowlerTracker[entry['bowler']]
+        tracker['runs'] += runs
+        tracker['balls'] += balls
+        tracker['wickets'] += wickets
+        tracker['ballLog'].extend(log)
@@ -1,15 +1,60 @@
-import random
-import json
-import accessJSON
+import ball_events
 import copy
 import logging
+import player_profiles
+import rosters
+import sampling
+import seeding
+from batting_order import BattingOrder
+from pair_matrix import PairMatrix
+from player_profiles import freeze
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# initial -> frozen output of _preprocess_player_stats. Profiles only depend on
+# the loaded player data, so they are built once per process and shared by
+# every MatchSimulator instead of being re-derived for each match. The data
+# comes from player_profiles.backend, the same source as mainconnect's.
+_compiled_profiles = {}
+_compiled_version = None
+
+
+def _current_profiles():
+    # dropped when the player data is reloaded (data_registry.py) or the backend changes
+    global _compiled_profiles, _compiled_version
+    version = (player_profiles.backend, player_profiles.backend.version())
+    if version != _compiled_version:
+        _compiled_profiles, _compiled_version = {}, version
+    return _compiled_profiles
+
+
+def _fetch_players(names):
+    # the compiled profiles, and the raw players of `names` not compiled yet
+    # in one backend call, both of the same data version
+    while True:
+        profiles = _current_profiles()
+        missing = [name for name in dict.fromkeys(names) if name not in profiles]
+        raws = player_profiles.backend.getPlayers(missing) if missing else {}
+        if _current_profiles() is profiles:
+            return profiles, raws
+
+
 class MatchSimulator:
-    def __init__(self, team1_code, team2_code, pitch_factors=None, saved_state=None):
+    def __init__(self, team1_code, team2_code, pitch_factors=None, saved_state=None, rng=None, seed=None, timer=None):
         self.team1_code = team1_code.lower()
         self.team2_code = team2_code.lower()
+        # All of this match's random draws; an explicit rng wins, else a stream derived from seed
+        # and the fixture (seeding.py), else the shared random module.
+        self.rng = rng if rng is not None else seeding.match_rng(seed, self.team1_code, self.team2_code)
+        # With a phase_timer.PhaseTimer the stages of a ball are wrapped to time themselves;
+        # without one they are the plain methods.
+        self.timer = timer
+        self._draw = sampling.draw
+        if timer is not None:
+            for stage, name in (("ball", "_play_ball"), ("selectBowler", "_select_next_bowler"),
+                                ("probabilities", "_calculate_dynamic_probabilities"), ("gameState", "get_game_state")):
+                setattr(self, name, timer.wrap(stage, getattr(self, name)))
+            self._draw = timer.wrap("draw", sampling.draw)
 
         if pitch_factors:
             self.pace_factor = pitch_factors.get('pace', 1.0)
@@ -20,25 +65,27 @@ class MatchSimulator:
             self.spin_factor = 1.0
             self.outfield_factor = 1.0
 
-        self.all_teams_data = {}
+        # teams.json resolved once per process and shared (rosters.py)
         try:
-            with open('teams/teams.json', 'r', encoding='utf-8') as f:
-                self.all_teams_data = json.load(f)
+            self.roster = rosters.index()
         except FileNotFoundError:
             logging.error(f"CRITICAL ERROR: teams/teams.json not found.")
             raise
+        self.all_teams_data = self.roster.teams
 
         self.team1_raw_data = self.all_teams_data.get(self.team1_code, {})
         self.team2_raw_data = self.all_teams_data.get(self.team2_code, {})
 
-        team1_player_initials_list = self.team1_raw_data.get('players', [])
-        team2_player_initials_list = self.team2_raw_data.get('players', [])
+        team1_player_initials_list = self.roster.names.get(self.team1_code, [])
+        team2_player_initials_list = self.roster.names.get(self.team2_code, [])
 
         if not team1_player_initials_list: raise ValueError(f"Player list for {self.team1_code} is empty/missing.")
         if not team2_player_initials_list: raise ValueError(f"Player list for {self.team2_code} is empty/missing.")
 
         self._initialize_fresh_game_state()
 
+        compiled_profiles, raw_players = _fetch_players(
+            [str(initial).strip() for initial in team1_player_initials_list + team2_player_initials_list])
         self.team1_players_stats = {}
         self.team2_players_stats = {}
 
@@ -47,30 +94,39 @@ class MatchSimulator:
             if not processed_initial_str:
                 logging.warning(f"Skipping empty player initial for team {self.team1_code}.")
                 continue
-            raw_stats = None
-            try:
-                raw_stats = accessJSON.getPlayerInfo(processed_initial_str)
-            except KeyError:
-                logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team1_code}. Using placeholder.")
-            except Exception as e:
-                logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team1_code}): {e}. Using placeholder.")
-            self.team1_players_stats[processed_initial_str] = self._preprocess_player_stats(processed_initial_str, raw_stats)
+            profile = compiled_profiles.get(processed_initial_str)
+            if profile is None:
+                raw_stats = None
+                try:
+                    raw_stats = raw_players[processed_initial_str]
+                except KeyError:
+                    logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team1_code}. Using placeholder.")
+                except Exception as e:
+                    logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team1_code}): {e}. Using placeholder.")
+                profile = freeze(self._preprocess_player_stats(processed_initial_str, raw_stats))
+                if raw_stats is not None: compiled_profiles[processed_initial_str] = profile
+            self.team1_players_stats[processed_initial_str] = profile
 
         for initial in team2_player_initials_list:
             processed_initial_str = str(initial).strip()
             if not processed_initial_str:
                 logging.warning(f"Skipping empty player initial for team {self.team2_code}.")
                 continue
-            raw_stats = None
-            try:
-                raw_stats = accessJSON.getPlayerInfo(processed_initial_str)
-            except KeyError:
-                logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team2_code}. Using placeholder.")
-            except Exception as e:
-                logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team2_code}): {e}. Using placeholder.")
-            self.team2_players_stats[processed_initial_str] = self._preprocess_player_stats(processed_initial_str, raw_stats)
+            profile = compiled_profiles.get(processed_initial_str)
+            if profile is None:
+                raw_stats = None
+                try:
+                    raw_stats = raw_players[processed_initial_str]
+                except KeyError:
+                    logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team2_code}. Using placeholder.")
+                except Exception as e:
+                    logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team2_code}): {e}. Using placeholder.")
+                profile = freeze(self._preprocess_player_stats(processed_initial_str, raw_stats))
+                if raw_stats is not None: compiled_profiles[processed_initial_str] = profile
+            self.team2_players_stats[processed_initial_str] = profile
 
         self._initialize_batting_order_and_bowlers()
+        self._build_pair_matrices()
 
         if saved_state and saved_state.get('toss_winner'):
             self.load_from_saved_state(saved_state)
@@ -90,7 +146,8 @@ class MatchSimulator:
             self.team1_code: {'powerplay': [], 'middle': [], 'death': []},
             self.team2_code: {'powerplay': [], 'middle': [], 'death': []}
         }
-        self.next_batsman_index = {self.team1_code: 0, self.team2_code: 0}
+        # who comes in next for each side (batting_order.py), reset per innings
+        self.lineups = {self.team1_code: BattingOrder([]), self.team2_code: BattingOrder([])}
 
     def _create_placeholder_player_stats(self, initial_str):
         return {
@@ -176,7 +233,7 @@ class MatchSimulator:
 
     def _initialize_batting_order_and_bowlers(self):
         for team_code_iter, player_stats_pool in [(self.team1_code, self.team1_players_stats), (self.team2_code, self.team2_players_stats)]:
-            ordered_initials = self.all_teams_data.get(team_code_iter, {}).get('players', [])
+            ordered_initials = self.roster.names.get(team_code_iter, [])
             self.batting_order[team_code_iter] = [p_initial for p_initial in ordered_initials if p_initial in player_stats_pool and player_stats_pool[p_initial]]
             if not self.batting_order[team_code_iter] and player_stats_pool:
                 self.batting_order[team_code_iter] = [p_initial for p_initial in player_stats_pool.keys() if player_stats_pool[p_initial]]
@@ -208,7 +265,7 @@ class MatchSimulator:
         self.innings[innings_num]['bowling_team_code'] = current_bowling_team
         self.innings[innings_num]['batting_tracker'] = { initial_key: {'runs': 0, 'balls': 0, 'fours': 0, 'sixes': 0, 'how_out': 'Did Not Bat', 'order': i + 1} for i, initial_key in enumerate(self.batting_order[current_batting_team])}
         self.innings[innings_num]['bowling_tracker'] = { initial_key: {'overs_str': "0.0", 'balls_bowled': 0, 'runs_conceded': 0, 'wickets': 0, 'maidens': 0, 'economy': 0.0, 'dots':0} for initial_key in self.bowlers_list[current_bowling_team]}
-        self.next_batsman_index[current_batting_team] = 0
+        self.lineups[current_batting_team] = BattingOrder(self.batting_order[current_batting_team])
         self.current_batsmen['on_strike'] = self._get_next_batsman(current_batting_team, use_index_from_state=True)
         if self.current_batsmen['on_strike']: self.innings[innings_num]['batting_tracker'].setdefault(self.current_batsmen['on_strike'], self._create_placeholder_player_stats(self.current_batsmen['on_strike']))['how_out'] = "Not out"
         self.current_batsmen['non_strike'] = self._get_next_batsman(current_batting_team, use_index_from_state=True)
@@ -217,15 +274,13 @@ class MatchSimulator:
         self.current_bowler = self._select_next_bowler()
 
     def _get_next_batsman(self, team_code, use_index_from_state=True):
-        order = self.batting_order[team_code]; current_idx = self.next_batsman_index[team_code] if use_index_from_state else 0
-        if current_idx < len(order):
-            batsman_initial = order[current_idx]
-            if use_index_from_state: self.next_batsman_index[team_code] += 1
-            return batsman_initial
-        return None
+        if not use_index_from_state:
+            order = self.batting_order[team_code]
+            return order[0] if order else None
+        return self.lineups[team_code].next_batter()
 
     def perform_toss(self):
-        self.toss_winner = random.choice([self.team1_code, self.team2_code]); self.toss_decision = random.choice(['bat', 'field'])
+        self.toss_winner = self.rng.choice([self.team1_code, self.team2_code]); self.toss_decision = self.rng.choice(['bat', 'field'])
         if self.toss_decision == 'bat': self.batting_team_code = self.toss_winner; self.bowling_team_code = self.team1_code if self.toss_winner == self.team2_code else self.team2_code
         else: self.bowling_team_code = self.toss_winner; self.batting_team_code = self.team1_code if self.toss_winner == self.team2_code else self.team2_code
         self.toss_message = f"{self.toss_winner.upper()} won the toss and chose to {self.toss_decision}."
@@ -233,11 +288,22 @@ class MatchSimulator:
         self._setup_innings(1)
         return self.toss_message, self.toss_winner.upper(), self.toss_decision
 
-    def _calculate_dynamic_probabilities(self, batsman_obj, bowler_obj, inn_data, bt_current_ball_stats):
-        # ... (Copy of the existing _calculate_dynamic_probabilities method from the read_files output)
+    def _build_pair_matrices(self):
+        # base outcome of every batter of each side against the other side's bowlers;
+        # the pitch factors are fixed for the match, so this is done once (pair_matrix.py)
+        self.pair_matrices = {}
+        for batting_code, batting_pool, bowling_code, bowling_pool in [
+                (self.team1_code, self.team1_players_stats, self.team2_code, self.team2_players_stats),
+                (self.team2_code, self.team2_players_stats, self.team1_code, self.team1_players_stats)]:
+            batters = {p_init: batting_pool[p_init] for p_init in self.batting_order[batting_code]}
+            bowlers = {p_init: bowling_pool[p_init] for p_init in self.bowlers_list[bowling_code] if p_init in bowling_pool}
+            self.pair_matrices[batting_code] = PairMatrix(batters, bowlers, self._base_probabilities)
+
+    def _base_probabilities(self, batsman_obj, bowler_obj):
+        # the part of _calculate_dynamic_probabilities that only depends on the pair and the pitch
         denAvg = {str(r): (batsman_obj['batRunDenominationsObject'].get(str(r),0) + bowler_obj['bowlRunDenominationsObject'].get(str(r),0))/2 for r in range(7)}
         outAvg = (batsman_obj['batOutsRate'] + bowler_obj['bowlOutsRate']) / 2
-        outTypeAvg = copy.deepcopy(bowler_obj['bowlOutTypesObject'])
+        outTypeAvg = dict(bowler_obj['bowlOutTypesObject'])
         runout_chance_batsman = batsman_obj.get('runnedOut',0) / (batsman_obj.get('batBallsTotal',1) if batsman_obj.get('batBallsTotal',0) > 0 else 1)
         outTypeAvg['runOut'] = outTypeAvg.get('runOut', 0.005) + runout_chance_batsman / 2
         wideRate = bowler_obj['bowlWideRate']; noballRate = bowler_obj['bowlNoballRate']
@@ -253,39 +319,48 @@ class MatchSimulator:
             for r in ['4','6']: denAvg[r] = max(0.001, denAvg.get(r,0.001) * (1 - effect*2))
             denAvg['0'] = denAvg.get('0',0) + (effect*0.1); denAvg['1'] = denAvg.get('1',0) + (effect*0.05)
         for r in ['4','6']: denAvg[r] = denAvg.get(r,0) / self.outfield_factor
+        current_out_type_sum = sum(v for v in outTypeAvg.values() if isinstance(v, (int,float)) and v > 0)
+        if current_out_type_sum > 0: outTypeAvg = {k: max(0, v/current_out_type_sum) for k,v in outTypeAvg.items()}
+        else: outTypeAvg = {"bowled": 1.0}; logging.warning(f"outTypeAvg sum zero for {batsman_obj['playerInitials']} vs {bowler_obj['playerInitials']}. Using fallback 'bowled'.")
+        return denAvg, outAvg, outTypeAvg, max(0, wideRate), max(0, noballRate)
+
+    def _calculate_dynamic_probabilities(self, base, inn_data, bt_current_ball_stats):
+        # base: _base_probabilities() of the pair; only the run weights are copied, the rest is not changed here
+        baseDen, outAvg, outTypeAvg, wideRate, noballRate = base
+        denAvg = dict(baseDen)
         balls_faced_batsman = bt_current_ball_stats['balls']; innings_balls_total = inn_data['legal_balls_bowled']
         innings_runs_total = inn_data['score']; innings_wickets_total = inn_data['wickets']
         if balls_faced_batsman < 8 and innings_balls_total < 80:
-            adjust = random.uniform(-0.01, 0.03) * (1 if self.current_innings_num == 1 else 0.8)
+            adjust = self.rng.uniform(-0.01, 0.03) * (1 if self.current_innings_num == 1 else 0.8)
             outAvg = max(0.01, outAvg - 0.015)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adjust * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) + adjust * 0.33)
             denAvg['2'] = max(0.001, denAvg.get('2',0) + adjust * 0.17); denAvg['4'] = max(0.001, denAvg.get('4',0) - adjust * 0.17)
             denAvg['6'] = max(0.001, denAvg.get('6',0) - adjust * 0.5)
         if balls_faced_batsman > 15 and balls_faced_batsman < 30:
-            adjust = random.uniform(0.03, 0.07)
+            adjust = self.rng.uniform(0.03, 0.07)
             denAvg['0'] = max(0.001, denAvg.get('0',0) - adjust * 0.33); denAvg['4'] = max(0.001, denAvg.get('4',0) + adjust * 0.33)
         if balls_faced_batsman > 20 and (bt_current_ball_stats['runs'] / balls_faced_batsman if balls_faced_batsman > 0 else 0) < 1.1:
-            adjust = random.uniform(0.05, 0.08)
+            adjust = self.rng.uniform(0.05, 0.08)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adjust * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) + adjust * 0.17)
             denAvg['6'] = max(0.001, denAvg.get('6',0) - adjust * 0.67); outAvg = min(0.95, outAvg + 0.05)
         if innings_balls_total < 36:
             outAvg = max(0.01, outAvg - (0.07 if innings_wickets_total == 0 else 0.03))
-            adj = random.uniform(0.05, 0.11) if innings_wickets_total < 2 else random.uniform(0.02, 0.08)
+            adj = self.rng.uniform(0.05, 0.11) if innings_wickets_total < 2 else self.rng.uniform(0.02, 0.08)
             denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.67); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj * 0.33)
             denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * (0.67 if innings_wickets_total < 2 else 0.83))
             denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * (0.33 if innings_wickets_total < 2 else 0.17))
         elif innings_balls_total >= 102:
-            adj = random.uniform(0.07, 0.1) if innings_wickets_total < 7 else random.uniform(0.07,0.09)
+            adj = self.rng.uniform(0.07, 0.1) if innings_wickets_total < 7 else self.rng.uniform(0.07,0.09)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adj * (0.13 if innings_wickets_total < 7 else -0.13))
             denAvg['1'] = max(0.001, denAvg.get('1',0) - adj * 0.33); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.48)
             denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.62); outAvg = min(0.95, outAvg + (0.015 if innings_wickets_total < 7 else 0.025))
         elif innings_balls_total >= 36 and innings_balls_total < 102:
             if innings_wickets_total < 3:
-                adj = random.uniform(0.05, 0.11)
+                adj = self.rng.uniform(0.05, 0.11)
                 denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.33)
                 denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.5); denAvg['6'] = max(0.001, denAvg.get('6',0) + adj*0.33)
             else:
-                adj = random.uniform(0.02, 0.07)
+                adj = self.rng.uniform(0.02, 0.07)
                 denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.53); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.4)
                 denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.7); denAvg['6'] = max(0.001, denAvg.get('6',0) + adj*0.3)
                 outAvg = max(0.01, outAvg - 0.03)
@@ -294,25 +369,22 @@ class MatchSimulator:
             if runs_needed > 0 :
                 rrr = (runs_needed / balls_remaining) * 6 if balls_remaining > 0 else float('inf')
                 if rrr < 8:
-                    adj = random.uniform(0.05, 0.09) * (1 - (rrr/10)*0.5)
+                    adj = self.rng.uniform(0.05, 0.09) * (1 - (rrr/10)*0.5)
                     denAvg['6'] = max(0.001, denAvg.get('6',0) - adj * 0.67); denAvg['4'] = max(0.001, denAvg.get('4',0) - adj*0.33)
                     denAvg['1'] = max(0.001, denAvg.get('1',0) + adj); outAvg = max(0.01, outAvg - 0.04)
                 elif rrr <= 10.4:
-                    adj = random.uniform(0.04, 0.08)
+                    adj = self.rng.uniform(0.04, 0.08)
                     denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.2); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj*0.33)
                     outAvg = min(0.95, outAvg - 0.01)
                 elif rrr > 10.4:
-                    adj = random.uniform(0.04,0.08) + (rrr*1.1)/1000
+                    adj = self.rng.uniform(0.04,0.08) + (rrr*1.1)/1000
                     denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.5); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj*0.33)
                     denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.17); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.67)
                     outAvg = min(0.95, outAvg + (0.02 + (rrr*1.1)/1000))
         current_sum = sum(d for d in denAvg.values() if isinstance(d, (int, float)) and d >= 0)
         if current_sum > 0 : denAvg = {k: max(0, v/current_sum) for k,v in denAvg.items()}
-        else: denAvg = {"0":0.5, "1":0.5}; logging.warning(f"denAvg sum zero for {batsman_obj['playerInitials']} vs {bowler_obj['playerInitials']}. Using fallback.")
-        current_out_type_sum = sum(v for v in outTypeAvg.values() if isinstance(v, (int,float)) and v > 0)
-        if current_out_type_sum > 0: outTypeAvg = {k: max(0, v/current_out_type_sum) for k,v in outTypeAvg.items()}
-        else: outTypeAvg = {"bowled": 1.0}; logging.warning(f"outTypeAvg sum zero for {batsman_obj['playerInitials']} vs {bowler_obj['playerInitials']}. Using fallback 'bowled'.")
-        return denAvg, max(0.01, min(outAvg, 0.95)), outTypeAvg, max(0, wideRate), max(0, noballRate)
+        else: denAvg = {"0":0.5, "1":0.5}; logging.warning(f"denAvg sum zero for {self.current_batsmen['on_strike']} vs {self.current_bowler}. Using fallback.")
+        return denAvg, max(0.01, min(outAvg, 0.95)), outTypeAvg, wideRate, noballRate
 
     def _select_next_bowler(self):
         current_over_to_be_bowled = self.innings[self.current_innings_num]['overs_completed']
@@ -332,49 +404,69 @@ class MatchSimulator:
             score += tracker_stats['balls_bowled'] * 0.1
             eligible_bowlers.append({'initial': initial, 'score': score})
         if not eligible_bowlers:
-            eligible_bowlers = [{'initial': b, 'score': random.random() + (100 if b == self.last_over_bowler_initial else 0) }
+            eligible_bowlers = [{'initial': b, 'score': self.rng.random() + (100 if b == self.last_over_bowler_initial else 0) }
                                 for b in self.bowlers_list[self.bowling_team_code]
                                 if bowler_tracker_this_innings.get(b,{}).get('balls_bowled',0) < 24]
         if not eligible_bowlers:
-             if self.bowlers_list[self.bowling_team_code]: return random.choice(self.bowlers_list[self.bowling_team_code])
+             if self.bowlers_list[self.bowling_team_code]: return self.rng.choice(self.bowlers_list[self.bowling_team_code])
              return self.last_over_bowler_initial
         eligible_bowlers.sort(key=lambda x: x['score'])
         return eligible_bowlers[0]['initial']
 
     def simulate_one_ball(self):
-        if self.game_over: return {"summary": self.get_game_state(), "ball_event": {"commentary": f"Game is over. {self.win_message}"}}
+        return {"summary": self.get_game_state(), "ball_event": self._play_ball()}
+
+    def stream(self):
+        """Play the rest of the match, yielding ball_events (Ball, InningsEnd, MatchEnd) as they happen.
+
+        Tosses first if that has not been done. The same draws as calling
+        simulate_one_ball() until game_over, without a game state per ball.
+        """
+        if not self.toss_winner: self.perform_toss()
+        while not self.game_over:
+            innings_num = self.current_innings_num
+            ball_event = self._play_ball()
+            if 'ball_number' in ball_event: yield ball_events.from_simulator_entry(innings_num, ball_event)
+            if self.game_over or self.current_innings_num != innings_num:
+                inn_data = self.innings[innings_num]
+                yield ball_events.InningsEnd(innings_num, inn_data['batting_team_code'], inn_data['score'], inn_data['wickets'], inn_data['legal_balls_bowled'])
+        winner = "tie" if self.match_winner == "Tie" else self.match_winner
+        yield ball_events.MatchEnd(winner, self.win_message, self.get_game_state())
+
+    def _play_ball(self):
+        # one delivery; its ball log entry, or just a commentary line when no ball could be bowled
+        if self.game_over: return {"commentary": f"Game is over. {self.win_message}"}
         inn_data = self.innings[self.current_innings_num]; batsman_initial = self.current_batsmen['on_strike']; non_striker_initial = self.current_batsmen['non_strike']; bowler_initial = self.current_bowler
-        if not batsman_initial: self._end_innings(); return {"summary": self.get_game_state(), "ball_event": {"commentary": "Innings ended: No batsman available."}}
+        if not batsman_initial: self._end_innings(); return {"commentary": "Innings ended: No batsman available."}
         if not bowler_initial:
             self.current_bowler = self._select_next_bowler(); bowler_initial = self.current_bowler
-            if not bowler_initial: self._end_innings(); return {"summary": self.get_game_state(), "ball_event": {"commentary": "Innings ended: No bowler available for " + self.bowling_team_code}}
+            if not bowler_initial: self._end_innings(); return {"commentary": "Innings ended: No bowler available for " + self.bowling_team_code}
         batsman_obj = self.team1_players_stats.get(batsman_initial) if self.batting_team_code == self.team1_code else self.team2_players_stats.get(batsman_initial)
         bowler_obj = self.team1_players_stats.get(bowler_initial) if self.bowling_team_code == self.team1_code else self.team2_players_stats.get(bowler_initial)
         if not batsman_obj: batsman_obj = self._create_placeholder_player_stats(batsman_initial)
         if not bowler_obj: bowler_obj = self._create_placeholder_player_stats(bowler_initial)
         batsman_tracker = inn_data['batting_tracker'].setdefault(batsman_initial, self._create_placeholder_player_stats(batsman_initial))
         bowler_tracker = inn_data['bowling_tracker'].setdefault(bowler_initial, {'overs_str': "0.0", 'balls_bowled': 0, 'runs_conceded': 0, 'wickets': 0, 'maidens': 0, 'economy': 0.0, 'dots':0})
-        denAvg, outAvg, outTypeAvg, wideRate, noballRate = self._calculate_dynamic_probabilities(batsman_obj, bowler_obj, inn_data, batsman_tracker)
+        base = self.pair_matrices[self.batting_team_code].get(batsman_initial, bowler_initial)
+        if base is None: base = self._base_probabilities(batsman_obj, bowler_obj)
+        denAvg, outAvg, outTypeAvg, wideRate, noballRate = self._calculate_dynamic_probabilities(base, inn_data, batsman_tracker)
         runs_this_ball = 0; is_wicket_this_ball = False; extra_type_this_ball = None; extra_runs_this_ball = 0; is_legal_delivery = True; commentary_this_ball = ""; wicket_details = {}
-        if random.uniform(0,1) < wideRate:
+        if self.rng.uniform(0,1) < wideRate:
             is_legal_delivery = False; extra_type_this_ball = 'Wide'; extra_runs_this_ball = 1
             inn_data['score'] += 1; bowler_tracker['runs_conceded'] += 1; commentary_this_ball = "Wide."
         else:
-            if random.uniform(0,1) < outAvg :
+            if self.rng.uniform(0,1) < outAvg :
                 is_wicket_this_ball = True; inn_data['wickets'] += 1; wicket_type_chosen = "Bowled"
                 out_type_total_prob = sum(v for v in outTypeAvg.values() if isinstance(v, (int,float)) and v > 0)
                 if out_type_total_prob > 0:
-                    out_type_rand = random.uniform(0, out_type_total_prob); current_prob_sum = 0
-                    for w_type, w_prob in outTypeAvg.items():
-                        current_prob_sum += w_prob
-                        if out_type_rand <= current_prob_sum: wicket_type_chosen = w_type; break
+                    wicket_type_chosen = self._draw(outTypeAvg, out_type_total_prob, self.rng) or wicket_type_chosen
                 wicket_details = {'type': wicket_type_chosen, 'bowler': bowler_initial, 'bowler_credit': True}
                 batsman_tracker['how_out'] = wicket_type_chosen.capitalize(); batsman_tracker['bowler'] = bowler_initial
                 bowler_tracker['wickets'] += 1; commentary_this_ball = f"{batsman_initial} is {wicket_type_chosen} by {bowler_initial}!"
                 if wicket_type_chosen.lower() == 'caught':
                     fielding_team_pool = self.team1_players_stats if self.bowling_team_code == self.team1_code else self.team2_players_stats
                     possible_catchers_initials = [p_init for p_init in fielding_team_pool.keys() if p_init != bowler_initial]
-                    catcher_initial = random.choice(possible_catchers_initials) if possible_catchers_initials else bowler_initial
+                    catcher_initial = self.rng.choice(possible_catchers_initials) if possible_catchers_initials else bowler_initial
                     batsman_tracker['fielder'] = catcher_initial; wicket_details['fielder'] = catcher_initial
                     commentary_this_ball = f"{batsman_initial} c {catcher_initial} b {bowler_initial} OUT!"
                 elif wicket_type_chosen.lower() == 'runout': wicket_details['bowler_credit'] = False
@@ -384,10 +476,8 @@ class MatchSimulator:
                 total_run_prob = sum(v for v in denAvg.values() if isinstance(v, (int,float)) and v > 0)
                 runs_this_ball = 0
                 if total_run_prob > 0 :
-                    run_rand = random.uniform(0, total_run_prob); current_prob_sum = 0
-                    for run_val_str, run_prob in denAvg.items():
-                        current_prob_sum += run_prob
-                        if run_rand <= current_prob_sum: runs_this_ball = int(run_val_str); break
+                    run_val_str = self._draw(denAvg, total_run_prob, self.rng)
+                    if run_val_str is not None: runs_this_ball = int(run_val_str)
                 inn_data['score'] += runs_this_ball; batsman_tracker['runs'] += runs_this_ball
                 if runs_this_ball == 4: batsman_tracker['fours'] = batsman_tracker.get('fours',0) + 1
                 if runs_this_ball == 6: batsman_tracker['sixes'] = batsman_tracker.get('sixes',0) + 1
@@ -415,7 +505,7 @@ class MatchSimulator:
             inn_data['overs_completed'] += 1; self.last_over_bowler_initial = self.current_bowler
             self.current_batsmen['on_strike'], self.current_batsmen['non_strike'] = self.current_batsmen['non_strike'], self.current_batsmen['on_strike']
             self.current_bowler = self._select_next_bowler()
-        return {"summary": self.get_game_state(), "ball_event": ball_log_entry}
+        return ball_log_entry
 
     def _end_innings(self):
         inn_data = self.innings[self.current_innings_num]
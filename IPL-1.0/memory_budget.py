@@ -0,0 +1,160 @@
+import argparse
+import gc
+import json
+import logging
+import sys
+import tracemalloc
+
+import mainconnect
+import output_sinks
+import season
+from benchmarks import FIXTURES, web_app
+from match_simulator import MatchSimulator
+
+# Memory used by the paths that hold whole matches, measured with
+# tracemalloc and checked against a stored budget:
+#
+#   game        one mainconnect.game() and its result (logs, trackers)
+#   simulator   one MatchSimulator played to the end
+#   replay      one saved ball-by-ball replay loaded back from JSON
+#   season      one headless season (season.run_season, one process)
+#
+# "peak" is the most allocated at once while the path ran and "retained"
+# what is still held by its result afterwards, both over what was allocated
+# before it started. Each path runs once untraced first, so caches filled on
+# first use (player profiles, pair data) don't count. Every match is seeded,
+# so the numbers only move when the code does.
+#
+#   python memory_budget.py                 measure and compare with memory_budget.json
+#   python memory_budget.py --save-budget   budget = this run plus HEADROOM
+
+BUDGET = "memory_budget.json"
+# a saved budget allows this much over the measured run
+HEADROOM = 0.2
+
+
+def measure(fn):
+    """(peak bytes, retained bytes, result) of fn() under tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before, current - before, result
+
+
+def _balls(res):
+    return len(res["innings1Log"]) + len(res["innings2Log"])
+
+
+def _report(peak, retained, balls, matches=1):
+    return {"peak": peak, "retained": retained, "retainedPerBall": retained // balls,
+            "retainedPerMatch": retained // matches}
+
+
+def case_game():
+    def play():
+        return mainconnect.game(False, *FIXTURES[0], "memory", seed=1, sink=output_sinks.NullSink())
+
+    play()
+    peak, retained, res = measure(play)
+    return _report(peak, retained, _balls(res))
+
+
+def case_simulator():
+    def play():
+        sim = MatchSimulator(*FIXTURES[0], seed=1)
+        sim.perform_toss()
+        while not sim.game_over:
+            sim.simulate_one_ball()
+        return sim
+
+    logging.disable(logging.WARNING)
+    try:
+        play()
+        peak, retained, sim = measure(play)
+    finally:
+        logging.disable(logging.NOTSET)
+    return _report(peak, retained, len(sim.innings[1]['log']) + len(sim.innings[2]['log']))
+
+
+def case_replay():
+    app = web_app()
+    res = mainconnect.game(False, *FIXTURES[0], "memory", seed=1, sink=output_sinks.NullSink())
+    saved = json.dumps(app.replay_data(*FIXTURES[0], res, app.load_teams()))
+    json.loads(saved)
+    peak, retained, _ = measure(lambda: json.loads(saved))
+    report = _report(peak, retained, _balls(res))
+    report["fileBytes"] = len(saved)
+    return report
+
+
+def case_season():
+    def play():
+        return season.run_season(seed=1, workers=1)
+
+    play()
+    peak, retained, played = measure(play)
+    matches = len(played["league"]) + len(played["playoffs"])
+    balls = sum(r["innings1Balls"] + r["innings2Balls"] for _, r in played["league"])
+    balls += sum(r["innings1Balls"] + r["innings2Balls"] for _, _, _, r in played["playoffs"])
+    return _report(peak, retained, balls, matches)
+
+
+CASES = {
+    "game": case_game,
+    "simulator": case_simulator,
+    "replay": case_replay,
+    "season": case_season,
+}
+
+
+def run(names=None):
+    """{case: {metric: bytes}} for the named cases (all by default)."""
+    return {name: CASES[name]() for name in names or CASES}
+
+
+def over_budget(results, budget):
+    """Metrics above their budget: [(case, metric, budget, measured)]."""
+    over = []
+    for name, metrics in results.items():
+        for key, value in metrics.items():
+            limit = budget.get(name, {}).get(key)
+            if limit is not None and value > limit:
+                over.append((name, key, limit, value))
+    return over
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure memory per match and per ball against a budget.")
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="cases to run (default: all)")
+    parser.add_argument("--budget", default=BUDGET, help="budget file")
+    parser.add_argument("--save-budget", action="store_true", help="write this run plus the headroom as the budget")
+    args = parser.parse_args(argv)
+
+    results = run(args.only)
+    for name, metrics in results.items():
+        for key, value in metrics.items():
+            print(f"{name:10} {key:17} {value:>12,} bytes")
+
+    if args.save_budget:
+        budget = {name: {key: int(value * (1 + HEADROOM)) for key, value in metrics.items()}
+                  for name, metrics in results.items()}
+        with open(args.budget, "w") as f:
+            json.dump(budget, f, indent=2)
+        print(f"Budget written to {args.budget}")
+        return 0
+    with open(args.budget) as f:
+        over = over_budget(results, json.load(f))
+    for name, key, limit, value in over:
+        print(f"OVER BUDGET {name} {key}: {value:,} > {limit:,} bytes")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
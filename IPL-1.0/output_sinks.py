@@ -0,0 +1,77 @@
+import io
+import os
+
+# Where game()/playMatch() send the commentary and scorecard text of a match.
+# A sink is file-like (print(..., file=sink) works) and says through
+# wantsText whether it will use the text at all: the engines skip building
+# the per-ball lines and the tabulate grids for a sink that doesn't.
+#
+#   NullSink            bulk simulations; nothing is rendered
+#   MemorySink          text kept in memory, read back with getvalue()
+#   BufferedFileSink    text written through a large buffer to a private
+#                       temporary file that replaces `path` on close, so two
+#                       matches writing the same path never interleave
+
+
+class NullSink:
+    wantsText = False
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemorySink(io.StringIO):
+    wantsText = True
+
+    def close(self):
+        # keep the text readable after the match
+        pass
+
+
+class BufferedFileSink:
+    wantsText = True
+
+    def __init__(self, path, bufferSize=1 << 16):
+        self.path = path
+        self._tmpPath = f"{path}.{os.getpid()}.{id(self):x}.tmp"
+        self._file = open(self._tmpPath, "w", buffering=bufferSize)
+
+    def write(self, text):
+        return self._file.write(text)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        os.replace(self._tmpPath, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        if excType is not None and not self._file.closed:
+            # a half-written scorecard never replaces the old one
+            self._file.close()
+            os.remove(self._tmpPath)
+            return
+        self.close()
+
+
+def wants_text(out):
+    # plain file objects (and None, i.e. stdout) predate sinks and always want text
+    return getattr(out, "wantsText", True)
@@ -0,0 +1,70 @@
+from collections import namedtuple
+
+# Every ball both engines used to start from scratch: average the batter's and
+# the bowler's run weights, out rate and dismissal types key by key, with the
+# pitch effect applied to a fresh copy of the bowler's figures. None of that
+# depends on the state of the game, and an innings only has 11 batters and at
+# most 11 bowlers, so PairMatrix works it out once for every pair when the
+# innings (or the match) starts; a ball then costs one lookup, a copy of the
+# run weights and the situational adjustments.
+
+# pitch effect on the bowler's outs rate and 0/1/4/6 weights, per innings.
+# delivery()'s spin test is always true, so it applies to every bowler.
+PITCH_EFFECT = {1: (0.25, 0.25, 0.25, -0.38, -0.3), 2: (0.22, 0.18, 0.22, -0.4, -0.3)}
+
+# delivery()'s starting point: run weights keyed '0'..'6' (callers copy them
+# before adjusting), the out chance and the dismissal-type weights including
+# 'runOut'.
+Pair = namedtuple("Pair", "den out outTypes")
+
+
+def base_pair(batter, bowler, inningsNo, spin):
+    """mainconnect's base outcome for `batter` facing `bowler` (player profiles)."""
+    cOut, c0, c1, c4, c6 = PITCH_EFFECT[inningsNo]
+    effect = (1.0 - spin)/2
+    bowlDen = dict(bowler['bowlRunDenominationsObject'])
+    bowlDen['0'] += (effect * c0)
+    bowlDen['1'] += (effect * c1)
+    bowlDen['4'] += (effect * c4)
+    bowlDen['6'] += (effect * c6)
+    out = (batter['batOutsRate'] + (bowler['bowlOutsRate'] + (effect * cOut))) / 2
+
+    den = {}
+    for batKey in batter['batRunDenominationsObject']:
+        den[batKey] = (batter['batRunDenominationsObject'][batKey] + bowlDen[batKey])/2
+
+    outTypes = {}
+    for a, b in zip(batter['batOutTypesObject'], bowler['bowlOutTypesObject']):
+        outTypes[a] = (batter['batOutTypesObject'][a] + bowler['bowlOutTypesObject'][b]) / 2
+    outTypes['runOut'] = 0.01
+    if(batter['batOutsTotal'] != 0):
+        outTypes['runOut'] = batter['runnedOut'] / batter['batBallsTotal']
+    return Pair(den, out, outTypes)
+
+
+class PairMatrix:
+    """Dense batter x bowler table of base outcomes, built once.
+
+    `batters` and `bowlers` map initials to player profiles (in order);
+    `build(batter, bowler)` makes one entry. Look pairs up with
+    matrix[batterInitials, bowlerInitials], or get() for players that may
+    not be in the table.
+    """
+
+    __slots__ = ("batters", "bowlers", "rows")
+
+    def __init__(self, batters, bowlers, build):
+        self.batters = {ini: i for i, ini in enumerate(batters)}
+        self.bowlers = {ini: j for j, ini in enumerate(bowlers)}
+        self.rows = [[build(bat, bowl) for bowl in bowlers.values()] for bat in batters.values()]
+
+    def __getitem__(self, pair):
+        batter, bowler = pair
+        return self.rows[self.batters[batter]][self.bowlers[bowler]]
+
+    def get(self, batter, bowler, default=None):
+        i = self.batters.get(batter)
+        j = self.bowlers.get(bowler)
+        if i is None or j is None:
+            return default
+        return self.rows[i][j]
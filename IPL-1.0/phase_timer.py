@@ -0,0 +1,114 @@
+import argparse
+import sys
+import time
+
+from tabulate import tabulate
+
+# Where a match's time goes. An engine given a PhaseTimer wraps the
+# functions behind each stage of its ball loop with wrap(), which adds up
+# their time and calls; without one it calls them directly, so there is no
+# cost at all when timing is off. Stages nest, and every time includes the
+# stages called inside it:
+#
+#   mainconnect.innings1()/innings2()
+#     bowlerPick      BowlerScheduler.pick, once per over
+#     delivery        one ball, with everything below
+#       adjust        situational adjustments (adjustments.adjust)
+#       draw          run and dismissal draws (sampling.draw)
+#       record        InningsLog.record
+#       output        commentary written to the sink
+#     checkpoint      InningsLog.checkpoint, once per over
+#     cards           scorecard grids, for sinks that show them
+#
+#   MatchSimulator.simulate_one_ball()
+#     ball            one ball, with everything below
+#       selectBowler  _select_next_bowler
+#       probabilities _calculate_dynamic_probabilities
+#       draw          run and dismissal draws
+#     gameState       get_game_state() for the caller
+#
+# One timer can be shared by any number of matches for an aggregated
+# report; each mainconnect result also carries its own match's times as
+# "phaseTimes".
+#
+#   python phase_timer.py --matches 50
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+
+    def wrap(self, stage, fn):
+        """fn, adding its time and calls to `stage`."""
+        seconds, calls, clock = self.seconds, self.calls, time.perf_counter
+        seconds.setdefault(stage, 0.0)
+        calls.setdefault(stage, 0)
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds[stage] += clock() - start
+                calls[stage] += 1
+        return timed
+
+    def snapshot(self):
+        return dict(self.seconds), dict(self.calls)
+
+    def merge(self, other):
+        for stage, value in other.seconds.items():
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + value
+            self.calls[stage] = self.calls.get(stage, 0) + other.calls[stage]
+
+    def report(self, since=None):
+        """{stage: {"seconds", "calls", "meanUs"}}, counting from a snapshot() if given."""
+        startSeconds, startCalls = since if since is not None else ({}, {})
+        report = {}
+        for stage, total in self.seconds.items():
+            seconds = total - startSeconds.get(stage, 0.0)
+            calls = self.calls[stage] - startCalls.get(stage, 0)
+            if calls:
+                report[stage] = {"seconds": seconds, "calls": calls, "meanUs": seconds / calls * 1e6}
+        return report
+
+    def card(self):
+        rows = [[stage, round(r["seconds"], 4), r["calls"], round(r["meanUs"], 2)]
+                for stage, r in self.report().items()]
+        return tabulate(rows, headers=["Stage", "Seconds", "Calls", "Mean µs"], tablefmt="grid")
+
+
+class TimedOutput:
+    """A sink whose writes are timed as the "output" stage."""
+
+    def __init__(self, out, timer):
+        self._out = out if out is not None else sys.stdout
+        self.wantsText = True
+        self.write = timer.wrap("output", self._out.write)
+
+    def flush(self):
+        self._out.flush()
+
+
+def main(argv=None):
+    # imported here: mainconnect builds on this module
+    import mainconnect
+    import output_sinks
+    parser = argparse.ArgumentParser(description="Time the stages of many matches.")
+    parser.add_argument("--matches", type=int, default=20)
+    parser.add_argument("--team1", default="csk")
+    parser.add_argument("--team2", default="mi")
+    parser.add_argument("--commentary", action="store_true", help="render the commentary too (into memory)")
+    args = parser.parse_args(argv)
+    timer = PhaseTimer()
+    for seed in range(args.matches):
+        sink = output_sinks.MemorySink() if args.commentary else output_sinks.NullSink()
+        mainconnect.game(False, args.team1, args.team2, seed=seed, sink=sink, timer=timer)
+    print(f"{args.matches} matches, {args.team1.upper()} v {args.team2.upper()}")
+    print(timer.card())
+    return timer
+
+
+if __name__ == "__main__":
+    main()
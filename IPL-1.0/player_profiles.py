@@ -0,0 +1,126 @@
+import os
+
+import accessDB
+import accessJSON
+import player_store
+
+# Every rate innings1()/innings2() used to derive per match (run/out type
+# distributions, outs rate, wide/no-ball rate, over preferences, batting
+# position averages) is worked out once here, the first time a player is asked for.
+# The results are read-only, so engines can share one profile across any
+# number of matches and threads without copying it, and the accessJSON data
+# underneath is never touched.
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    # Nothing can change underneath a frozen value, so copies are the value itself.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class PlayerProfile(FrozenDict):
+    __slots__ = ()
+
+
+def freeze(value):
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def compile_profile(raw):
+    # Same arithmetic (and key order) mainconnect's innings setup used on a
+    # fresh copy of the player: both ball totals carry the +1 smoothing. The
+    # byBatsman/byBowler breakdowns are never read, so they aren't kept.
+    p = {key: value for key, value in raw.items() if key not in player_store.BREAKDOWNS}
+
+    p['batBallsTotal'] = raw['batBallsTotal'] + 1
+    p['batRunDenominationsObject'] = {run: raw['batRunDenominations'][run] / p['batBallsTotal']
+                                      for run in raw['batRunDenominations']}
+    p['batOutTypesObject'] = {out: raw['batOutTypes'][out] / p['batBallsTotal'] for out in raw['batOutTypes']}
+    p['batOutsRate'] = raw['batOutsTotal'] / p['batBallsTotal']
+
+    newPos = [pos for pos in raw['position'] if pos != "null"]
+    posAvgObj = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7":0,"8": 0, "9":0, "10":0}
+    for pos in newPos:
+        posAvgObj[str(pos)] = posAvgObj.get(str(pos), 0) + 1
+    p['posAvgsAll'] = {key_p: posAvgObj[key_p] / raw['matches'] for key_p in posAvgObj}
+    p['posAvg'] = sum(newPos) / len(newPos) if newPos else 9.0
+
+    p['bowlBallsTotalRate'] = raw['bowlBallsTotal'] / raw['matches']
+    p['catchRate'] = raw['catches'] / raw['matches']
+    p['bowlWideRate'] = raw['bowlWides'] / (raw['bowlBallsTotal'] + 1)
+    p['bowlNoballRate'] = raw['bowlNoballs'] / (raw['bowlBallsTotal'] + 1)
+    p['bowlBallsTotal'] = raw['bowlBallsTotal'] + 1
+    p['bowlRunDenominationsObject'] = {run: raw['bowlRunDenominations'][run] / p['bowlBallsTotal']
+                                       for run in raw['bowlRunDenominations']}
+    p['bowlOutTypesObject'] = {out: raw['bowlOutTypes'][out] / p['bowlBallsTotal'] for out in raw['bowlOutTypes']}
+    p['bowlOutsRate'] = raw['bowlOutsTotal'] / p['bowlBallsTotal']
+
+    obj = {"20": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7": 0, "8": 0, "9": 0,
+           "10": 0, "11": 0, "12": 0, "13": 0, "14": 0, "15": 0, "16": 0, "17": 0, "18": 0, "19": 0}
+    for over in raw['overNumbers']:
+        obj[over] += 1
+    p['overNumbersObject'] = {keys: (obj[keys] / raw['matches'] if raw['matches'] != 0 else -1) for keys in obj}
+
+    return PlayerProfile((k, freeze(v)) for k, v in p.items())
+
+
+# Where raw players come from: accessJSON (the bundled data) or, with
+# IPL_PLAYERS=mongo, accessDB (the Mongo collection). Either gives
+# getPlayers(names) and version(); profiles compiled under one version are
+# dropped once the backend reports another.
+backend = accessDB if os.environ.get("IPL_PLAYERS") == "mongo" else accessJSON
+
+# compiled on first use, so only the players a process actually fields are
+# read from the backend
+_profiles = {}
+_version = None
+
+
+def use_backend(module):
+    global backend, _profiles, _version
+    backend, _profiles, _version = module, {}, None
+
+
+def get_profiles(names):
+    """Profiles of `names`, in order; the ones not compiled yet are fetched in one backend call."""
+    global _profiles, _version
+    while True:
+        version = backend.version()
+        if version != _version:
+            _profiles, _version = {}, version
+        profiles = _profiles
+        missing = [name for name in dict.fromkeys(names) if name not in profiles]
+        if not missing:
+            break
+        raws = backend.getPlayers(missing)
+        # data swapped in between: start again so one call never mixes two versions
+        if backend.version() != version:
+            continue
+        for name in missing:
+            profiles.setdefault(name, compile_profile(raws[name]))
+        break
+    return [profiles[name] for name in names]
+
+
+def get_profile(name):
+    return get_profiles([name])[0]
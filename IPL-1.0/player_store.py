@@ -0,0 +1,260 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+# data/playerInfoProcessed.json compiled into a columnar binary file that is
+# memory-mapped instead of parsed. Opening it only reads a small JSON header
+# (the name index, the field layout and where each column starts); a player
+# is put back together, as the same dict json.load gives, only when it is
+# looked up. The columns live in the page cache, so every worker process
+# maps the same pages instead of holding its own copy of the nested dicts.
+#
+# File: MAGIC, version and header length (struct HEADER), the header, then
+# the columns, each aligned to 8 bytes. Per field, by what the builder finds
+# in every player:
+#
+#   int       one int64 per player
+#   str       int64 offsets (players + 1) into a block of UTF-8
+#   counts    a dict with the same keys for every player (run and dismissal
+#             counts): one int64 column per key
+#   intStrs   a list of numeric strings ("13"): int64 offsets into int64 values
+#   intsOrNull  a list of ints and "null": the same, "null" stored as NULL
+#   json      anything else (the byBatsman/byBowler breakdowns): offsets
+#             into compact JSON, parsed only when the player is looked up
+#
+# A per-player layout number records which fields the player has and in what
+# order, so a looked-up player equals the JSON one exactly. summary() leaves
+# out the BREAKDOWNS, which no engine reads, so the players the engines ask
+# for (accessJSON.getPlayers) never parse them.
+#
+# The header keeps the mtime and size of the JSON it was built from, and its
+# sha256. load() uses a store whose mtime and size match the JSON on disk;
+# only when they don't is the JSON hashed, and the store rebuilt if that
+# doesn't match either.
+#
+#   python player_store.py        (build data/playerInfoProcessed.bin)
+
+SOURCE = "data/playerInfoProcessed.json"
+STORE = "data/playerInfoProcessed.bin"
+
+MAGIC = b"IPLSTORE"
+VERSION = 2
+HEADER = struct.Struct("<8sII")
+NULL = -1
+# a field the player doesn't have (their layout leaves it out)
+_MISSING = object()
+# per-batter/per-bowler breakdowns, left out of summary()
+BREAKDOWNS = ("byBatsman", "byBowler")
+
+
+def source_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _kind(values):
+    # the column type that holds every player's value of one field
+    if all(type(v) is int for v in values):
+        return "int"
+    if all(type(v) is str for v in values):
+        return "str"
+    if all(type(v) is dict for v in values):
+        keys = list(values[0])
+        if all(list(v) == keys and all(type(x) is int for x in v.values()) for v in values):
+            return "counts"
+    if all(type(v) is list for v in values):
+        items = [x for v in values for x in v]
+        if all(type(x) is str and x.isdigit() and str(int(x)) == x for x in items):
+            return "intStrs"
+        if all((type(x) is int and x >= 0) or x == "null" for x in items):
+            return "intsOrNull"
+    return "json"
+
+
+def build(source=SOURCE, store=STORE):
+    """Compile `source` into `store` (written aside and renamed); returns the store's path."""
+    stamp = source_stamp(source)
+    with open(source, "rb") as f:
+        raw = f.read()
+    players = json.loads(raw)
+    names = list(players)
+    rows = [players[name] for name in names]
+
+    fields = {}
+    for row in rows:
+        for key in row:
+            fields.setdefault(key, [])
+    for key, values in fields.items():
+        values.extend(row[key] for row in rows if key in row)
+    kinds = {key: _kind(values) for key, values in fields.items()}
+
+    layouts = []
+    layoutOf = {}
+    layoutColumn = []
+    for row in rows:
+        order = tuple(row)
+        if order not in layoutOf:
+            layoutOf[order] = len(layouts)
+            layouts.append(list(order))
+        layoutColumn.append(layoutOf[order])
+
+    columns = []  # (name, typecode, bytes)
+
+    def ints(name, values):
+        columns.append((name, "q", struct.pack(f"<{len(values)}q", *values)))
+
+    def ragged(name, chunks):
+        offsets = [0]
+        for chunk in chunks:
+            offsets.append(offsets[-1] + len(chunk))
+        ints(f"{name}#offsets", offsets)
+        return b"".join(chunks)
+
+    ints("#layout", layoutColumn)
+    counts = {}
+    for key, kind in kinds.items():
+        values = [row.get(key, _MISSING) for row in rows]
+        if kind == "int":
+            ints(key, [NULL if v is _MISSING else v for v in values])
+        elif kind == "str":
+            columns.append((key, "B", ragged(key, [b"" if v is _MISSING else v.encode() for v in values])))
+        elif kind == "counts":
+            counts[key] = list(fields[key][0])
+            for k in counts[key]:
+                ints(f"{key}.{k}", [0 if v is _MISSING else v[k] for v in values])
+        elif kind in ("intStrs", "intsOrNull"):
+            lists = [[] if v is _MISSING else v for v in values]
+            offsets = [0]
+            for v in lists:
+                offsets.append(offsets[-1] + len(v))
+            ints(f"{key}#offsets", offsets)
+            ints(key, [NULL if x == "null" else int(x) for v in lists for x in v])
+        else:
+            blobs = [b"" if v is _MISSING else json.dumps(v, separators=(",", ":")).encode() for v in values]
+            columns.append((key, "B", ragged(key, blobs)))
+
+    header = {"source": hashlib.sha256(raw).hexdigest(), "stamp": stamp, "names": names, "layouts": layouts,
+              "kinds": kinds, "counts": counts, "columns": {}}
+    position = 0
+    for name, typecode, data in columns:
+        header["columns"][name] = [position, len(data), typecode]
+        position += len(data) + (-len(data)) % 8
+    headerBytes = json.dumps(header, separators=(",", ":")).encode()
+    headerBytes += b" " * ((-(HEADER.size + len(headerBytes))) % 8)
+
+    tmpPath = f"{store}.{os.getpid()}.tmp"
+    with open(tmpPath, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(headerBytes)))
+        f.write(headerBytes)
+        for _, _, data in columns:
+            f.write(data)
+            f.write(b"\0" * ((-len(data)) % 8))
+    os.replace(tmpPath, store)
+    return store
+
+
+class PlayerStore(Mapping):
+    """Read-only {name: player dict} over a built store; players are decoded when looked up."""
+
+    def __init__(self, path=STORE):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, headerLength = HEADER.unpack_from(self._map) if len(self._map) >= HEADER.size else (b"", 0, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} player store")
+        header = json.loads(self._map[HEADER.size:HEADER.size + headerLength])
+        self.source = header["source"]
+        self.stamp = header["stamp"]
+        self._names = header["names"]
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._layouts = header["layouts"]
+        self._kinds = header["kinds"]
+        self._counts = header["counts"]
+        base = HEADER.size + headerLength
+        view = memoryview(self._map)
+        self._columns = {name: view[base + start:base + start + length].cast(typecode)
+                         for name, (start, length, typecode) in header["columns"].items()}
+
+    def __getitem__(self, name):
+        return self._player(name, ())
+
+    def summary(self, name):
+        """The player without the BREAKDOWNS."""
+        return self._player(name, BREAKDOWNS)
+
+    def _player(self, name, leaveOut):
+        row = self._index[name]
+        c = self._columns
+        player = {}
+        for key in self._layouts[c["#layout"][row]]:
+            if key in leaveOut:
+                continue
+            kind = self._kinds[key]
+            if kind == "int":
+                player[key] = c[key][row]
+            elif kind == "counts":
+                player[key] = {k: c[f"{key}.{k}"][row] for k in self._counts[key]}
+            else:
+                offsets = c[f"{key}#offsets"]
+                values = c[key][offsets[row]:offsets[row + 1]]
+                if kind == "str":
+                    player[key] = bytes(values).decode()
+                elif kind == "json":
+                    player[key] = json.loads(bytes(values))
+                elif kind == "intStrs":
+                    player[key] = [str(v) for v in values]
+                else:
+                    player[key] = ["null" if v == NULL else v for v in values]
+        return player
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+def load(source=SOURCE, store=STORE):
+    """The players of `source`: a PlayerStore when `store` matches it (rebuilt if it doesn't),
+    else the parsed JSON when the store can't be written."""
+    try:
+        players = PlayerStore(store)
+        if players.stamp == source_stamp(source) or players.source == source_hash(source):
+            return players
+    except (OSError, ValueError):
+        pass
+    try:
+        return PlayerStore(build(source, store))
+    except OSError:
+        # e.g. a read-only checkout
+        with open(source) as f:
+            return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the player JSON into a memory-mapped columnar store.")
+    parser.add_argument("--source", default=SOURCE)
+    parser.add_argument("--store", default=STORE)
+    args = parser.parse_args(argv)
+    build(args.source, args.store)
+    players = PlayerStore(args.store)
+    with open(args.source) as f:
+        if dict(players.items()) != json.load(f):
+            raise SystemExit(f"{args.store} does not read back as {args.source}")
+    print(f"{len(players)} players, {os.path.getsize(args.store):,} bytes in {args.store}")
+
+
+if __name__ == "__main__":
+    main()
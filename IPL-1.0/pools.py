@@ -0,0 +1,26 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Independent jobs spread over worker processes, for season, projection and
+# win_probability. Results come back in job order and workers=1 runs the jobs
+# in the calling process without starting a pool. Seeded results only stay
+# the same whatever the number of workers when the callers split their work
+# into jobs that don't depend on it, each with its own seed (seeding.py per
+# match, a numpy SeedSequence spawned per fixed-size chunk), as all three do.
+
+
+def worker_count(workers, jobs):
+    """Processes to use for `jobs` jobs: `workers` (one per CPU when None), at least 1, at most `jobs`."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, jobs))
+
+
+def run(fn, jobs, workers):
+    """fn(*job) for each job, yielded in order; over a pool of `workers` processes unless workers is 1."""
+    if workers == 1:
+        for job in jobs:
+            yield fn(*job)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(fn, *zip(*jobs))
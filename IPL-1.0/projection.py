@@ -0,0 +1,222 @@
+import numpy as np
+from tabulate import tabulate
+
+import batch_engine
+import pools
+from recent_form import DEFAULT_WINDOW
+from season import TEAMS, league_fixtures
+
+# Title, playoff, points and NRR odds for every team over many seasons in
+# season.py's format (round robin, then Qualifier 1, Eliminator, Qualifier 2
+# and Final; a tied playoff goes to the side placed higher in the league).
+#
+# Seasons are played SEASONS_PER_CHUNK at a time with batch_engine: one
+# simulate_fixture() call per league fixture covers every season of the
+# chunk, then one call per pairing of top-four sides plays every playoff
+# match those seasons could need. So the matches follow batch_engine's ball
+# model (see its notes on how it differs from mainconnect), and NRR uses
+# mainconnect's convention that a first innings always counts 120 balls. A chunk is reduced to
+# per-team counts before it leaves its worker, and project() adds the chunks
+# up in order as they come back, so memory does not grow with the number of
+# seasons and the totals do not depend on the number of workers.
+
+SEASONS_PER_CHUNK = 500
+
+# how a team's season ended
+OUTCOMES = ("league", "eliminator", "qualifier2", "runnerUp", "champion")
+# NRR histogram edges; values beyond them are counted in the end bins
+NRR_EDGES = np.round(np.arange(-5, 5.01, 0.05), 2)
+
+
+def _chunk(teams, seasons, seed, formWindow, teamsFile):
+    # play `seasons` seasons from SeedSequence `seed` and return their per-team
+    # counts; runs in the workers
+    n, T = seasons, len(teams)
+    index = {team: i for i, team in enumerate(teams)}
+    rows = np.arange(n)
+    leagueSeed, playoffSeed = seed.spawn(2)
+
+    fixtures = league_fixtures(teams)
+    points = np.zeros((n, T), dtype=np.int64)
+    runsFor = np.zeros((n, T), dtype=np.int64)
+    ballsFaced = np.zeros((n, T), dtype=np.int64)
+    runsAgainst = np.zeros((n, T), dtype=np.int64)
+    ballsBowled = np.zeros((n, T), dtype=np.int64)
+    for (team1, team2), s in zip(fixtures, leagueSeed.spawn(len(fixtures))):
+        r = batch_engine.simulate_fixture(team1, team2, n, seed=s, formWindow=formWindow, teamsFile=teamsFile)
+        a, b = index[team1], index[team2]
+        first = np.where(r.team1BattedFirst, a, b)
+        second = a + b - first
+        runs1, runs2, balls2 = r.innings1["runs"], r.innings2["runs"], r.innings2["balls"]
+        runsFor[rows, first] += runs1
+        runsFor[rows, second] += runs2
+        runsAgainst[rows, first] += runs2
+        runsAgainst[rows, second] += runs1
+        ballsFaced[rows, first] += 120
+        ballsFaced[rows, second] += balls2
+        ballsBowled[rows, first] += balls2
+        ballsBowled[rows, second] += 120
+        points[:, a] += np.where(r.winner == 0, 2, np.where(r.winner == 2, 1, 0))
+        points[:, b] += np.where(r.winner == 1, 2, np.where(r.winner == 2, 1, 0))
+
+    nrr = runsFor / ballsFaced * 6 - runsAgainst / ballsBowled * 6
+    # by points, then NRR, then the order of `teams` (season.SeasonTable.standings)
+    order = np.lexsort((np.broadcast_to(np.arange(T), (n, T)), -nrr, -points), axis=1)
+    position = np.empty((n, T), dtype=np.int64)
+    position[rows[:, None], order] = np.arange(T)
+
+    # Only the top four meet in the playoffs, first and second possibly twice
+    # (Qualifier 1 and the Final), so every match a chunk's playoffs can need
+    # is played up front, one batch per pairing; `start` is where each
+    # season's matches of a pairing begin in its batch.
+    def pairing(x, y):
+        return np.minimum(x, y) * T + np.maximum(x, y)
+
+    need = np.zeros((n, T * T), dtype=np.int64)
+    for i in range(4):
+        for j in range(i + 1, 4):
+            need[rows, pairing(order[:, i], order[:, j])] += 1
+    need[rows, pairing(order[:, 0], order[:, 1])] += 1
+    start = np.cumsum(need, axis=0) - need
+    pairSeeds = playoffSeed.spawn(T * T)
+    played = {}
+    for key in np.nonzero(need.sum(axis=0))[0]:
+        lo, hi = divmod(int(key), T)
+        r = batch_engine.simulate_fixture(teams[lo], teams[hi], int(need[:, key].sum()), seed=pairSeeds[key],
+                                          formWindow=formWindow, teamsFile=teamsFile)
+        played[key] = np.where(r.winner == 0, lo, np.where(r.winner == 1, hi, -1))
+    used = np.zeros((n, T * T), dtype=np.int64)
+
+    def playoff(home, away):
+        # winner and loser of one playoff round in every season
+        key = pairing(home, away)
+        slot = start[rows, key] + used[rows, key]
+        used[rows, key] += 1
+        winner = np.empty(n, dtype=np.int64)
+        for k in np.unique(key):
+            match = key == k
+            winner[match] = played[k][slot[match]]
+        higher = np.where(position[rows, home] < position[rows, away], home, away)
+        winner = np.where(winner < 0, higher, winner)
+        return winner, home + away - winner
+
+    outcome = np.zeros((n, T), dtype=np.int64)
+    winnerQ1, loserQ1 = playoff(order[:, 0], order[:, 1])
+    winnerElim, loserElim = playoff(order[:, 2], order[:, 3])
+    winnerQ2, loserQ2 = playoff(winnerElim, loserQ1)
+    champion, runnerUp = playoff(winnerQ1, winnerQ2)
+    for code, teamsOut in enumerate((None, loserElim, loserQ2, runnerUp, champion)):
+        if teamsOut is not None:
+            outcome[rows, teamsOut] = code
+
+    nrrBin = np.clip(np.searchsorted(NRR_EDGES, nrr, side="right") - 1, 0, len(NRR_EDGES) - 1)
+    counts = {
+        "points": np.zeros((T, 2 * (T - 1) + 1), dtype=np.int64),
+        "position": np.zeros((T, T), dtype=np.int64),
+        "outcome": np.zeros((T, len(OUTCOMES)), dtype=np.int64),
+        "nrr": np.zeros((T, len(NRR_EDGES)), dtype=np.int64),
+    }
+    for t in range(T):
+        counts["points"][t] = np.bincount(points[:, t], minlength=2 * (T - 1) + 1)
+        counts["position"][t] = np.bincount(position[:, t], minlength=T)
+        counts["outcome"][t] = np.bincount(outcome[:, t], minlength=len(OUTCOMES))
+        counts["nrr"][t] = np.bincount(nrrBin[:, t], minlength=len(NRR_EDGES))
+    counts["nrrSum"] = nrr.sum(axis=0)
+    counts["nrrSquares"] = (nrr ** 2).sum(axis=0)
+    return counts
+
+
+def _quantile(counts, values, q):
+    # smallest value with at least a share q of the counts at or below it
+    cumulative = np.cumsum(counts)
+    return values[int(np.searchsorted(cumulative, q * cumulative[-1]))]
+
+
+class SeasonProjection:
+    """Running per-team counts over every season played so far."""
+
+    def __init__(self, teams=TEAMS, seed=None):
+        T = len(teams)
+        self.teams = list(teams)
+        self.seed = seed
+        self.seasons = 0
+        self.counts = {
+            "points": np.zeros((T, 2 * (T - 1) + 1), dtype=np.int64),
+            "position": np.zeros((T, T), dtype=np.int64),
+            "outcome": np.zeros((T, len(OUTCOMES)), dtype=np.int64),
+            "nrr": np.zeros((T, len(NRR_EDGES)), dtype=np.int64),
+            "nrrSum": np.zeros(T),
+            "nrrSquares": np.zeros(T),
+        }
+
+    def add(self, counts):
+        """Merge one chunk's counts."""
+        for key, value in counts.items():
+            self.counts[key] += value
+        self.seasons += int(counts["position"][0].sum())
+
+    def report(self):
+        """{team: {"points", "nrr", "position", "playoffs"}} as probabilities and summary stats."""
+        n = self.seasons
+        c = self.counts
+        pointValues = np.arange(c["points"].shape[1])
+        report = {}
+        for t, team in enumerate(self.teams):
+            mean = c["nrrSum"][t] / n
+            outcome = c["outcome"][t] / n
+            report[team] = {
+                "points": {
+                    "mean": float(c["points"][t] @ pointValues) / n,
+                    "p10": int(_quantile(c["points"][t], pointValues, 0.1)),
+                    "p50": int(_quantile(c["points"][t], pointValues, 0.5)),
+                    "p90": int(_quantile(c["points"][t], pointValues, 0.9)),
+                    "distribution": {int(p): int(k) / n for p, k in zip(pointValues, c["points"][t]) if k},
+                },
+                "nrr": {
+                    "mean": mean,
+                    "sd": max(c["nrrSquares"][t] / n - mean ** 2, 0.0) ** 0.5,
+                    "p10": float(_quantile(c["nrr"][t], NRR_EDGES, 0.1)),
+                    "p50": float(_quantile(c["nrr"][t], NRR_EDGES, 0.5)),
+                    "p90": float(_quantile(c["nrr"][t], NRR_EDGES, 0.9)),
+                },
+                "position": {
+                    "mean": float(c["position"][t] @ np.arange(len(self.teams))) / n + 1,
+                    "distribution": [int(k) / n for k in c["position"][t]],
+                },
+                "playoffs": {
+                    "top4": 1 - outcome[0],
+                    "final": outcome[3] + outcome[4],
+                    "title": outcome[4],
+                    "outcomes": dict(zip(OUTCOMES, (float(p) for p in outcome))),
+                },
+            }
+        return report
+
+    def card(self):
+        report = self.report()
+        rows = []
+        for team in sorted(report, key=lambda team: -report[team]["playoffs"]["title"]):
+            r = report[team]
+            rows.append([team.upper(), round(r["points"]["mean"], 1), f"{r['points']['p10']}-{r['points']['p90']}",
+                         round(r["nrr"]["mean"], 2), round(r["position"]["mean"], 1),
+                         f"{r['playoffs']['top4']:.1%}", f"{r['playoffs']['final']:.1%}", f"{r['playoffs']['title']:.1%}"])
+        return tabulate(rows, headers=["Team", "Points", "Points 10-90%", "NRR", "Position", "Top 4", "Final", "Title"],
+                        tablefmt="grid")
+
+
+def project(seasons=1000, workers=None, seed=None, teams=TEAMS, chunkSize=SEASONS_PER_CHUNK,
+            formWindow=DEFAULT_WINDOW, teamsFile='teams/teams.json'):
+    """Play `seasons` seasons, spread over `workers` processes; a SeasonProjection.
+
+    The seasons are split into chunks of `chunkSize`, each with its own
+    stream from `seed`, so a seed and chunk size give the same projection
+    whatever the number of workers (1 stays in this process). Without a seed
+    one is drawn; it is kept on the result as .seed.
+    """
+    root = np.random.SeedSequence(seed)
+    sizes = [min(chunkSize, seasons - start) for start in range(0, seasons, chunkSize)]
+    jobs = [(teams, size, s, formWindow, teamsFile) for size, s in zip(sizes, root.spawn(len(sizes)))]
+    projection = SeasonProjection(teams, seed=root.entropy)
+    for counts in pools.run(_chunk, jobs, pools.worker_count(workers, len(jobs))):
+        projection.add(counts)
+    return projection
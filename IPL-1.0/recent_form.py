@@ -0,0 +1,36 @@
+from collections import deque
+
+DEFAULT_WINDOW = 10
+
+
+class RecentForm:
+    """Runs and dismissals over the last `window` deliveries of an innings.
+
+    delivery() used to re-split every "balls:outcome" string in the innings'
+    ballLog to get these totals, which is O(balls) per ball. Here each ball is
+    pushed into a fixed-size ring buffer and the totals are adjusted as balls
+    enter and leave the window, so reading them is O(1). window=None keeps the
+    whole innings in the totals.
+    """
+
+    __slots__ = ("window", "runs", "outs", "_balls")
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        if window is not None and window < 1:
+            raise ValueError(f"form window must be at least 1 ball, got {window!r}")
+        self.window = window
+        self.runs = 0
+        self.outs = 0
+        self._balls = deque(maxlen=window)
+
+    def record(self, runs=0, out=False):
+        if self.window is not None and len(self._balls) == self.window:
+            oldRuns, oldOut = self._balls[0]
+            self.runs -= oldRuns
+            self.outs -= oldOut
+        self._balls.append((runs, out))
+        self.runs += runs
+        self.outs += out
+
+    def __len__(self):
+        return len(self._balls)
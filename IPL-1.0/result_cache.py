@@ -0,0 +1,208 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import mainconnect
+import output_sinks
+from recent_form import DEFAULT_WINDOW
+from season import league_fixtures
+
+# Finished matches, kept so that a seeded fixture asked for again (or played
+# ahead of time with precompute()) is served without running the engine.
+#
+# A seed fixes every draw of a match (seeding.py), so a result is a function
+# of the teams, seed, switch (part of the match's stream), pitch, recent-form
+# window, ENGINE_VERSION and the player and team data. key() hashes all of
+# them; editing playerInfoProcessed.json or teams.json, or bumping
+# ENGINE_VERSION, simply makes every old entry unreachable.
+#
+# Two tiers hold the pickled result: an LRU of up to `entries` results in
+# memory, and optionally a directory of <key>.pkl files kept under
+# `maxBytes`, least recently used out first. Every get() unpickles a fresh
+# copy, so a caller that annotates its result (win_probability does) never
+# changes what the next caller gets.
+#
+#   python result_cache.py --seeds 100 --dir result_cache    (precompute the league)
+
+# Bump when a change to the engine makes a seed play a different match.
+ENGINE_VERSION = 1
+
+# relative paths are read from this module's directory, wherever the process started
+DATA_FILES = ("data/playerInfoProcessed.json", "teams/teams.json")
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+_dataHashes = {}  # (path, mtime, size) -> sha256 of the file
+
+
+def data_hash(paths=DATA_FILES):
+    """sha256 over the data files; each file is only re-read when it changes."""
+    digest = hashlib.sha256()
+    for path in paths:
+        path = os.path.join(HERE, path)
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        if stamp not in _dataHashes:
+            with open(path, "rb") as f:
+                _dataHashes[stamp] = hashlib.sha256(f.read()).hexdigest()
+        digest.update(_dataHashes[stamp].encode())
+    return digest.hexdigest()
+
+
+def key(team1, team2, seed, switch="group", pitch="dusty", formWindow=DEFAULT_WINDOW, dataHash=None):
+    """The cache key of a seeded match; `pitch` is anything JSON can encode (a type or factors)."""
+    fields = {"teams": [team1, team2], "seed": seed, "switch": switch, "pitch": pitch, "formWindow": formWindow,
+              "engine": ENGINE_VERSION, "data": dataHash if dataHash is not None else data_hash()}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """In-memory LRU over an optional on-disk tier, both holding pickled results."""
+
+    def __init__(self, entries=128, directory=None, maxBytes=256 << 20):
+        self.entries = entries
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._memory:
+                return True
+        return self.directory is not None and os.path.exists(self._path(key))
+
+    def get(self, key):
+        """A fresh copy of the result stored under `key`, or None."""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.hits["memory"] += 1
+                return pickle.loads(blob)
+        blob = self._read(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return None
+            self.hits["disk"] += 1
+            self._remember(key, blob)
+        return pickle.loads(blob)
+
+    def put(self, key, result):
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, blob)
+        self._write(key, blob)
+
+    def get_or_play(self, key, play):
+        """The result under `key`, from play() (then stored) when there is none."""
+        result = self.get(key)
+        if result is None:
+            result = play()
+            self.put(key, result)
+        return result
+
+    def _remember(self, key, blob):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _read(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                blob = f.read()
+            # reading counts as a use for the eviction order
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            return None
+        return blob
+
+    def _write(self, key, blob):
+        if self.directory is None:
+            return
+        # written aside and renamed, so a reader never sees half a file
+        tmpPath = f"{self._path(key)}.{os.getpid()}.{threading.get_ident():x}.tmp"
+        with open(tmpPath, "wb") as f:
+            f.write(blob)
+        os.replace(tmpPath, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.maxBytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def game(cache, team1, team2, switch="group", seed=None, formWindow=DEFAULT_WINDOW, dataHash=None):
+    """mainconnect.game(False, ...) with no commentary, through `cache` when seeded.
+
+    An unseeded match is a fresh random match every time, so it is played
+    and not stored. `dataHash` is the hash of the data the engines have
+    loaded (data_registry.Snapshot.dataHash), the data files' by default.
+    """
+    def play():
+        return mainconnect.game(False, team1, team2, switch, formWindow, seed, output_sinks.NullSink())
+
+    if seed is None:
+        return play()
+    return cache.get_or_play(key(team1, team2, seed, switch, formWindow=formWindow, dataHash=dataHash), play)
+
+
+def precompute(cache, fixtures, seeds, switch="group", formWindow=DEFAULT_WINDOW):
+    """Play and store every fixture (team1, team2) with every seed; the number of matches played."""
+    played = 0
+    dataHash = data_hash()
+    for team1, team2 in fixtures:
+        for seed in seeds:
+            k = key(team1, team2, seed, switch, formWindow=formWindow, dataHash=dataHash)
+            if k not in cache:
+                cache.put(k, mainconnect.game(False, team1, team2, switch, formWindow, seed, output_sinks.NullSink()))
+                played += 1
+    return played
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play and store seeded league fixtures ahead of time.")
+    parser.add_argument("--seeds", type=int, default=10, help="seeds 0..SEEDS-1 of every fixture")
+    parser.add_argument("--switch", default="webapp", help="the switch the results will be asked for with")
+    parser.add_argument("--dir", default="result_cache", help="directory of the on-disk tier")
+    parser.add_argument("--max-mb", type=int, default=256, help="size of the on-disk tier")
+    args = parser.parse_args(argv)
+    cache = ResultCache(entries=0, directory=args.dir, maxBytes=args.max_mb << 20)
+    fixtures = league_fixtures()
+    fixtures += [(team2, team1) for team1, team2 in fixtures]
+    played = precompute(cache, fixtures, range(args.seeds), args.switch)
+    print(f"{played} matches played into {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
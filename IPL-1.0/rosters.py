@@ -0,0 +1,91 @@
+import json
+import logging
+import os
+import threading
+from collections import Counter
+
+import accessJSON
+import player_profiles
+
+# teams.json resolved against the player data once, instead of every match
+# re-reading the file and finding a misspelt name as a KeyError (mainconnect)
+# or a placeholder player (MatchSimulator) halfway through. An entry that is
+# a player's name as written is that player; otherwise it is looked up,
+# without case or extra whitespace, in an alias table of display names and
+# initials. An alias two players share (the data has both "RINKU SINGH" and
+# "Rinku Singh") is left out rather than guessed. Entries that match nothing
+# are logged once, when the index is built, and kept as written so the
+# engines handle them as before.
+#
+# index() is shared per teams file and rebuilt only when the file or the
+# player data changes; app.py builds it at startup.
+
+TEAMS_FILE = 'teams/teams.json'
+
+
+def normalize(name):
+    return " ".join(str(name).split()).upper()
+
+
+def aliases(players):
+    """{normalized name or initials: player key} for the player data `players`."""
+    byName = {normalize(name): name for name in players}
+    names = Counter(normalize(name) for name in players)
+    byInitials = {normalize(players[name].get('playerInitials', "")): name for name in players}
+    initials = Counter(normalize(players[name].get('playerInitials', "")) for name in players)
+    table = {alias: name for alias, name in byInitials.items() if alias and initials[alias] == 1}
+    table.update(byName)
+    return {alias: name for alias, name in table.items() if names[alias] < 2}
+
+
+class RosterIndex:
+    """Team code -> the resolved names of its XI, for one teams.json and player data."""
+
+    def __init__(self, teams, players):
+        self.teams = teams
+        aliasTable = aliases(players)
+        self.names = {}
+        self.unresolved = []
+        for code, team in teams.items():
+            self.names[code] = []
+            for entry in team.get('players', []):
+                name = entry if entry in players else aliasTable.get(normalize(entry))
+                if name is None:
+                    self.unresolved.append((code, entry))
+                    name = entry
+                self.names[code].append(name)
+
+    def __contains__(self, code):
+        return code in self.names
+
+    def players(self, code):
+        return self.names[code]
+
+    def profiles(self, code):
+        """The compiled profiles (player_profiles) of `code`'s XI, in teams.json order."""
+        return player_profiles.get_profiles(self.names[code])
+
+
+def build(teamsFile=TEAMS_FILE, players=None):
+    with open(teamsFile, encoding='utf-8') as f:
+        teams = json.load(f)
+    roster = RosterIndex(teams, accessJSON.data if players is None else players)
+    for code, entry in roster.unresolved:
+        logging.warning(f"{teamsFile}: {code} player {entry!r} is not in the player data")
+    return roster
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def index(teamsFile=TEAMS_FILE):
+    """The RosterIndex of `teamsFile`, built on first use and again when it or the player data changes."""
+    path = os.path.abspath(teamsFile)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, accessJSON.version())
+    with _lock:
+        cached = _indexes.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = _indexes[path] = (stamp, build(teamsFile))
+    return cached[1]
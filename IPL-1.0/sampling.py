@@ -0,0 +1,60 @@
+import bisect
+import random
+
+# Discrete outcome sampling shared by mainconnect and MatchSimulator.
+#
+# draw() is for weights that change every ball (run denominations, dismissal
+# types): one uniform draw and a walk over the mapping, without building any
+# intermediate lists. Cumulative is for distributions that are sampled many
+# times without changing (e.g. who takes a catch this innings): O(log n) per
+# sample, consuming exactly one uniform draw like draw() does.
+
+
+def draw(weights, total=None, rng=random):
+    """Pick a key of `weights` with probability proportional to its value.
+
+    Each key owns the interval [start, start + weight) of [0, total), in
+    mapping order, and the first interval holding the draw wins - the same
+    rule the engines' old start/end lists used. Returns None if the draw falls
+    outside every interval, which can only happen when a weight has been
+    adjusted below zero.
+    """
+    if total is None:
+        total = sum(weights.values())
+    decider = rng.uniform(0, total)
+    last = 0
+    for key, weight in weights.items():
+        end = last + weight
+        if last <= decider < end:
+            return key
+        last = end
+    return None
+
+
+class Cumulative:
+    """Reusable distribution sampled by bisecting a cumulative weight array."""
+
+    __slots__ = ("keys", "cumulative", "total")
+
+    def __init__(self, keys, weights):
+        self.keys = tuple(keys)
+        cumulative = []
+        total = 0
+        for weight in weights:
+            if weight < 0:
+                raise ValueError(f"negative weight {weight!r}")
+            total += weight
+            cumulative.append(total)
+        if len(cumulative) != len(self.keys):
+            raise ValueError("keys and weights differ in length")
+        self.cumulative = tuple(cumulative)
+        self.total = total
+
+    @classmethod
+    def from_mapping(cls, weights):
+        return cls(weights.keys(), weights.values())
+
+    def sample(self, rng=random):
+        index = bisect.bisect_right(self.cumulative, rng.uniform(0, self.total))
+        return self.keys[min(index, len(self.keys) - 1)]
+
@@ -0,0 +1,102 @@
+from collections.abc import Mapping
+
+from tabulate import tabulate
+
+BATTING_HEADERS = ["Player", "Runs", "Balls", "SR" ,"Out"]
+BOWLING_HEADERS = ["Player", "Runs", "Overs", "Wickets", "Eco"]
+
+
+def batting_rows(batterTracker):
+    rows = []
+    for btckd in batterTracker:
+        localArrayTabulate = [btckd]
+        localArrayTabulate += [batterTracker[btckd]['runs'], batterTracker[btckd]['balls']]
+        sr_ = 'NA'
+        if(batterTracker[btckd]['balls'] != 0):
+            sr_ = (batterTracker[btckd]['runs']*100) / (batterTracker[btckd]['balls'])
+            sr_ = str(round(sr_, 2))
+            localArrayTabulate.append(sr_)
+        howOut = "DNB"
+        for b in batterTracker[btckd]['ballLog']:
+            if("W" in b):
+                if("CaughtBy" in b):
+                    splitOT = b.split("-")
+                    lcatcher = splitOT[2]
+                    lbowler = splitOT[-1]
+                    howOut = f"c {lcatcher} b {lbowler}"
+                elif("runout" in b):
+                    howOut = "Run out"
+                else:
+                    splitOT = b.split("-")
+                    howOut = f"{splitOT[1]} b {splitOT[-1]}"
+            else:
+                howOut = "Not out"
+        localArrayTabulate.append(howOut)
+        rows.append(localArrayTabulate)
+    return rows
+
+
+def bowling_rows(bowlerTracker):
+    rows = []
+    for btrack in bowlerTracker:
+        localBowlerTabulate = [btrack, bowlerTracker[btrack]['runs']]
+        remainder_balls = bowlerTracker[btrack]['balls'] % 6
+        number_overs = bowlerTracker[btrack]['balls'] // 6
+        localBowlerTabulate.append(f"{number_overs}.{remainder_balls}")
+        localBowlerTabulate.append(bowlerTracker[btrack]['wickets'])
+        econ_tb = "NA"
+        if(bowlerTracker[btrack]['balls'] != 0):
+            econ_tb = (bowlerTracker[btrack]['runs'] / bowlerTracker[btrack]['balls'])*6
+            econ_tb = str(round(econ_tb, 2))
+        localBowlerTabulate.append(econ_tb)
+        rows.append(localBowlerTabulate)
+    return rows
+
+
+def batting_card(batterTracker):
+    return tabulate(batting_rows(batterTracker), BATTING_HEADERS, tablefmt="grid")
+
+
+def bowling_card(bowlerTracker):
+    return tabulate(bowling_rows(bowlerTracker), BOWLING_HEADERS, tablefmt="grid")
+
+
+class MatchResult(Mapping):
+    """What mainconnect.game()/playMatch() return.
+
+    Reads like the dict it replaces (result["winMsg"], .get(), keys()), but the
+    four text scorecards ("innings1Batting", "innings1Bowling",
+    "innings2Batting", "innings2Bowling") are only rendered from the trackers
+    the first time they are read, then kept. A match played into a sink that
+    showed them (see output_sinks.py) hands over the grids it already printed.
+    """
+
+    CARDS = {
+        "innings1Batting": ("innings1Battracker", batting_card),
+        "innings1Bowling": ("innings1Bowltracker", bowling_card),
+        "innings2Batting": ("innings2Battracker", batting_card),
+        "innings2Bowling": ("innings2Bowltracker", bowling_card),
+    }
+
+    def __init__(self, fields, cards=None):
+        self._fields = dict(fields)
+        self._cards = dict(cards or {})
+
+    def __getitem__(self, key):
+        if key not in self.CARDS:
+            return self._fields[key]
+        if key not in self._cards:
+            trackerKey, render = self.CARDS[key]
+            self._cards[key] = render(self._fields[trackerKey])
+        return self._cards[key]
+
+    def __iter__(self):
+        yield from self._fields
+        yield from self.CARDS
+
+    def __len__(self):
+        return len(self._fields) + len(self.CARDS)
+
+    def rendered(self):
+        """Names of the scorecards rendered so far."""
+        return set(self._cards)
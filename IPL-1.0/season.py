@@ -0,0 +1,223 @@
+import argparse
+import os
+import random
+
+from tabulate import tabulate
+
+import mainconnect
+import output_sinks
+import pools
+
+# A whole season without a console: the league round robin and the playoffs
+# that doipl.py plays one keypress at a time, with no commentary.
+#
+# The league fixtures don't depend on each other, so they are shared out
+# over a process pool. Every match draws from its own stream derived from
+# the season seed and the fixture (seeding.py), so the results do not depend
+# on the number of workers or the order they finish in, and a season seed
+# plays the same matches as IPL_SEED=<seed> python doipl.py. The points
+# table and player aggregates are merged afterwards in fixture order, then
+# the playoffs (which do depend on each other) are played in this process.
+#
+#   python season.py --seed 7 --workers 8 --out scores
+#   python season.py --project 5000 --workers 8     (odds over many seasons)
+
+TEAMS = ['dc', 'csk', 'rcb', 'mi', 'kkr', 'pbks', 'rr', 'srh']
+
+# what the season tables need from a match; it is all a worker sends back
+MATCH_FIELDS = ("innings1BatTeam", "innings2BatTeam", "innings1Runs", "innings2Runs", "innings1Balls",
+                "innings2Balls", "winner", "winMsg", "innings1Battracker", "innings2Battracker",
+                "innings1Bowltracker", "innings2Bowltracker")
+
+
+def league_fixtures(teams=TEAMS):
+    """Every pair of teams once, in doipl.py's order."""
+    return [(teams[i], teams[j]) for i in range(len(teams)) for j in range(i + 1, len(teams))]
+
+
+def play(team1, team2, switch, seed):
+    """One match with no commentary or score file; the MATCH_FIELDS of its result."""
+    res = mainconnect.game(False, team1, team2, switch, seed=seed, sink=output_sinks.NullSink())
+    return {key: res[key] for key in MATCH_FIELDS}
+
+
+class SeasonTable:
+    """Points table and player aggregates, merged one match at a time as doipl.py does."""
+
+    def __init__(self, teams=TEAMS):
+        self.points = {team: {"P": 0, "W": 0, "L": 0, "T": 0, "runsScored": 0, "ballsFaced": 0,
+                              "runsConceded": 0, "ballsBowled": 0, "pts": 0} for team in teams}
+        self.batting = {}
+        self.bowling = {}
+
+    def add(self, team1, team2, res, league=True):
+        """Count a match; playoff matches (league=False) only go into the player aggregates."""
+        for key in ("innings1Battracker", "innings2Battracker"):
+            for player, tracker in res[key].items():
+                if player not in self.batting:
+                    self.batting[player] = {"runs": 0, "balls": 0, "ballLog": [], "innings": 0, "scoresArray": []}
+                c = self.batting[player]
+                c['balls'] += tracker['balls']
+                c['runs'] += tracker['runs']
+                c['ballLog'] += tracker['ballLog']
+                c['innings'] += 1
+                c['scoresArray'].append(int(tracker['runs']))
+        for key in ("innings1Bowltracker", "innings2Bowltracker"):
+            for player, tracker in res[key].items():
+                if player not in self.bowling:
+                    self.bowling[player] = {"runs": 0, "balls": 0, "ballLog": [], "wickets": 0, "matches": 0}
+                c = self.bowling[player]
+                c['balls'] += tracker['balls']
+                c['runs'] += tracker['runs']
+                c['ballLog'] += tracker['ballLog']
+                c['wickets'] += tracker['wickets']
+                c['matches'] += 1
+        if not league:
+            return
+
+        points = self.points
+        winner = res['winner']
+        for t in (team1, team2):
+            points[t]['P'] += 1
+        if winner == "tie":
+            for t in (team1, team2):
+                points[t]['T'] += 1
+                points[t]['pts'] += 1
+        else:
+            loser = team1 if winner == team2 else team2
+            points[winner]['W'] += 1
+            points[loser]['L'] += 1
+            points[winner]['pts'] += 2
+        teamA, teamB = res['innings1BatTeam'], res['innings2BatTeam']
+        points[teamA]['runsScored'] += res['innings1Runs']
+        points[teamB]['runsScored'] += res['innings2Runs']
+        points[teamA]['runsConceded'] += res['innings2Runs']
+        points[teamB]['runsConceded'] += res['innings1Runs']
+        points[teamA]['ballsFaced'] += res['innings1Balls']
+        points[teamB]['ballsFaced'] += res['innings2Balls']
+        points[teamA]['ballsBowled'] += res['innings2Balls']
+        points[teamB]['ballsBowled'] += res['innings1Balls']
+
+    def nrr(self, team):
+        data = self.points[team]
+        if data['ballsFaced'] == 0 or data['ballsBowled'] == 0:
+            return 0
+        return (data['runsScored'] / data['ballsFaced']) * 6 - (data['runsConceded'] / data['ballsBowled']) * 6
+
+    def standings(self):
+        """Teams by points, then net run rate."""
+        return sorted(self.points, key=lambda team: (self.points[team]['pts'], self.nrr(team)), reverse=True)
+
+    def points_card(self):
+        rows = [[team.upper(), self.points[team]['P'], self.points[team]['W'], self.points[team]['L'],
+                 self.points[team]['T'], round(self.nrr(team), 2), self.points[team]['pts']] for team in self.standings()]
+        return tabulate(rows, headers=["Team", "Played", "Won", "Lost", "Tied", "NRR", "Points"], tablefmt="grid")
+
+    def batting_card(self, top=None):
+        rows = []
+        for b, c in self.batting.items():
+            outs = sum(1 for bl in c['ballLog'] if "W" in bl)
+            avg = round(c['runs'] / outs, 2) if outs else "NA"
+            sr = round((c['runs'] / c['balls']) * 100, 2) if c['balls'] else "NA"
+            rows.append([b, c['innings'], c['runs'], avg, max(c['scoresArray']), sr, c['balls']])
+        rows = sorted(rows, key=lambda x: x[2], reverse=True)[:top]
+        return tabulate(rows, headers=["Player", "Innings", "Runs", "Average", "Highest", "SR", "Balls"], tablefmt="grid")
+
+    def bowling_card(self, top=None):
+        rows = []
+        for b, c in self.bowling.items():
+            overs = f"{c['balls'] // 6}.{c['balls'] % 6}" if c['balls'] else "0"
+            economy = round((c['runs'] / c['balls']) * 6, 2) if c['balls'] else "NA"
+            rows.append([b, c['wickets'], overs, c['runs'], economy])
+        rows = sorted(rows, key=lambda x: x[1], reverse=True)[:top]
+        return tabulate(rows, headers=["Player", "Wickets", "Overs", "Runs Conceded", "Economy"], tablefmt="grid")
+
+
+def playoffs(table, seed):
+    """Qualifier 1, Eliminator, Qualifier 2 and Final from the league standings.
+
+    Returns [(tag, team1, team2, result)] and the champion. A tied playoff
+    goes to the side placed higher in the league.
+    """
+    standings = table.standings()
+    first, second, third, fourth = standings[:4]
+    played = []
+
+    def match(team1, team2, tag):
+        res = play(team1, team2, tag, seed)
+        table.add(team1, team2, res, league=False)
+        played.append((tag, team1, team2, res))
+        winner = res['winner']
+        if winner == "tie":
+            winner = min(team1, team2, key=standings.index)
+        return winner, team2 if winner == team1 else team1
+
+    winnerQ1, loserQ1 = match(first, second, "Qualifier 1")
+    winnerElim, _ = match(third, fourth, "Eliminator")
+    winnerQ2, _ = match(winnerElim, loserQ1, "Qualifier 2")
+    champion, _ = match(winnerQ1, winnerQ2, "Final")
+    return played, champion
+
+
+def run_season(seed=None, workers=None, teams=TEAMS):
+    """Play a full season; a dict with the seed, the SeasonTable, the playoffs and the champion.
+
+    Without a seed one is drawn, and returned, so the season can be replayed.
+    `workers` processes play the league (one per CPU by default; 1 stays in
+    this process).
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    fixtures = league_fixtures(teams)
+    results = list(pools.run(play, [(team1, team2, "group", seed) for team1, team2 in fixtures],
+                             pools.worker_count(workers, len(fixtures))))
+    table = SeasonTable(teams)
+    for (team1, team2), res in zip(fixtures, results):
+        table.add(team1, team2, res)
+    played, champion = playoffs(table, seed)
+    return {"seed": seed, "league": list(zip(fixtures, results)), "table": table,
+            "playoffs": played, "champion": champion}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play a full IPL season without commentary.")
+    parser.add_argument("--seed", type=int, help="season seed (default: random, printed)")
+    parser.add_argument("--workers", type=int, help="processes for the league matches (default: one per CPU)")
+    parser.add_argument("--out", default="scores", help="directory for batStats.txt and bowlStats.txt")
+    parser.add_argument("--project", type=int, metavar="SEASONS",
+                        help="instead, project title and playoff odds over SEASONS seasons (projection.py)")
+    args = parser.parse_args(argv)
+
+    if args.project:
+        # imported here: projection builds on this module
+        import projection
+        projected = projection.project(args.project, args.workers, args.seed)
+        print(f"Projection seed {projected.seed}, {projected.seasons} seasons")
+        print(projected.card())
+        return projected
+
+    season = run_season(args.seed, args.workers)
+    table = season["table"]
+    print(f"Season seed {season['seed']}")
+    for (team1, team2), res in season["league"]:
+        print(f"{team1.upper()} vs {team2.upper()}: {res['winMsg']}")
+    print("\nPoints Table:")
+    print(table.points_card())
+    for tag, team1, team2, res in season["playoffs"]:
+        print(f"{tag}: {team1.upper()} vs {team2.upper()}: {res['winMsg']}")
+    print(f"\n{season['champion'].upper()} WINS THE IPL!!!")
+    print("\nTop 3 Batsmen:")
+    print(table.batting_card(top=3))
+    print("\nTop 3 Bowlers:")
+    print(table.bowling_card(top=3))
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "batStats.txt"), "w") as f:
+        print(table.batting_card(), file=f)
+    with open(os.path.join(args.out, "bowlStats.txt"), "w") as f:
+        print(table.bowling_card(), file=f)
+    return season
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import hashlib
+import random
+
+# Seeds for independent random streams. A season or batch run has one seed;
+# each match (or worker) gets its own stream derived from that seed and its
+# id, so a seed and a match id fully determine a scorecard whatever order or
+# process the matches run in, and no two matches share a stream.
+
+
+def derive_seed(seed, *key):
+    """64-bit seed for the stream named by `key` (match id, worker number...) under `seed`."""
+    text = "\x1f".join(str(part) for part in (seed,) + key)
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
+
+def match_rng(seed, *key):
+    """A random.Random for one match; seed=None keeps the shared `random` module."""
+    if seed is None:
+        return random
+    return random.Random(derive_seed(seed, *key))
@@ -0,0 +1,143 @@
+import unittest
+import os
+import sys
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import accessDB
+import accessJSON
+import mainconnect
+import output_sinks
+import player_profiles
+from accessDB import PlayerCache
+from match_simulator import MatchSimulator
+
+
+class FakeCollection:
+    """The part of a pymongo collection accessDB uses, over a list of documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query, projection):
+        self.queries.append((query, projection))
+        names = query["displayName"]["$in"]
+        fields = [field for field, keep in projection.items() if keep]
+        return [{field: doc[field] for field in fields if field in doc}
+                for doc in self.docs if doc["displayName"] in names]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class MongoTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = FakeCollection([dict(accessJSON.data[name], _id=i)
+                                          for i, name in enumerate(accessJSON.data)])
+        self.clock = Clock()
+        connection, cache = accessDB.connection, accessDB.cache
+        accessDB.connection = {accessDB.DATABASE: {accessDB.COLLECTION: self.collection}}
+        accessDB.cache = PlayerCache(ttl=60, clock=self.clock)
+        self.addCleanup(setattr, accessDB, "connection", connection)
+        self.addCleanup(setattr, accessDB, "cache", cache)
+
+
+class TestGetPlayers(MongoTestCase):
+
+    def test_one_projected_query_per_roster(self):
+        with open("teams/teams.json") as f:
+            roster = json.load(f)["csk"]["players"]
+        players = accessDB.getPlayers(roster + roster[:2])
+        self.assertEqual(len(self.collection.queries), 1)
+        query, projection = self.collection.queries[0]
+        self.assertEqual(query, {"displayName": {"$in": roster}})
+        self.assertEqual(set(players), set(roster))
+        for name in roster:
+            self.assertNotIn("byBatsman", players[name])
+            self.assertNotIn("_id", players[name])
+            self.assertEqual(players[name]["batRunsTotal"], accessJSON.data[name]["batRunsTotal"])
+
+        self.assertIs(accessDB.getPlayerInfo(roster[0]), players[roster[0]])
+        self.assertIsNone(accessDB.getPlayerInfo("NOBODY"))
+        self.assertEqual(len(self.collection.queries), 2)
+
+    def test_ttl_and_invalidate_start_a_new_version(self):
+        name = next(iter(accessJSON.data))
+        accessDB.getPlayers([name])
+        version = accessDB.version()
+        self.clock.now = 59
+        accessDB.getPlayers([name])
+        self.assertEqual((len(self.collection.queries), accessDB.version()), (1, version))
+
+        self.clock.now = 60
+        accessDB.getPlayers([name])
+        self.assertEqual((len(self.collection.queries), accessDB.version()), (2, version + 1))
+        accessDB.cache.invalidate()
+        accessDB.getPlayers([name])
+        self.assertEqual((len(self.collection.queries), accessDB.version()), (3, version + 2))
+
+    def test_a_fetch_from_before_an_invalidate_is_not_cached(self):
+        cache = accessDB.cache
+        version, _, missing = cache.lookup(["A"])
+        self.assertEqual(missing, ["A"])
+        cache.invalidate()
+        cache.store(version, {"A": {"displayName": "A"}})
+        self.assertEqual(cache.lookup(["A"])[1], {})
+
+
+class TestMongoBackend(MongoTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(player_profiles.use_backend, player_profiles.backend)
+
+    def play(self):
+        return mainconnect.game(False, "csk", "mi", seed=9, sink=output_sinks.NullSink())
+
+    def test_same_match_from_either_backend(self):
+        player_profiles.use_backend(accessJSON)
+        fromJSON = self.play()
+        player_profiles.use_backend(accessDB)
+        fromMongo = self.play()
+        self.assertEqual(len(self.collection.queries), 1)
+        self.assertEqual(fromMongo["winMsg"], fromJSON["winMsg"])
+        self.assertEqual(list(fromMongo["innings1Log"]), list(fromJSON["innings1Log"]))
+        self.assertEqual(list(fromMongo["innings2Log"]), list(fromJSON["innings2Log"]))
+
+        self.play()
+        self.assertEqual(len(self.collection.queries), 1)
+        accessDB.cache.invalidate()
+        self.play()
+        self.assertEqual(len(self.collection.queries), 2)
+
+    def test_match_simulator_reads_the_same_backend(self):
+        player_profiles.use_backend(accessJSON)
+        fromJSON = MatchSimulator("csk", "mi", seed=3)
+        player_profiles.use_backend(accessDB)
+        fromMongo = MatchSimulator("csk", "mi", seed=3)
+        self.assertEqual(len(self.collection.queries), 1)
+        for team in ("team1_players_stats", "team2_players_stats"):
+            # the projection leaves out the JSON's _id
+            self.assertEqual({name: {k: v for k, v in p.items() if k != "_id"} for name, p in getattr(fromJSON, team).items()},
+                             getattr(fromMongo, team))
+
+        MatchSimulator("csk", "mi")
+        self.assertEqual(len(self.collection.queries), 1)
+        accessDB.cache.invalidate()
+        MatchSimulator("csk", "mi")
+        self.assertEqual(len(self.collection.queries), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import os
+import random
+import sys
+
+import numpy as np
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import adjustments
+import batch_engine
+
+
+def draw(lo, hi):
+    # a fixed "random" value in [lo, hi), so both engines see the same draws
+    return lo + (hi - lo) * ((lo * 7.3 + hi * 3.1) % 1)
+
+
+class FixedRandom:
+    def uniform(self, lo, hi):
+        return draw(lo, hi)
+
+
+class TestAdjustments(unittest.TestCase):
+    """batch_engine's table lookups against adjustments.adjust(), the chain mainconnect runs."""
+
+    def assertTablesMatchChain(self, inningsNo, situations):
+        # situations: (balls, wickets, batBalls, batRuns, formOuts, runs, target)
+        k = len(situations)
+        start = np.array([[0.1 + 0.05 * j for j in range(7)]] * k)
+        den, outAvg = start.copy(), np.full(k, 0.05)
+        b, w, bb, batRuns, formOuts, r, target = (np.array(column, dtype=float) for column in zip(*situations))
+        sr = batRuns / np.maximum(bb, 1)
+        if inningsNo == 1:
+            rate, rrr = r / np.maximum(b, 1), None
+        else:
+            rate, rrr = None, (target - r) / (120 - b)
+        batch_engine._adjust(batch_engine.ADJUSTMENTS[inningsNo], lambda lo, hi: np.full(k, draw(lo, hi)),
+                             den, outAvg, b, w, bb, sr, formOuts, rate, rrr)
+
+        for i, (balls, wickets, batBalls, runsFaced, outs, runs, chase) in enumerate(situations):
+            chainDen = {str(j): start[i, j] for j in range(7)}
+            chainOut = adjustments.adjust(inningsNo, chainDen, 0.05, FixedRandom(), balls, wickets,
+                                          batBalls, runsFaced, outs, runs, chase)
+            situation = (inningsNo,) + situations[i]
+            self.assertEqual([chainDen[str(j)] for j in range(7)], list(den[i]), situation)
+            self.assertEqual(chainOut, outAvg[i], situation)
+
+    def test_random_situations(self):
+        r = random.Random(1)
+        for inningsNo in (1, 2):
+            situations = []
+            for _ in range(5000):
+                balls = r.randint(1, 119)
+                batBalls = r.randint(1, 60)
+                runs = r.randint(0, 2 * balls + 5)
+                target = runs + r.randint(1, 250) if inningsNo == 2 else None
+                situations.append((balls, r.randint(0, 9), batBalls, r.randint(0, 3 * batBalls),
+                                   r.randint(0, 5), runs, target))
+            self.assertTablesMatchChain(inningsNo, situations)
+
+    def test_ball_and_wicket_edges(self):
+        edges = (1, 11, 12, 35, 36, 60, 61, 79, 80, 85, 86, 101, 102, 103, 104, 105, 106, 119)
+        self.assertTablesMatchChain(1, [(balls, wickets, 10, 12, 1, balls, None)
+                                        for balls in edges for wickets in range(10)])
+        self.assertTablesMatchChain(2, [(balls, wickets, 10, 12, 1, balls, balls + 30)
+                                        for balls in edges for wickets in range(10)])
+
+    def test_strike_rate_edges(self):
+        situations = [(batBalls, sr, wickets) for batBalls in (7, 8, 15, 16, 20, 21, 30, 31, 40, 41)
+                      for sr in (0, 109, 110, 120, 135, 145, 146) for wickets in (4, 5)]
+        self.assertTablesMatchChain(1, [(50, wickets, batBalls, sr * batBalls, 2, 50, None)
+                                        for batBalls, sr, wickets in situations])
+        self.assertTablesMatchChain(2, [(50, wickets, batBalls, sr * batBalls, 2, 50, 120)
+                                        for batBalls, sr, wickets in situations])
+
+    def test_required_rate_edges(self):
+        # rrro = 6 * (target - runs) / (120 - balls), so target = rrro * (120 - balls) / 6
+        self.assertTablesMatchChain(2, [(balls, wickets, 10, 12, 0, 0, rrro * (120 - balls) / 6)
+                                        for rrro in (7.9, 8, 8.1, 10.4, 10.5, 11.9, 12, 12.1, 15, 15.1)
+                                        for balls in (30, 60, 90, 105) for wickets in (2, 4, 8)])
+
+    def test_tables_cover_every_bucket(self):
+        for inningsNo, table in adjustments.TABLES.items():
+            used = set()
+
+            def collect(node):
+                if isinstance(node, list):
+                    for child in node:
+                        collect(child)
+                else:
+                    used.add(node)
+
+            for part in (table.form, table.batter, table.team):
+                collect(part)
+            self.assertEqual(used, set(range(len(table.rules))), inningsNo)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import json
+import logging
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import ball_events
+import mainconnect
+import output_sinks
+from match_simulator import MatchSimulator
+
+
+class TestFromLogEntry(unittest.TestCase):
+
+    def entry(self, runs, wickets, bowl, bat=None):
+        entry = {"runs": runs, "wickets": wickets, "batsman": "AB", "bowler": "CD", "bowl": [0, 1, 0, [bowl]]}
+        if bat is not None:
+            entry["bat"] = [0, 1, [bat]]
+        return entry
+
+    def test_outcomes(self):
+        ball = ball_events.from_log_entry(1, "0.1", self.entry(4, 0, "1:4", "1:4"), 0)
+        self.assertEqual(ball, ball_events.Ball(1, "0.1", "AB", "CD", 4, None, None, 4, 0))
+        wide = ball_events.from_log_entry(1, "0.2", self.entry(5, 0, "1:WD"), 4)
+        self.assertEqual((wide.runs, wide.extra, wide.out), (1, "wide", None))
+        caught = ball_events.from_log_entry(2, "3.1", self.entry(5, 1, "19:W", "19:W-CaughtBy-EF-Bowler-CD"), 5)
+        self.assertEqual((caught.runs, caught.out, caught.wickets), (0, "caught", 1))
+        lbw = ball_events.from_log_entry(2, "3.2", self.entry(5, 2, "20:W", "20:W-lbw-Bowler-CD"), 5)
+        self.assertEqual(lbw.out, "lbw")
+        runOut = ball_events.from_log_entry(2, "3.3", self.entry(6, 3, "21:W1-runout", "21:1"), 5)
+        self.assertEqual((runOut.runs, runOut.out), (1, "runOut"))
+
+    def test_to_dict(self):
+        end = ball_events.MatchEnd("csk", "csk won by 5 runs", object())
+        self.assertEqual(ball_events.to_dict(end), {"type": "MatchEnd", "winner": "csk", "winMsg": "csk won by 5 runs"})
+
+
+class TestStreamGame(unittest.TestCase):
+
+    def test_events_follow_the_match(self):
+        events = list(mainconnect.streamGame("csk", "mi", seed=3))
+        res = mainconnect.game(False, "csk", "mi", seed=3, sink=output_sinks.NullSink())
+
+        self.assertEqual([type(e).__name__ for e in events if not isinstance(e, ball_events.Ball)],
+                         ["InningsEnd", "InningsEnd", "MatchEnd"])
+        ends = [e for e in events if isinstance(e, ball_events.InningsEnd)]
+        self.assertEqual(ends[0][1:4], (res["innings1BatTeam"], res["innings1Runs"], ends[0].wickets))
+        self.assertEqual((ends[1].team, ends[1].score, ends[1].balls),
+                         (res["innings2BatTeam"], res["innings2Runs"], res["innings2Balls"]))
+        self.assertEqual(events[-1][:2], (res["winner"], res["winMsg"]))
+        self.assertEqual(events[-1].result["innings1Battracker"], res["innings1Battracker"])
+
+        for inningsNo, end in ((1, ends[0]), (2, ends[1])):
+            balls = [e for e in events if isinstance(e, ball_events.Ball) and e.innings == inningsNo]
+            self.assertEqual(len(balls), len(res[f"innings{inningsNo}Log"]))
+            self.assertEqual(sum(b.runs for b in balls), end.score)
+            self.assertEqual(sum(1 for b in balls if b.out), end.wickets)
+            self.assertEqual(sum(1 for b in balls if not b.extra), end.balls)
+        json.dumps([ball_events.to_dict(e) for e in events])
+
+    def test_sink_gets_the_commentary(self):
+        sink = output_sinks.MemorySink()
+        for _ in mainconnect.streamGame("rr", "dc", seed=8, sink=sink):
+            pass
+        self.assertIn("Score:", sink.getvalue())
+
+
+class TestSimulatorStream(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_same_balls_as_simulate_one_ball(self):
+        stepped = MatchSimulator('csk', 'mi', seed=6)
+        stepped.perform_toss()
+        while not stepped.game_over:
+            stepped.simulate_one_ball()
+        events = list(MatchSimulator('csk', 'mi', seed=6).stream())
+
+        for inningsNo in (1, 2):
+            log = stepped.innings[inningsNo]['log']
+            balls = [e for e in events if isinstance(e, ball_events.Ball) and e.innings == inningsNo]
+            self.assertEqual(balls, [ball_events.from_simulator_entry(inningsNo, entry) for entry in log])
+        end = events[-1]
+        self.assertIsInstance(end, ball_events.MatchEnd)
+        self.assertEqual(end.winMsg, stepped.win_message)
+        self.assertEqual([e.score for e in events if isinstance(e, ball_events.InningsEnd)],
+                         [stepped.innings[1]['score'], stepped.innings[2]['score']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import random
+
+import numpy as np
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import batch_engine
+
+
+class TestBatchEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = batch_engine.simulate_fixture("csk", "mi", 2000, seed=7)
+
+    def test_innings_stay_within_the_rules(self):
+        for innings in (self.result.innings1, self.result.innings2):
+            self.assertTrue((innings["runs"] >= 0).all())
+            self.assertTrue((innings["wickets"] <= 10).all())
+            self.assertTrue((innings["balls"] <= 120).all())
+            # an innings only ends early when the side is all out (or the target is reached)
+            early = innings["balls"] < 120
+            if innings is self.result.innings1:
+                self.assertTrue((innings["wickets"][early] == 10).all())
+            # a draw that misses every interval still uses up the ball, as in getOutcome()
+            self.assertTrue((innings["batBalls"].sum(axis=1) <= innings["balls"]).all())
+
+    def test_chase_stops_at_the_target(self):
+        target = self.result.innings1["runs"] + 1
+        chase = self.result.innings2
+        # the winning ball can overshoot by at most a six (or a run-out's extra runs)
+        self.assertTrue((chase["runs"] <= target + 5).all())
+        unfinished = (chase["balls"] < 120) & (chase["wickets"] < 10)
+        self.assertTrue((chase["runs"][unfinished] >= target[unfinished]).all())
+
+    def test_winner_follows_the_scores(self):
+        r = self.result
+        team1Runs = np.where(r.team1BattedFirst, r.innings1["runs"], r.innings2["runs"])
+        team2Runs = np.where(r.team1BattedFirst, r.innings2["runs"], r.innings1["runs"])
+        expected = np.where(team1Runs > team2Runs, 0, np.where(team2Runs > team1Runs, 1, 2))
+        self.assertTrue((r.winner == expected).all())
+        self.assertAlmostEqual(sum(r.win_rates().values()), 1.0)
+
+    def test_same_seed_same_matches(self):
+        a = batch_engine.simulate_fixture("csk", "mi", 200, seed=3)
+        b = batch_engine.simulate_fixture("csk", "mi", 200, seed=3)
+        self.assertTrue((a.innings1["runs"] == b.innings1["runs"]).all())
+        self.assertTrue((a.innings2["runs"] == b.innings2["runs"]).all())
+        self.assertTrue((a.winner == b.winner).all())
+
+    def test_bowling_plan_quota_and_no_consecutive_overs(self):
+        team = batch_engine.load_team("csk")
+        plan = list(team.plan)
+        self.assertEqual(len(plan), 20)
+        for bowler in set(plan):
+            self.assertLessEqual(plan.count(bowler), 4)
+        for a, b in zip(plan, plan[1:]):
+            self.assertNotEqual(a, b)
+
+    def test_distribution_matches_mainconnect(self):
+        random.seed(11)
+        report = batch_engine.equivalence_check("csk", "mi", referenceGames=60, batchGames=4000, seed=11)
+        self.assertTrue(report["passed"], report)
+
+
+if __name__ == '__main__':
+    unittest.main()
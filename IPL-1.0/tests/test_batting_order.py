@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+from batting_order import BattingOrder
+from match_simulator import MatchSimulator
+
+
+class TestBattingOrder(unittest.TestCase):
+
+    def test_in_order_then_none(self):
+        lineup = BattingOrder(["a", "b", "c"])
+        self.assertEqual([lineup.next_batter() for _ in range(4)], ["a", "b", "c", None])
+        self.assertEqual(lineup.remaining(), 0)
+
+    def test_batter_already_in_is_skipped(self):
+        lineup = BattingOrder([{"id": n} for n in "abdcde"], key=lambda k: k["id"])
+        self.assertEqual([lineup.next_batter()["id"] for _ in range(5)], ["a", "b", "d", "c", "e"])
+        self.assertIsNone(lineup.next_batter())
+
+    def test_mainconnect_never_sends_a_batter_in_twice(self):
+        for seed in range(30):
+            result = mainconnect.game(False, "csk", "mi", "ordertest", seed=seed, sink=output_sinks.NullSink())
+            for key in ("innings1Log", "innings2Log"):
+                seen = []
+                for entry in result[key]:
+                    self.assertNotEqual(entry["batter1"], entry["batter2"])
+                    for ini in (entry["batter1"], entry["batter2"]):
+                        if ini not in seen:
+                            seen.append(ini)
+                self.assertLessEqual(len(seen), 11)
+                self.assertLessEqual(len(seen), entry["wickets"] + 2)
+
+    def test_match_simulator_shares_it(self):
+        sim = MatchSimulator("csk", "mi", seed=4)
+        sim.perform_toss()
+        team = sim.batting_team_code
+        self.assertIsInstance(sim.lineups[team], BattingOrder)
+        self.assertEqual([sim.current_batsmen['on_strike'], sim.current_batsmen['non_strike']], sim.batting_order[team][:2])
+        while not sim.game_over:
+            sim.simulate_one_ball()
+        batted = [ini for ini, t in sim.innings[1]['batting_tracker'].items() if t['how_out'] != 'Did Not Bat']
+        self.assertEqual(batted, sim.batting_order[team][:len(batted)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import benchmarks
+from benchmarks import metric
+
+
+def results(**metrics):
+    return {"benchmarks": {"game": metrics}}
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_regressions_follow_the_direction_of_each_metric(self):
+        baseline = results(matchesPerSec=metric(100, "matches/s", True), perBallUs=metric(10, "µs", False))
+        self.assertEqual(benchmarks.compare(results(matchesPerSec=metric(80, "matches/s", True),
+                                                    perBallUs=metric(12, "µs", False)), baseline), [])
+        slower = results(matchesPerSec=metric(70, "matches/s", True), perBallUs=metric(13, "µs", False))
+        self.assertEqual(benchmarks.compare(slower, baseline),
+                         [("game", "matchesPerSec", 100, 70), ("game", "perBallUs", 10, 13)])
+        self.assertEqual(benchmarks.compare(slower, baseline, tolerance=0.5), [])
+
+    def test_new_metrics_are_not_regressions(self):
+        self.assertEqual(benchmarks.compare(results(ballsPerSec=metric(1, "balls/s", True)), {"benchmarks": {}}), [])
+
+
+class TestRun(unittest.TestCase):
+
+    def test_results_are_json(self):
+        run = benchmarks.run(["game", "simulator"], scale=0.05)
+        self.assertEqual(set(run["benchmarks"]), {"game", "simulator"})
+        for metrics in run["benchmarks"].values():
+            for m in metrics.values():
+                self.assertGreater(m["value"], 0)
+        json.dumps(run)
+
+    def test_baseline_covers_every_benchmark(self):
+        with open(benchmarks.BASELINE) as f:
+            baseline = json.load(f)
+        self.assertEqual(set(baseline["benchmarks"]), set(benchmarks.BENCHMARKS))
+
+
+if __name__ == '__main__':
+    unittest.main()
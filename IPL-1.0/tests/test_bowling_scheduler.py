@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+import player_profiles
+from bowling_scheduler import BowlerScheduler
+
+
+def attack(code, size=7):
+    with open('teams/teams.json') as fl:
+        players = json.load(fl)[code]['players']
+    bowling = sorted((player_profiles.get_profile(p) for p in players), key=lambda k: k['bowlOutsRate'], reverse=True)
+    return bowling[0:size]
+
+
+class TestBowlerScheduler(unittest.TestCase):
+
+    def assertLegal(self, plan, quota=4):
+        for bowler in set(plan):
+            self.assertLessEqual(plan.count(bowler), quota)
+        for a, b in zip(plan, plan[1:]):
+            self.assertNotEqual(a, b)
+
+    def test_plan_is_legal_and_deterministic(self):
+        for code in ("csk", "mi", "rr"):
+            plan = BowlerScheduler(attack(code)).plan()
+            self.assertEqual(len(plan), 20)
+            self.assertLegal(plan)
+            self.assertEqual(plan, BowlerScheduler(attack(code)).plan())
+
+    def test_death_specialists_bowl_the_death(self):
+        scheduler = BowlerScheduler(attack("csk"))
+        plan = scheduler.plan()
+        death = {scheduler.bowlers[b] for b in scheduler.death}
+        self.assertTrue(set(plan[17:]) <= death)
+
+    def test_tight_quotas_still_finish(self):
+        # five bowlers with four overs each is exactly 20 overs
+        plan = BowlerScheduler(attack("mi", 5)).plan()
+        self.assertLegal(plan)
+        self.assertEqual(sorted(plan.count(b) for b in set(plan)), [4] * 5)
+
+    def test_resume_mid_innings(self):
+        bowling = attack("csk")
+        first = BowlerScheduler(bowling).plan()
+        bowled = {ini: first[:12].count(ini) for ini in set(first[:12])}
+        rest = BowlerScheduler(bowling, bowled=bowled, last=first[11]).plan(12)
+        self.assertEqual(rest[:12], [None] * 12)
+        self.assertLegal(first[:12] + rest[12:])
+
+    def test_expensive_bowler_loses_his_end(self):
+        scheduler = BowlerScheduler(attack("csk"))
+        opener = scheduler.pick(0)
+        scheduler.pick(1)
+        tracker = {ini: {'runs': 0, 'balls': 0} for ini in scheduler.bowlers}
+        tracker[opener] = {'runs': 20, 'balls': 6}
+        self.assertNotEqual(scheduler.pick(2, tracker), opener)
+
+    def test_match_quotas(self):
+        for seed in range(20):
+            result = mainconnect.game(False, "csk", "mi", "schedtest", seed=seed, sink=output_sinks.NullSink())
+            for key in ("innings1Bowltracker", "innings2Bowltracker"):
+                for tracker in result[key].values():
+                    self.assertLessEqual(tracker['balls'], 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import accessJSON
+import mainconnect
+import output_sinks
+import player_profiles
+import player_store
+import rosters
+from data_registry import DataRegistry
+
+
+class TestDataRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.playersFile = os.path.join(self.dir, "players.json")
+        self.teamsFile = os.path.join(self.dir, "teams.json")
+        shutil.copy(player_store.SOURCE, self.playersFile)
+        shutil.copy(rosters.TEAMS_FILE, self.teamsFile)
+        original = accessJSON.data
+        self.addCleanup(accessJSON.install, original)
+        self.registry = DataRegistry(self.playersFile, os.path.join(self.dir, "players.bin"), self.teamsFile,
+                                     interval=0.05)
+        self.addCleanup(self.registry.stop)
+        with open(self.playersFile) as f:
+            self.players = json.load(f)
+        with open(rosters.TEAMS_FILE) as f:
+            self.name = json.load(f)["csk"]["players"][0]
+
+    def edit_players(self, runs, outs=None):
+        self.players[self.name]["batRunsTotal"] = runs
+        if outs is not None:
+            for team in ("csk", "mi"):
+                for name in rosters.index().players(team):
+                    self.players[name]["batOutsTotal"] = outs
+        with open(self.playersFile, "w") as f:
+            json.dump(self.players, f)
+        st = os.stat(self.playersFile)
+        os.utime(self.playersFile, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    def test_reload_swaps_in_a_new_version(self):
+        self.assertFalse(self.registry.check())
+        before = self.registry.snapshot
+        self.assertEqual(before.version, accessJSON.version())
+        self.edit_players(123456)
+        self.assertTrue(self.registry.check())
+        after = self.registry.snapshot
+        self.assertEqual(after.version, before.version + 1)
+        self.assertEqual(accessJSON.version(), after.version)
+        self.assertNotEqual(after.dataHash, before.dataHash)
+        self.assertEqual(accessJSON.data[self.name]["batRunsTotal"], 123456)
+        self.assertEqual(player_profiles.get_profile(self.name)["batRunsTotal"], 123456)
+        self.assertFalse(self.registry.check())
+
+    def test_a_match_in_flight_keeps_its_data(self):
+        expected = mainconnect.game(False, "csk", "mi", seed=4, sink=output_sinks.NullSink())
+        events = mainconnect.streamGame("csk", "mi", seed=4)
+        next(events)
+        self.edit_players(0, outs=0)
+        self.registry.reload()
+        finished = list(events)[-1]
+        self.assertEqual(finished.winMsg, expected["winMsg"])
+        self.assertEqual(list(finished.result["innings1Log"]), list(expected["innings1Log"]))
+        self.assertEqual(list(finished.result["innings2Log"]), list(expected["innings2Log"]))
+
+        # the next match is played on the new data: no batsman ever gets out
+        after = mainconnect.game(False, "csk", "mi", seed=4, sink=output_sinks.NullSink())
+        self.assertNotEqual(list(after["innings2Log"]), list(expected["innings2Log"]))
+
+    def test_a_broken_file_keeps_the_loaded_data(self):
+        before = self.registry.snapshot
+        with open(self.teamsFile, "w") as f:
+            f.write("{")
+        self.edit_players(1)
+        with self.assertRaises(json.JSONDecodeError):
+            self.registry.check()
+        self.assertIs(self.registry.snapshot, before)
+        self.assertEqual(accessJSON.version(), before.version)
+
+    def test_watcher_picks_up_a_change(self):
+        before = self.registry.snapshot.version
+        self.registry.start()
+        self.edit_players(42)
+        deadline = time.monotonic() + 10
+        while self.registry.snapshot.version == before and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.registry.snapshot.version, before + 1)
+        self.assertEqual(accessJSON.data[self.name]["batRunsTotal"], 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+import threading
+
+# Same layout assumption as test_match_simulator.py: run from IPL-1.0/ so the
+# relative data/ and teams/ paths resolve.
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+
+RESULT_KEYS = {"innings1Batting", "innings1Bowling", "innings2Batting", "innings2Bowling", "innings2Balls",
+               "innings1Balls", "innings1Runs", "innings2Runs", "winMsg", "innings1Battracker",
+               "innings2Battracker", "innings1Bowltracker", "innings2Bowltracker", "innings1BatTeam",
+               "innings2BatTeam", "winner", "innings1Log", "innings2Log", "tossMsg"}
+
+
+class TestGame(unittest.TestCase):
+
+    def setUp(self):
+        self.score_files = []
+
+    def tearDown(self):
+        for path in self.score_files:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def play(self, team1, team2, switch):
+        self.score_files.append(f"scores/{team1}v{team2}_{switch}.txt")
+        return mainconnect.game(False, team1, team2, switch)
+
+    def assertConsistent(self, result):
+        self.assertEqual(set(result.keys()), RESULT_KEYS)
+        for inn in ("1", "2"):
+            log = result[f"innings{inn}Log"]
+            self.assertTrue(len(log) > 0)
+            self.assertEqual(log[-1]['runs'], result[f"innings{inn}Runs"])
+            bowled = sum(b['runs'] for b in result[f"innings{inn}Bowltracker"].values())
+            self.assertEqual(bowled, result[f"innings{inn}Runs"])
+        self.assertIn(result['innings1BatTeam'], ("csk", "mi"))
+        self.assertIn(result['winner'], ("csk", "mi", "tie"))
+
+    def test_game_result_shape(self):
+        result = self.play("csk", "mi", "test_shape")
+        self.assertConsistent(result)
+        self.assertFalse(hasattr(mainconnect, "innings1Log"), "match state should not live on the module")
+
+    def test_concurrent_games_do_not_share_state(self):
+        results = {}
+        errors = []
+        stdout_before = sys.stdout
+
+        def run(n):
+            try:
+                results[n] = self.play("csk", "mi", f"test_thread{n}")
+            except Exception as e: # surfaced through the assertion below
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 4)
+        for result in results.values():
+            self.assertConsistent(result)
+        self.assertIs(sys.stdout, stdout_before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+from match_log import InningsLog
+
+
+class TestInningsLog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.score_file = "scores/cskvmi_test_log.txt"
+        cls.result = mainconnect.game(False, "csk", "mi", "test_log")
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.path.exists(cls.score_file):
+            os.remove(cls.score_file)
+
+    def test_last_entry_rebuilds_final_trackers(self):
+        for inn in ("1", "2"):
+            log = self.result[f"innings{inn}Log"]
+            self.assertIsInstance(log, InningsLog)
+            bat, bowl = log.trackers_at(len(log) - 1)
+            self.assertEqual(bat, self.result[f"innings{inn}Battracker"])
+            self.assertEqual(bowl, self.result[f"innings{inn}Bowltracker"])
+
+    def test_innings_ends_with_a_checkpoint(self):
+        for inn in ("1", "2"):
+            log = self.result[f"innings{inn}Log"]
+            self.assertEqual(log.checkpoints[len(log) - 1],
+                             (self.result[f"innings{inn}Battracker"], self.result[f"innings{inn}Bowltracker"]))
+
+    def test_checkpoints_are_per_over(self):
+        for inn in ("1", "2"):
+            log = self.result[f"innings{inn}Log"]
+            self.assertIn(-1, log.checkpoints)
+            self.assertLessEqual(len(log.checkpoints), 21)
+
+    def test_log_serializes_compactly(self):
+        log = self.result["innings1Log"]
+        compact = len(json.dumps(log))
+        # every entry carrying full tracker copies, as the log used to
+        full = len(json.dumps([dict(entry, batterTracker=bat, bowlerTracker=bowl)
+                               for entry, (bat, bowl) in ((e, log.trackers_at(i)) for i, e in enumerate(log))]))
+        self.assertLess(compact * 5, full)
+        for entry in json.loads(json.dumps(log)):
+            for key in ("event", "balls", "runs", "wickets", "batsman", "batter1", "batter2", "bowler"):
+                self.assertIn(key, entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import os
+import sys
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import memory_budget
+
+
+class TestMemoryBudget(unittest.TestCase):
+
+    def test_measure(self):
+        peak, retained, kept = memory_budget.measure(lambda: [bytes(1000) for _ in range(100)])
+        self.assertGreaterEqual(retained, 100 * 1000)
+        self.assertGreaterEqual(peak, retained)
+        self.assertEqual(len(kept), 100)
+        peak, retained, _ = memory_budget.measure(lambda: len(bytes(10 ** 6)))
+        self.assertGreaterEqual(peak, 10 ** 6)
+        self.assertLess(retained, 10 ** 4)
+
+    def test_over_budget(self):
+        budget = {"game": {"peak": 100, "retained": 50}}
+        self.assertEqual(memory_budget.over_budget({"game": {"peak": 100, "retained": 40, "new": 1}}, budget), [])
+        self.assertEqual(memory_budget.over_budget({"game": {"peak": 101, "retained": 40}}, budget),
+                         [("game", "peak", 100, 101)])
+
+    def test_game_and_simulator_are_within_the_stored_budget(self):
+        with open(memory_budget.BUDGET) as f:
+            budget = json.load(f)
+        self.assertEqual(set(budget), set(memory_budget.CASES))
+        results = memory_budget.run(["game", "simulator"])
+        self.assertEqual(memory_budget.over_budget(results, budget), [])
+        for metrics in results.values():
+            self.assertGreater(metrics["retainedPerBall"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+import seeding
+
+
+def play(sink, seed=7):
+    return mainconnect.playMatch(mainconnect.MatchContext(sink, rng=seeding.match_rng(seed, "csk", "mi")), "csk", "mi", "dusty")
+
+
+class TestOutputSinks(unittest.TestCase):
+
+    def test_memory_sink_keeps_the_text(self):
+        sink = output_sinks.MemorySink()
+        result = play(sink)
+        text = sink.getvalue()
+        self.assertIn("won the toss", text)
+        self.assertIn(result["innings1Batting"], text)
+        self.assertIn(result["innings2Bowling"], text)
+
+    def test_null_sink_skips_rendering(self):
+        quiet = play(output_sinks.NullSink())
+        loud = play(output_sinks.MemorySink())
+        self.assertEqual(quiet.rendered(), set())
+        for key in ("innings1Runs", "innings2Runs", "winMsg", "innings1Battracker", "innings2Bowltracker",
+                    "innings1Batting", "innings2Bowling"):
+            self.assertEqual(quiet[key], loud[key])
+        self.assertEqual([e["event"] for e in quiet["innings2Log"]], [e["event"] for e in loud["innings2Log"]])
+
+    def test_buffered_file_sink_replaces_on_close(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "score.txt")
+            with open(path, "w") as f:
+                f.write("old")
+            with output_sinks.BufferedFileSink(path) as sink:
+                print("new", file=sink)
+                with open(path) as f:
+                    self.assertEqual(f.read(), "old")
+            with open(path) as f:
+                self.assertEqual(f.read(), "new\n")
+
+            with self.assertRaises(RuntimeError):
+                with output_sinks.BufferedFileSink(path) as sink:
+                    print("half", file=sink)
+                    raise RuntimeError
+            with open(path) as f:
+                self.assertEqual(f.read(), "new\n")
+            self.assertEqual(os.listdir(tmp), ["score.txt"])
+
+    def test_game_with_sink_writes_no_file(self):
+        path = "scores/cskvmi_sinktest.txt"
+        self.addCleanup(lambda: os.path.exists(path) and os.remove(path))
+        sink = output_sinks.MemorySink()
+        result = mainconnect.game(False, "csk", "mi", "sinktest", seed=3, sink=sink)
+        self.assertFalse(os.path.exists(path))
+        self.assertIn(result["innings1Batting"], sink.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import os
+import sys
+import json
+import logging
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import player_profiles
+from match_simulator import MatchSimulator
+from pair_matrix import PairMatrix, base_pair
+
+
+def profiles(code):
+    with open('teams/teams.json') as fl:
+        players = json.load(fl)[code]['players']
+    return {p: player_profiles.get_profile(p) for p in players}
+
+
+class TestPairMatrix(unittest.TestCase):
+
+    def test_lookup_and_get(self):
+        matrix = PairMatrix({"a": 1, "b": 2}, {"x": 10, "y": 20}, lambda bat, bowl: bat + bowl)
+        self.assertEqual(matrix["b", "x"], 12)
+        self.assertEqual(matrix.get("a", "y"), 21)
+        self.assertIsNone(matrix.get("c", "y"))
+        self.assertEqual(matrix.get("a", "z", 0), 0)
+        with self.assertRaises(KeyError):
+            matrix["a", "z"]
+
+    def test_base_pair_averages_with_the_pitch_effect(self):
+        batter = next(iter(profiles("csk").values()))
+        bowler = next(iter(profiles("mi").values()))
+        flat = base_pair(batter, bowler, 1, 1.0)
+        for key in batter['batRunDenominationsObject']:
+            self.assertEqual(flat.den[key], (batter['batRunDenominationsObject'][key] + bowler['bowlRunDenominationsObject'][key]) / 2)
+        self.assertEqual(flat.out, (batter['batOutsRate'] + bowler['bowlOutsRate']) / 2)
+
+        # a spinning pitch (spin < 1) helps the bowler, more in the first innings
+        turning = base_pair(batter, bowler, 1, 0.8)
+        self.assertGreater(turning.out, flat.out)
+        self.assertLess(turning.den['6'], flat.den['6'])
+        self.assertGreater(turning.out, base_pair(batter, bowler, 2, 0.8).out)
+        self.assertIn('runOut', turning.outTypes)
+
+    def test_profiles_are_left_alone(self):
+        batter = next(iter(profiles("rr").values()))
+        bowler = next(iter(profiles("mi").values()))
+        before = json.dumps([batter, bowler], sort_keys=True)
+        pair = base_pair(batter, bowler, 2, 0.7)
+        pair.den['0'] += 1
+        self.assertEqual(json.dumps([batter, bowler], sort_keys=True), before)
+
+
+class TestSimulatorPairs(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_matrix_matches_direct_computation(self):
+        sim = MatchSimulator('csk', 'mi', pitch_factors={'pace': 0.85, 'spin': 1.2, 'outfield': 0.9}, seed=1)
+        for batting, bowling in ((sim.team1_code, sim.team2_players_stats), (sim.team2_code, sim.team1_players_stats)):
+            batting_pool = sim.team1_players_stats if batting == sim.team1_code else sim.team2_players_stats
+            matrix = sim.pair_matrices[batting]
+            for batter in sim.batting_order[batting]:
+                for bowler in matrix.bowlers:
+                    self.assertEqual(matrix[batter, bowler], sim._base_probabilities(batting_pool[batter], bowling[bowler]))
+
+    def test_matrix_is_not_changed_by_playing(self):
+        sim = MatchSimulator('csk', 'mi', seed=2)
+        before = json.dumps(sim.pair_matrices[sim.team1_code].rows)
+        sim.perform_toss()
+        while not sim.game_over:
+            sim.simulate_one_ball()
+        self.assertEqual(json.dumps(sim.pair_matrices[sim.team1_code].rows), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import logging
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+from match_simulator import MatchSimulator
+from phase_timer import PhaseTimer
+
+
+class TestPhaseTimer(unittest.TestCase):
+
+    def test_wrap_report_and_merge(self):
+        timer = PhaseTimer()
+        double = timer.wrap("double", lambda x: 2 * x)
+        self.assertEqual(double(4), 8)
+        start = timer.snapshot()
+        double(1)
+        double(2)
+        self.assertEqual(timer.report()["double"]["calls"], 3)
+        self.assertEqual(timer.report(since=start)["double"]["calls"], 2)
+        self.assertGreaterEqual(timer.report()["double"]["seconds"], 0)
+
+        other = PhaseTimer()
+        other.wrap("double", lambda x: 2 * x)(0)
+        other.wrap("half", lambda x: x / 2)(0)
+        timer.merge(other)
+        self.assertEqual({k: v["calls"] for k, v in timer.report().items()}, {"double": 4, "half": 1})
+        self.assertIn("double", timer.card())
+
+
+class TestTimedGame(unittest.TestCase):
+
+    def play(self, seed, timer=None, sink=None):
+        return mainconnect.game(False, "csk", "mi", seed=seed, sink=sink or output_sinks.NullSink(), timer=timer)
+
+    def test_untimed_match_calls_the_stages_directly(self):
+        ctx = mainconnect.MatchContext(output_sinks.NullSink())
+        self.assertIs(ctx.stage("draw", len), len)
+        self.assertNotIn("phaseTimes", self.play(5))
+
+    def test_timed_match(self):
+        timer = PhaseTimer()
+        first = self.play(5, timer)
+        second = self.play(6, timer)
+        self.assertEqual(first["winMsg"], self.play(5)["winMsg"])
+        self.assertEqual(list(first["innings2Log"]), list(self.play(5)["innings2Log"]))
+
+        times = first["phaseTimes"]
+        balls = len(first["innings1Log"]) + len(first["innings2Log"])
+        self.assertEqual(times["delivery"]["calls"], balls)
+        self.assertEqual(times["record"]["calls"], balls)
+        self.assertEqual(times["adjust"]["calls"], balls)
+        self.assertNotIn("output", times)
+        self.assertLessEqual(times["adjust"]["seconds"], times["delivery"]["seconds"])
+        for stage, total in timer.report().items():
+            self.assertEqual(total["calls"], times[stage]["calls"] + second["phaseTimes"][stage]["calls"])
+
+    def test_output_is_timed_for_a_sink_that_shows_it(self):
+        timed, plain = output_sinks.MemorySink(), output_sinks.MemorySink()
+        res = self.play(7, PhaseTimer(), timed)
+        self.play(7, sink=plain)
+        self.assertEqual(timed.getvalue(), plain.getvalue())
+        self.assertGreater(res["phaseTimes"]["output"]["calls"], 0)
+        self.assertEqual(res["phaseTimes"]["cards"]["calls"], 4)
+
+
+class TestTimedSimulator(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_same_balls_with_a_timer(self):
+        timer = PhaseTimer()
+        timed, plain = MatchSimulator('rr', 'dc', seed=3, timer=timer), MatchSimulator('rr', 'dc', seed=3)
+        for sim in (timed, plain):
+            sim.perform_toss()
+            while not sim.game_over:
+                sim.simulate_one_ball()
+        self.assertEqual(timed.innings, plain.innings)
+        report = timer.report()
+        balls = len(plain.innings[1]['log']) + len(plain.innings[2]['log'])
+        self.assertEqual(report["ball"]["calls"], balls)
+        self.assertEqual(report["gameState"]["calls"], balls)
+        self.assertEqual(report["probabilities"]["calls"], balls)
+        self.assertIn("selectBowler", report)
+
+
+if __name__ == '__main__':
+    unittest.main()
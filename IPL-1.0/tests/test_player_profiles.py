@@ -0,0 +1,80 @@
+import unittest
+import os
+import sys
+import copy
+import json
+import pickle
+import random
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import accessJSON
+import mainconnect
+import player_profiles
+from player_profiles import PlayerProfile, FrozenDict
+
+
+class TestPlayerProfiles(unittest.TestCase):
+
+    def setUp(self):
+        self.name = next(iter(accessJSON.data))
+        self.raw = accessJSON.getPlayerInfo(self.name)
+        self.profile = player_profiles.get_profile(self.name)
+
+    def test_rates_are_precompiled(self):
+        p = self.profile
+        self.assertIsInstance(p, PlayerProfile)
+        self.assertEqual(p['batBallsTotal'], self.raw['batBallsTotal'] + 1)
+        self.assertEqual(p['bowlBallsTotal'], self.raw['bowlBallsTotal'] + 1)
+        self.assertAlmostEqual(p['batOutsRate'], self.raw['batOutsTotal'] / (self.raw['batBallsTotal'] + 1))
+        self.assertAlmostEqual(p['bowlWideRate'], self.raw['bowlWides'] / (self.raw['bowlBallsTotal'] + 1))
+        self.assertEqual(list(p['batRunDenominationsObject']), list(self.raw['batRunDenominations']))
+        self.assertEqual(list(p['overNumbersObject'])[0], "20")
+        self.assertIn('posAvg', p)
+
+    def test_profiles_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.profile['batOutsRate'] = 1
+        with self.assertRaises(TypeError):
+            self.profile['bowlRunDenominationsObject']['0'] += 1
+        with self.assertRaises(TypeError):
+            self.profile.update({'matches': 0})
+        self.assertIsInstance(self.profile['bowlOutTypesObject'], FrozenDict)
+
+    def test_copies_share_and_pickle(self):
+        self.assertIs(copy.deepcopy(self.profile), self.profile)
+        restored = pickle.loads(pickle.dumps(self.profile))
+        self.assertIsInstance(restored, PlayerProfile)
+        self.assertEqual(restored, self.profile)
+        json.dumps(self.profile)
+
+    def test_games_leave_source_data_untouched(self):
+        with open("data/playerInfoProcessed.json") as f:
+            fresh = json.load(f)
+        try:
+            for seed in (1, 1):
+                random.seed(seed)
+                mainconnect.game(False, "csk", "mi", "test_profiles")
+        finally:
+            if os.path.exists("scores/cskvmi_test_profiles.txt"):
+                os.remove("scores/cskvmi_test_profiles.txt")
+        self.assertEqual(accessJSON.data, fresh)
+
+    def test_same_seed_same_match(self):
+        results = []
+        try:
+            for _ in range(2):
+                random.seed(7)
+                r = mainconnect.game(False, "csk", "mi", "test_profiles")
+                results.append((r['innings1Runs'], r['innings2Runs'], r['winMsg'], r['innings1Battracker']))
+        finally:
+            if os.path.exists("scores/cskvmi_test_profiles.txt"):
+                os.remove("scores/cskvmi_test_profiles.txt")
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
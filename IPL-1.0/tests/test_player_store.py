@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import player_store
+from player_store import PlayerStore
+
+
+class TestPlayerStore(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.source = os.path.join(self.dir, "players.json")
+        self.store = os.path.join(self.dir, "players.bin")
+        shutil.copy(player_store.SOURCE, self.source)
+        with open(self.source) as f:
+            self.players = json.load(f)
+
+    def test_reads_back_as_the_json(self):
+        store = PlayerStore(player_store.build(self.source, self.store))
+        self.assertEqual(list(store), list(self.players))
+        self.assertEqual(len(store), len(self.players))
+        for name, player in self.players.items():
+            self.assertEqual(store[name], player)
+            self.assertEqual(list(store[name]), list(player))
+        self.assertNotIn("NOBODY", store)
+        with self.assertRaises(KeyError):
+            store["NOBODY"]
+
+    def test_lookups_are_fresh_dicts(self):
+        store = PlayerStore(player_store.build(self.source, self.store))
+        name = next(iter(store))
+        store[name]["batRunsTotal"] = -5
+        store[name]["position"].append(1)
+        self.assertEqual(store[name], self.players[name])
+
+    def test_summary_leaves_out_the_breakdowns(self):
+        store = PlayerStore(player_store.build(self.source, self.store))
+        for name, player in self.players.items():
+            expected = {k: v for k, v in player.items() if k not in player_store.BREAKDOWNS}
+            self.assertEqual(store.summary(name), expected)
+
+    def test_fields_the_columns_do_not_fit_are_kept_as_json(self):
+        self.players = {"A": {"matches": 3, "batStyle": "rhb", "overNumbers": ["1", "20"], "position": [0, "null"],
+                              "batOutTypes": {"caught": 1, "bowled": 0}, "byBowler": {"x": {"y": 1.5}}},
+                        "B": {"batStyle": "lhb", "matches": 1, "overNumbers": [], "position": [],
+                              "batOutTypes": {"caught": 0, "bowled": 2}, "extra": None}}
+        with open(self.source, "w") as f:
+            json.dump(self.players, f)
+        store = PlayerStore(player_store.build(self.source, self.store))
+        self.assertEqual(dict(store.items()), self.players)
+        self.assertEqual(list(store["B"]), list(self.players["B"]))
+
+    def test_load_rebuilds_a_stale_store(self):
+        first = player_store.load(self.source, self.store)
+        self.assertIsInstance(first, PlayerStore)
+        name = next(iter(self.players))
+        self.players[name]["matches"] += 1
+        with open(self.source, "w") as f:
+            json.dump(self.players, f)
+        second = player_store.load(self.source, self.store)
+        self.assertNotEqual(first.source, second.source)
+        self.assertEqual(second[name], self.players[name])
+
+        with open(self.store, "wb") as f:
+            f.write(b"not a store")
+        self.assertEqual(player_store.load(self.source, self.store)[name], self.players[name])
+
+    def test_load_hashes_the_json_only_when_its_stamp_changes(self):
+        player_store.load(self.source, self.store)
+        hashed = []
+        original = player_store.source_hash
+        player_store.source_hash = lambda path: hashed.append(path) or original(path)
+        self.addCleanup(setattr, player_store, "source_hash", original)
+
+        self.assertIsInstance(player_store.load(self.source, self.store), PlayerStore)
+        self.assertEqual(hashed, [])
+        # touched but unchanged: hashed, and the store is still used as built
+        built = os.stat(self.store).st_mtime_ns
+        st = os.stat(self.source)
+        os.utime(self.source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        self.assertIsInstance(player_store.load(self.source, self.store), PlayerStore)
+        self.assertEqual(hashed, [self.source])
+        self.assertEqual(os.stat(self.store).st_mtime_ns, built)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import pools
+
+
+class TestPools(unittest.TestCase):
+
+    def test_worker_count(self):
+        self.assertEqual(pools.worker_count(4, 2), 2)
+        self.assertEqual(pools.worker_count(4, 0), 1)
+        self.assertEqual(pools.worker_count(None, 1000), min(os.cpu_count() or 1, 1000))
+
+    def test_same_results_in_process_and_over_a_pool(self):
+        jobs = [(2, n) for n in range(7)]
+        self.assertEqual(list(pools.run(pow, jobs, 1)), [2 ** n for n in range(7)])
+        self.assertEqual(list(pools.run(pow, jobs, 2)), [2 ** n for n in range(7)])
+
+
+if __name__ == '__main__':
+    unittest.main()
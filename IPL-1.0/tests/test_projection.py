@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import projection
+
+
+class TestProjection(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.projected = projection.project(seasons=12, workers=1, seed=4, chunkSize=6)
+        cls.report = cls.projected.report()
+
+    def test_every_season_is_counted_once(self):
+        self.assertEqual(self.projected.seasons, 12)
+        counts = self.projected.counts
+        for key in ("points", "position", "outcome", "nrr"):
+            self.assertTrue((counts[key].sum(axis=1) == 12).all(), key)
+        # one team per league position per season
+        self.assertTrue((counts["position"].sum(axis=0) == 12).all())
+
+    def test_odds_add_up(self):
+        r = self.report
+        self.assertAlmostEqual(sum(t["playoffs"]["title"] for t in r.values()), 1)
+        self.assertAlmostEqual(sum(t["playoffs"]["final"] for t in r.values()), 2)
+        self.assertAlmostEqual(sum(t["playoffs"]["top4"] for t in r.values()), 4)
+        # 28 league matches, two points each
+        self.assertAlmostEqual(sum(t["points"]["mean"] for t in r.values()), 56)
+        self.assertAlmostEqual(sum(t["position"]["mean"] for t in r.values()), 36)
+        for team in r.values():
+            self.assertLessEqual(team["playoffs"]["title"], team["playoffs"]["final"])
+            self.assertLessEqual(team["playoffs"]["final"], team["playoffs"]["top4"])
+            self.assertLessEqual(team["points"]["p10"], team["points"]["p90"])
+
+    def test_pool_gives_the_same_counts(self):
+        pooled = projection.project(seasons=12, workers=2, seed=4, chunkSize=6)
+        for key, value in self.projected.counts.items():
+            np.testing.assert_array_equal(pooled.counts[key], value)
+
+    def test_card(self):
+        card = self.projected.card()
+        for team in projection.TEAMS:
+            self.assertIn(team.upper(), card)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+from recent_form import RecentForm, DEFAULT_WINDOW
+
+
+class TestRecentForm(unittest.TestCase):
+
+    def test_totals_follow_the_window(self):
+        form = RecentForm(3)
+        for runs, out in [(4, False), (0, True), (6, False), (1, False), (0, False)]:
+            form.record(runs, out)
+        # only (6), (1), (0) are left in the window
+        self.assertEqual((form.runs, form.outs, len(form)), (7, 0, 3))
+
+    def test_matches_a_rescan_of_the_last_n_balls(self):
+        balls = [(r % 7 if r % 7 != 5 else 0, r % 9 == 0) for r in range(120)]
+        form = RecentForm(DEFAULT_WINDOW)
+        for i, (runs, out) in enumerate(balls):
+            form.record(runs, out)
+            last = balls[max(0, i + 1 - DEFAULT_WINDOW):i + 1]
+            self.assertEqual(form.runs, sum(r for r, _ in last))
+            self.assertEqual(form.outs, sum(o for _, o in last))
+
+    def test_unbounded_window(self):
+        form = RecentForm(None)
+        for _ in range(50):
+            form.record(1, True)
+        self.assertEqual((form.runs, form.outs), (50, 50))
+
+    def test_rejects_empty_window(self):
+        with self.assertRaises(ValueError):
+            RecentForm(0)
+
+    def test_game_accepts_a_form_window(self):
+        try:
+            for window in (6, None):
+                result = mainconnect.game(False, "csk", "mi", "test_form", formWindow=window)
+                self.assertEqual(result['innings1Log'][-1]['runs'], result['innings1Runs'])
+        finally:
+            if os.path.exists("scores/cskvmi_test_form.txt"):
+                os.remove("scores/cskvmi_test_form.txt")
+
+
+if __name__ == '__main__':
+    unittest.main()
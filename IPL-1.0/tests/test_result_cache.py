@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+import result_cache
+from result_cache import ResultCache
+
+
+class TestKey(unittest.TestCase):
+
+    def test_every_input_changes_the_key(self):
+        base = result_cache.key("csk", "mi", 1, dataHash="d")
+        self.assertEqual(base, result_cache.key("csk", "mi", 1, dataHash="d"))
+        others = [result_cache.key("mi", "csk", 1, dataHash="d"), result_cache.key("csk", "mi", 2, dataHash="d"),
+                  result_cache.key("csk", "mi", 1, switch="webapp", dataHash="d"),
+                  result_cache.key("csk", "mi", 1, pitch="green", dataHash="d"),
+                  result_cache.key("csk", "mi", 1, pitch={"pace": 0.9, "spin": 1.1}, dataHash="d"),
+                  result_cache.key("csk", "mi", 1, formWindow=6, dataHash="d"),
+                  result_cache.key("csk", "mi", 1, dataHash="e")]
+        with mock.patch.object(result_cache, "ENGINE_VERSION", result_cache.ENGINE_VERSION + 1):
+            others.append(result_cache.key("csk", "mi", 1, dataHash="d"))
+        self.assertEqual(len(set(others + [base])), len(others) + 1)
+
+    def test_data_hash_follows_the_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "players.json")
+            with open(path, "w") as f:
+                f.write("{}")
+            before = result_cache.data_hash([path])
+            self.assertEqual(result_cache.data_hash([path]), before)
+            with open(path, "w") as f:
+                f.write('{"a": 1}')
+            self.assertNotEqual(result_cache.data_hash([path]), before)
+
+    def test_data_hash_does_not_depend_on_the_working_directory(self):
+        here = result_cache.data_hash()
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                self.assertEqual(result_cache.data_hash(), here)
+                self.assertEqual(result_cache.key("csk", "mi", 1), result_cache.key("csk", "mi", 1, dataHash=here))
+            finally:
+                os.chdir(cwd)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_memory_lru(self):
+        cache = ResultCache(entries=2)
+        cache.put("a", {"runs": 1})
+        cache.put("b", {"runs": 2})
+        cache.get("a")
+        cache.put("c", {"runs": 3})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"runs": 1})
+        self.assertEqual(cache.hits["memory"], 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_every_get_is_a_fresh_copy(self):
+        cache = ResultCache()
+        cache.put("a", {"log": [{"runs": 4}]})
+        cache.get("a")["log"][0]["winProbability"] = 0.5
+        self.assertEqual(cache.get("a"), {"log": [{"runs": 4}]})
+
+    def test_disk_tier_and_size_eviction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(entries=1, directory=tmp, maxBytes=2500)
+            for k in ("a", "b"):
+                cache.put(k, "x" * 1000)
+            # a fresh process sees what was written
+            self.assertEqual(ResultCache(directory=tmp).get("a"), "x" * 1000)
+            os.utime(os.path.join(tmp, "b.pkl"), ns=(0, 0))
+            cache.put("c", "x" * 1000)
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.pkl", "c.pkl"])
+            self.assertNotIn("b", cache)
+            self.assertIn("a", cache)
+
+
+class TestCachedGame(unittest.TestCase):
+
+    def test_seeded_match_is_played_once(self):
+        cache = ResultCache()
+        first = result_cache.game(cache, "csk", "mi", "webapp", seed=9)
+        played = mainconnect.game(False, "csk", "mi", "webapp", seed=9, sink=output_sinks.NullSink())
+        self.assertEqual(first["winMsg"], played["winMsg"])
+        with mock.patch.object(mainconnect, "game", side_effect=AssertionError("played again")):
+            again = result_cache.game(cache, "csk", "mi", "webapp", seed=9)
+        self.assertEqual(dict(again), dict(first))
+        self.assertEqual(list(again["innings2Log"]), list(played["innings2Log"]))
+        self.assertEqual(again["innings1Batting"], played["innings1Batting"])
+
+    def test_unseeded_match_is_not_stored(self):
+        cache = ResultCache()
+        result_cache.game(cache, "rr", "dc", "webapp")
+        self.assertEqual(len(cache._memory), 0)
+
+    def test_precompute(self):
+        cache = ResultCache()
+        self.assertEqual(result_cache.precompute(cache, [("rr", "dc")], range(2), "webapp"), 2)
+        self.assertEqual(result_cache.precompute(cache, [("rr", "dc")], range(3), "webapp"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
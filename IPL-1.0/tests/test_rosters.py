@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import rosters
+from rosters import RosterIndex
+
+PLAYERS = {
+    "RINKU SINGH": {"playerInitials": "R SINGH"},
+    "Rinku Singh": {"playerInitials": "RK SINGH"},
+    "MS Dhoni": {"playerInitials": "MS DHONI"},
+    "Ravindra Jadeja": {"playerInitials": "R JADEJA"},
+    "Rohit Sharma": {"playerInitials": "R SHARMA"},
+    "Ishant Sharma": {"playerInitials": "R SHARMA"},
+}
+
+
+class TestRosterIndex(unittest.TestCase):
+
+    def test_entries_resolve_through_the_aliases(self):
+        teams = {"csk": {"players": ["RINKU SINGH", "Rinku Singh", "  ms   DHONI ", "r jadeja"]}}
+        roster = RosterIndex(teams, PLAYERS)
+        self.assertEqual(roster.players("csk"), ["RINKU SINGH", "Rinku Singh", "MS Dhoni", "Ravindra Jadeja"])
+        self.assertEqual(roster.unresolved, [])
+        self.assertIn("csk", roster)
+
+    def test_shared_aliases_are_not_guessed(self):
+        teams = {"mi": {"players": ["rinku singh", "R SHARMA", "Rohit Sharma"]}}
+        roster = RosterIndex(teams, PLAYERS)
+        self.assertEqual(roster.players("mi"), ["rinku singh", "R SHARMA", "Rohit Sharma"])
+        self.assertEqual(roster.unresolved, [("mi", "rinku singh"), ("mi", "R SHARMA")])
+
+    def test_unresolved_players_are_reported_when_built(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "teams.json")
+        with open(path, "w") as f:
+            json.dump({"csk": {"players": ["MS Dhoni", "Nobody"]}}, f)
+        with self.assertLogs(level="WARNING") as logs:
+            roster = rosters.build(path, PLAYERS)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("'Nobody'", logs.output[0])
+        self.assertEqual(roster.players("csk"), ["MS Dhoni", "Nobody"])
+
+
+class TestIndex(unittest.TestCase):
+
+    def test_bundled_teams_resolve(self):
+        roster = rosters.index()
+        self.assertEqual(roster.unresolved, [])
+        self.assertIs(rosters.index(), roster)
+        profiles = roster.profiles("csk")
+        self.assertEqual(len(profiles), len(roster.teams["csk"]["players"]))
+        self.assertEqual(profiles[0]["displayName"], roster.players("csk")[0])
+
+    def test_rebuilt_when_the_file_changes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "teams.json")
+        shutil.copy(rosters.TEAMS_FILE, path)
+        first = rosters.index(path)
+        self.assertIs(rosters.index(path), first)
+        with open(path) as f:
+            teams = json.load(f)
+        teams["csk"]["players"][0] = teams["csk"]["players"][0].lower()
+        with open(path, "w") as f:
+            json.dump(teams, f, indent=2)
+        second = rosters.index(path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.players("csk"), first.players("csk"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import random
+from collections import Counter
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import sampling
+
+
+class FixedDraw:
+    # stands in for the random module: uniform() always lands on `value`
+    def __init__(self, value):
+        self.value = value
+
+    def uniform(self, a, b):
+        return self.value
+
+
+WEIGHTS = {"0": 0.4, "1": 0.3, "2": 0.0, "4": 0.2, "6": 0.1}
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_draw_uses_half_open_intervals_in_order(self):
+        self.assertEqual(sampling.draw(WEIGHTS, rng=FixedDraw(0.0)), "0")
+        self.assertEqual(sampling.draw(WEIGHTS, rng=FixedDraw(0.4)), "1")
+        self.assertEqual(sampling.draw(WEIGHTS, rng=FixedDraw(0.75)), "4")
+        self.assertEqual(sampling.draw(WEIGHTS, rng=FixedDraw(0.95)), "6")
+
+    def test_draw_outside_every_interval(self):
+        self.assertIsNone(sampling.draw({"0": 0.5, "4": -0.2}, total=1.0, rng=FixedDraw(0.9)))
+
+    def test_cumulative_matches_draw(self):
+        table = sampling.Cumulative.from_mapping(WEIGHTS)
+        for value in (0.0, 0.1, 0.4, 0.69, 0.7, 0.85, 0.9, 0.99):
+            self.assertEqual(table.sample(FixedDraw(value)), sampling.draw(WEIGHTS, rng=FixedDraw(value)))
+        self.assertEqual(table.sample(FixedDraw(1.0)), "6")
+
+    def test_cumulative_rejects_negative_weights(self):
+        with self.assertRaises(ValueError):
+            sampling.Cumulative(["a", "b"], [1.0, -0.1])
+
+    def assertFrequencies(self, sample, n=40000):
+        rng = random.Random(11)
+        counts = Counter(sample(rng) for _ in range(n))
+        self.assertNotIn("2", counts)
+        for key, weight in WEIGHTS.items():
+            self.assertAlmostEqual(counts[key] / n, weight, delta=0.01)
+
+    def test_distributions(self):
+        self.assertFrequencies(lambda rng: sampling.draw(WEIGHTS, rng=rng))
+        self.assertFrequencies(sampling.Cumulative.from_mapping(WEIGHTS).sample)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+import json
+from unittest import mock
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+import scorecard
+import seeding
+
+
+def play(sink):
+    return mainconnect.playMatch(mainconnect.MatchContext(sink, rng=seeding.match_rng(4, "csk", "mi")), "csk", "mi", "dusty")
+
+
+class TestScorecard(unittest.TestCase):
+
+    def test_cards_render_once_on_first_read(self):
+        result = play(output_sinks.NullSink())
+        with mock.patch.object(scorecard, "tabulate", wraps=scorecard.tabulate) as grid:
+            card = result["innings1Batting"]
+            self.assertIs(result["innings1Batting"], card)
+            self.assertEqual(grid.call_count, 1)
+        self.assertEqual(result.rendered(), {"innings1Batting"})
+        self.assertIn("Not out", card)
+
+    def test_printed_cards_are_handed_over(self):
+        sink = output_sinks.MemorySink()
+        result = play(sink)
+        self.assertEqual(result.rendered(), set(scorecard.MatchResult.CARDS))
+        for key in scorecard.MatchResult.CARDS:
+            self.assertIn(result[key], sink.getvalue())
+
+    def test_reads_like_a_dict(self):
+        result = play(output_sinks.NullSink())
+        self.assertEqual(len(result), len(list(result)))
+        self.assertIsNone(result.get("missing"))
+        self.assertEqual(result.get("winMsg"), result["winMsg"])
+        data = dict(result)
+        self.assertEqual(data["innings2Bowling"], result["innings2Bowling"])
+        json.dumps(data)  # still JSON-ready once copied out
+
+    def test_rows(self):
+        batting = {"A": {"runs": 10, "balls": 8, "ballLog": ["0:1", "1:W-bowled-X"]},
+                   "B": {"runs": 0, "balls": 0, "ballLog": []}}
+        self.assertEqual(scorecard.batting_rows(batting), [["A", 10, 8, "125.0", "bowled b X"], ["B", 0, 0, "DNB"]])
+        bowling = {"X": {"runs": 12, "balls": 9, "wickets": 1}}
+        self.assertEqual(scorecard.bowling_rows(bowling), [["X", 12, "1.3", 1, "8.0"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+import contextlib
+import io
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import output_sinks
+import season
+
+
+def result(first, second, runs1, runs2, winner, balls2=120):
+    return {"innings1BatTeam": first, "innings2BatTeam": second, "innings1Runs": runs1, "innings2Runs": runs2,
+            "innings1Balls": 120, "innings2Balls": balls2, "winner": winner, "winMsg": "",
+            "innings1Battracker": {"A": {"runs": 30, "balls": 20, "ballLog": ["1:4", "2:W-bowled-X"]}},
+            "innings2Battracker": {"B": {"runs": 10, "balls": 12, "ballLog": ["1:1"]}},
+            "innings1Bowltracker": {"X": {"runs": 20, "balls": 24, "ballLog": [], "wickets": 1}},
+            "innings2Bowltracker": {"Y": {"runs": 25, "balls": 24, "ballLog": [], "wickets": 0}}}
+
+
+class TestSeason(unittest.TestCase):
+
+    def test_league_fixtures(self):
+        fixtures = season.league_fixtures()
+        self.assertEqual(len(fixtures), 28)
+        self.assertEqual(len({frozenset(f) for f in fixtures}), 28)
+        self.assertEqual(fixtures[0], ("dc", "csk"))
+
+    def test_table_merge(self):
+        table = season.SeasonTable(["a", "b", "c"])
+        table.add("a", "b", result("a", "b", 150, 140, "a"))
+        table.add("b", "c", result("c", "b", 160, 160, "tie"))
+        table.add("a", "c", result("a", "c", 120, 121, "c", balls2=100), league=False)
+        self.assertEqual([table.points[t]['pts'] for t in "abc"], [2, 1, 1])
+        self.assertEqual(table.points["b"]["T"], 1)
+        self.assertEqual(table.points["c"]["P"], 1)
+        self.assertEqual(table.points["b"]["runsScored"], 300)
+        self.assertEqual(table.standings()[0], "a")
+        self.assertAlmostEqual(table.nrr("a"), 0.5)
+        self.assertEqual(table.batting["A"]["innings"], 3)
+        self.assertEqual(table.batting["A"]["scoresArray"], [30, 30, 30])
+        self.assertEqual(table.bowling["X"]["wickets"], 3)
+
+    def test_play_matches_game(self):
+        path = "scores/dcvcsk_group.txt"
+        self.addCleanup(lambda: os.path.exists(path) and os.remove(path))
+        res = mainconnect.game(False, "dc", "csk", seed=11, sink=output_sinks.NullSink())
+        played = season.play("dc", "csk", "group", 11)
+        self.assertEqual(played, {key: res[key] for key in season.MATCH_FIELDS})
+        self.assertFalse(os.path.exists(path))
+
+    def test_same_season_with_any_number_of_workers(self):
+        alone = season.run_season(seed=5, workers=1)
+        pooled = season.run_season(seed=5, workers=2)
+        self.assertEqual(alone["league"], pooled["league"])
+        self.assertEqual(alone["table"].points, pooled["table"].points)
+        self.assertEqual(alone["table"].batting, pooled["table"].batting)
+        self.assertEqual([p[:3] for p in alone["playoffs"]], [p[:3] for p in pooled["playoffs"]])
+        self.assertEqual(alone["champion"], pooled["champion"])
+
+        tags = [p[0] for p in alone["playoffs"]]
+        self.assertEqual(tags, ["Qualifier 1", "Eliminator", "Qualifier 2", "Final"])
+        top4 = alone["table"].standings()[:4]
+        self.assertEqual(set(alone["playoffs"][0][1:3]), set(top4[:2]))
+        self.assertIn(alone["champion"], top4)
+
+    def test_cli_writes_stats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                played = season.main(["--seed", "3", "--workers", "1", "--out", tmp])
+            self.assertIn("Season seed 3", out.getvalue())
+            self.assertIn(f"{played['champion'].upper()} WINS THE IPL!!!", out.getvalue())
+            self.assertEqual(sorted(os.listdir(tmp)), ["batStats.txt", "bowlStats.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+import random
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import mainconnect
+import seeding
+from match_simulator import MatchSimulator
+
+
+def play(rng):
+    with open(os.devnull, "w") as devnull:
+        result = mainconnect.playMatch(mainconnect.MatchContext(devnull, rng=rng), "csk", "mi", "dusty")
+    return (result["innings1Runs"], result["innings2Runs"], result["winMsg"],
+            [e["event"] for e in result["innings1Log"]], [e["event"] for e in result["innings2Log"]])
+
+
+class TestSeeding(unittest.TestCase):
+
+    def test_derived_seeds_are_stable(self):
+        # sha256 based, so the same in every process and Python version
+        self.assertEqual(seeding.derive_seed(7, "csk", "mi", "group"), 3820531907127535510)
+        self.assertNotEqual(seeding.derive_seed(7, "csk", "mi"), seeding.derive_seed(7, "mi", "csk"))
+        self.assertIs(seeding.match_rng(None, "csk", "mi"), random)
+
+    def test_seed_fixes_the_scorecard(self):
+        first = play(seeding.match_rng(7, "csk", "mi"))
+        random.seed(123)  # the shared stream has no influence on a seeded match
+        second = play(seeding.match_rng(7, "csk", "mi"))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, play(seeding.match_rng(8, "csk", "mi")))
+
+    def test_seeded_match_leaves_shared_stream_alone(self):
+        random.seed(1)
+        before = random.getstate()
+        play(seeding.match_rng(3, "csk", "mi"))
+        self.assertEqual(before, random.getstate())
+
+    def test_game_seed(self):
+        self.addCleanup(lambda: os.path.exists("scores/cskvmi_seedtest.txt") and os.remove("scores/cskvmi_seedtest.txt"))
+        a = mainconnect.game(False, "csk", "mi", "seedtest", seed=11)
+        b = mainconnect.game(False, "csk", "mi", "seedtest", seed=11)
+        self.assertEqual(a["winMsg"], b["winMsg"])
+        self.assertEqual([e["event"] for e in a["innings2Log"]], [e["event"] for e in b["innings2Log"]])
+
+    def test_match_simulator_seed(self):
+        def run(seed):
+            sim = MatchSimulator("csk", "mi", seed=seed)
+            sim.perform_toss()
+            while not sim.game_over:
+                sim.simulate_one_ball()
+            return sim.innings[1]["score"], sim.innings[2]["score"], sim.win_message
+
+        self.assertEqual(run(5), run(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import sys
+import json
+import random
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+import batch_engine
+import mainconnect
+import win_probability
+from match_simulator import MatchSimulator
+
+
+class TestWinProbability(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        random.seed(5)
+        with open(os.devnull, "w") as devnull:
+            cls.result = mainconnect.playMatch(mainconnect.MatchContext(devnull), "csk", "mi", "dusty")
+        r = cls.result
+        # what app.py stores for the replay page, after a JSON round trip
+        cls.matchData = json.loads(json.dumps({
+            "innings1_bat_team": r["innings1BatTeam"], "innings2_bat_team": r["innings2BatTeam"],
+            "innings1_runs": r["innings1Runs"], "innings1_log": r["innings1Log"], "innings2_log": r["innings2Log"]}))
+
+    def test_states_follow_the_log(self):
+        r = self.result
+        states = win_probability.states_from_log(self.matchData["innings1_log"], 1, r["innings1BatTeam"], r["innings2BatTeam"])
+        self.assertEqual(len(states), len(self.matchData["innings1_log"]))
+        for entry, state in zip(self.matchData["innings1_log"], states):
+            self.assertEqual((state["runs"], state["wickets"], state["balls"]), (entry["runs"], entry["wickets"], entry["balls"]))
+        final = states[-1]
+        for name, tracker in r["innings1Battracker"].items():
+            self.assertEqual(final["batterRuns"].get(name, 0), tracker["runs"])
+            self.assertEqual(final["batterBalls"].get(name, 0), tracker["balls"])
+        for name, tracker in r["innings1Bowltracker"].items():
+            self.assertEqual(final["bowlerBalls"].get(name, 0), tracker["balls"])
+
+    def test_end_of_over_state_faces_the_next_ball(self):
+        r = self.result
+        log = self.matchData["innings1_log"]
+        states = win_probability.states_from_log(log, 1, r["innings1BatTeam"], r["innings2BatTeam"])
+        batting = batch_engine.load_team(r["innings1BatTeam"])
+        sides = (batting, batch_engine.load_team(r["innings2BatTeam"]))
+        checked = 0
+        for i, (entry, state) in enumerate(zip(log[:-1], states)):
+            following = log[i + 1]
+            if state["balls"] % 6 or state["balls"] == 120 or state["striker"] is None or following["balls"] == entry["balls"]:
+                continue
+            start = batch_engine._fresh_start(sides, batch_engine.np.zeros(1, dtype=int))
+            batch_engine._load_state(start, slice(0, 1), batting, sides[1], state)
+            self.assertEqual(batting.batters[start["striker"][0]], state["striker"], i)
+            # batch_engine changes ends before the first ball of the next over
+            self.assertEqual(batting.batters[start["nonStriker"][0]], following["batsman"], i)
+            checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_probability_and_interval(self):
+        r = self.result
+        state = win_probability.state_from_log(self.matchData["innings1_log"][:60], 1, r["innings1BatTeam"], r["innings2BatTeam"])
+        report = win_probability.win_probability(state, rollouts=1000, workers=1, seed=3)
+        low, high = report["interval"]
+        self.assertLessEqual(low, report["winProbability"])
+        self.assertLessEqual(report["winProbability"], high)
+        self.assertLess(high - low, 0.07)
+        self.assertEqual(report, win_probability.win_probability(state, rollouts=1000, workers=1, seed=3))
+
+    def test_process_pool(self):
+        r = self.result
+        state = win_probability.state_from_log(self.matchData["innings2_log"][:50], 2, r["innings2BatTeam"],
+                                               r["innings1BatTeam"], target=r["innings1Runs"] + 1)
+        report = win_probability.win_probability(state, rollouts=600, workers=2, seed=1)
+        self.assertEqual(report["rollouts"], 600)
+        self.assertEqual(report, win_probability.win_probability(state, rollouts=600, workers=1, seed=1))
+        self.assertTrue(0 <= report["winProbability"] + report["tieProbability"] <= 1)
+
+    def test_finished_match_is_certain(self):
+        r = self.result
+        final = win_probability.state_from_log(self.matchData["innings2_log"], 2, r["innings2BatTeam"],
+                                               r["innings1BatTeam"], target=r["innings1Runs"] + 1)
+        report = win_probability.win_probability(final, rollouts=50, workers=1, seed=0)
+        expected = 1.0 if r["winner"] == r["innings2BatTeam"] else 0.0
+        self.assertEqual(report["winProbability"], expected)
+
+    def test_annotate_replay(self):
+        matchData = json.loads(json.dumps(self.matchData))
+        win_probability.annotate_replay(matchData, rollouts=20, seed=4)
+        teams = {self.result["innings1BatTeam"], self.result["innings2BatTeam"]}
+        for entry in matchData["innings1_log"] + matchData["innings2_log"]:
+            self.assertEqual(set(entry["winProbability"]), teams)
+            self.assertLessEqual(sum(entry["winProbability"].values()), 1.0 + 1e-9)
+        # the last ball settles the match
+        if self.result["winner"] in teams:
+            self.assertEqual(matchData["innings2_log"][-1]["winProbability"][self.result["winner"]], 1.0)
+        pooled = json.loads(json.dumps(self.matchData))
+        win_probability.annotate_replay(pooled, rollouts=20, workers=2, seed=4)
+        self.assertEqual(pooled, matchData)
+
+    def test_state_from_match_simulator(self):
+        random.seed(2)
+        sim = MatchSimulator("csk", "mi")
+        sim.perform_toss()
+        for _ in range(30):
+            sim.simulate_one_ball()
+        state = win_probability.state_from_game_state(sim.get_game_state())
+        self.assertEqual(state["balls"], sim.innings[1]["legal_balls_bowled"])
+        report = win_probability.win_probability(state, rollouts=200, workers=1, seed=0)
+        self.assertTrue(0 <= report["winProbability"] <= 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+from statistics import NormalDist
+
+import numpy as np
+
+import batch_engine
+import player_profiles
+import pools
+from recent_form import DEFAULT_WINDOW
+
+# Win probability from any point of a match, by playing it out many times
+# with batch_engine.simulate_states().
+#
+# A match state is a plain dict, so it can come from a stored replay, a JSON
+# request or MatchSimulator, and be sent to worker processes as is:
+#
+#   inningsNo, battingTeam, bowlingTeam, runs, wickets, balls (legal),
+#   target (innings 2 only), striker, nonStriker (initials, None if the new
+#   batter after a wicket is not in yet), batted (initials in the order they
+#   came in), batterRuns, batterBalls, bowlerBalls (initials -> count),
+#   bowler (bowling the over in progress or the next one, None if unknown),
+#   lastBowler (bowled the over before it).
+#
+# states_from_log() and state_from_game_state() build states from the two
+# engines' records. win_probability() plays one state's rollouts and
+# annotate_replay() every ball of a stored replay, in batch passes that can
+# be spread over a process pool.
+
+# Rollouts (win_probability) and states (annotate_replay) are played in
+# chunks of these sizes, each with its own stream spawned from the seed, and
+# the workers share out the chunks: a seed gives the same numbers whatever
+# the number of workers or CPUs.
+ROLLOUTS_PER_CHUNK = 250
+STATES_PER_CHUNK = 120
+
+
+def new_state(inningsNo, battingTeam, bowlingTeam, target=None):
+    return {"inningsNo": inningsNo, "battingTeam": battingTeam, "bowlingTeam": bowlingTeam,
+            "runs": 0, "wickets": 0, "balls": 0, "target": target, "striker": None, "nonStriker": None,
+            "batted": [], "batterRuns": {}, "batterBalls": {}, "bowlerBalls": {}, "bowler": None, "lastBowler": None}
+
+
+def states_from_log(log, inningsNo, battingTeam, bowlingTeam, target=None):
+    """The match state after each entry of a mainconnect innings log.
+
+    Works on an InningsLog or on a stored replay's copy of one: batter and
+    bowler counts come from the entries' "bat"/"bowl" deltas, strike from the
+    entry's batters and result, and who bowls next from the following entry
+    where there is one.
+    """
+    state = new_state(inningsNo, battingTeam, bowlingTeam, target)
+    states = []
+    for i, entry in enumerate(log):
+        previous = state
+        state = dict(state, batted=list(state["batted"]), batterRuns=dict(state["batterRuns"]),
+                     batterBalls=dict(state["batterBalls"]), bowlerBalls=dict(state["bowlerBalls"]))
+        for ini in (entry["batter1"], entry["batter2"]):
+            if ini not in state["batted"]:
+                state["batted"].append(ini)
+        if "bat" in entry:
+            state["batterRuns"][entry["batsman"]] = state["batterRuns"].get(entry["batsman"], 0) + entry["bat"][0]
+            state["batterBalls"][entry["batsman"]] = state["batterBalls"].get(entry["batsman"], 0) + entry["bat"][1]
+        if "bowl" in entry:
+            state["bowlerBalls"][entry["bowler"]] = state["bowlerBalls"].get(entry["bowler"], 0) + entry["bowl"][1]
+        state["runs"], state["wickets"], state["balls"] = entry["runs"], entry["wickets"], entry["balls"]
+
+        # strike as the ball left it; batch_engine changes ends itself at the start of an over
+        striker = entry["batsman"]
+        other = entry["batter2"] if striker == entry["batter1"] else entry["batter1"]
+        if state["wickets"] > previous["wickets"]:
+            striker = None
+        elif state["balls"] > previous["balls"] and (state["runs"] - previous["runs"]) % 2 == 1:
+            striker, other = other, striker
+        state["striker"], state["nonStriker"] = striker, other
+        following = log[i + 1] if i + 1 < len(log) else None
+        if following is not None:
+            state["bowler"] = following["bowler"]
+        else:
+            state["bowler"] = entry["bowler"] if state["balls"] % 6 != 0 else None
+        if state["balls"] % 6 == 0 and state["balls"] > 0:
+            state["lastBowler"] = entry["bowler"]
+        states.append(state)
+    return states
+
+
+def state_from_log(log, inningsNo, battingTeam, bowlingTeam, target=None):
+    states = states_from_log(log, inningsNo, battingTeam, bowlingTeam, target)
+    return states[-1] if states else new_state(inningsNo, battingTeam, bowlingTeam, target)
+
+
+def _initials(name):
+    # MatchSimulator keys players by their teams.json entry, the engines by playerInitials
+    try:
+        return player_profiles.get_profile(name)['playerInitials']
+    except KeyError:
+        return name
+
+
+def state_from_game_state(gameState):
+    """The match state behind a MatchSimulator.get_game_state() snapshot."""
+    inningsNo = gameState["current_innings_num"]
+    inningsData = gameState["innings_data"]
+    innings = inningsData.get(inningsNo, inningsData.get(str(inningsNo)))
+    battingTeam = innings["batting_team_code"].lower()
+    bowlingTeam = innings["bowling_team_code"].lower()
+    state = new_state(inningsNo, battingTeam, bowlingTeam, gameState["target_score"] if inningsNo == 2 else None)
+    state["runs"], state["wickets"], state["balls"] = innings["score"], innings["wickets"], innings["legal_balls_bowled"]
+
+    batting = innings["batting_tracker"]
+    batted = [ini for ini, t in batting.items() if t.get("how_out") not in ("Did Not Bat", None) or t.get("balls")]
+    state["batted"] = [_initials(ini) for ini in sorted(batted, key=lambda ini: batting[ini].get("order", 0))]
+    state["batterRuns"] = {_initials(ini): batting[ini].get("runs", 0) for ini in batted}
+    state["batterBalls"] = {_initials(ini): batting[ini].get("balls", 0) for ini in batted}
+    state["bowlerBalls"] = {_initials(ini): t.get("balls_bowled", 0) for ini, t in innings["bowling_tracker"].items()}
+    for key, name in (("striker", gameState["on_strike"]), ("nonStriker", gameState["non_striker"]),
+                      ("bowler", gameState["current_bowler"])):
+        state[key] = _initials(name) if name else None
+    return state
+
+
+def wilson_interval(wins, n, confidence=0.95):
+    if n == 0:
+        return (0.0, 1.0)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / n
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * ((p * (1 - p) / n + z * z / (4 * n * n)) ** 0.5) / (1 + z * z / n)
+    return (max(0.0, centre - half), min(1.0, centre + half))
+
+
+def _rollout(states, rollouts, seed, formWindow):
+    # [batting side wins, ties] per state; runs in the worker processes
+    result = batch_engine.simulate_states(states, rollouts, seed=seed, formWindow=formWindow)
+    winner = result.winner.reshape(len(states), rollouts)
+    batting = np.array([0 if s["battingTeam"] == result.team1 else 1 for s in states])
+    return np.stack([(winner == batting[:, None]).sum(axis=1), (winner == 2).sum(axis=1)], axis=1)
+
+
+def win_probability(state, rollouts=2000, workers=None, seed=None, confidence=0.95, formWindow=DEFAULT_WINDOW):
+    """Chance that the batting side of `state` wins, from `rollouts` playouts.
+
+    The rollouts are played in chunks of ROLLOUTS_PER_CHUNK, shared out over
+    `workers` processes (one per CPU by default; workers=1 stays in this
+    process). The interval is a Wilson score interval at
+    `confidence`; ties count as neither side winning.
+    """
+    shares = [min(ROLLOUTS_PER_CHUNK, rollouts - start) for start in range(0, rollouts, ROLLOUTS_PER_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shares))
+    jobs = [([state], share, s, formWindow) for share, s in zip(shares, seeds)]
+    counts = sum(pools.run(_rollout, jobs, pools.worker_count(workers, len(jobs))))
+    wins, ties = (int(c) for c in counts[0])
+    low, high = wilson_interval(wins, rollouts, confidence)
+    return {"battingTeam": state["battingTeam"], "bowlingTeam": state["bowlingTeam"],
+            "winProbability": wins / rollouts, "tieProbability": ties / rollouts,
+            "interval": [low, high], "confidence": confidence, "rollouts": rollouts}
+
+
+def annotate_replay(matchData, rollouts=200, workers=1, seed=None, formWindow=DEFAULT_WINDOW):
+    """Add a "winProbability" {team: probability} to every ball of a stored replay.
+
+    `matchData` is the dict app.py saves for the ball-by-ball replay. The
+    balls' states go into one simulate_states() pass per STATES_PER_CHUNK,
+    shared out over `workers` processes. Returns `matchData`.
+    """
+    first, second = matchData["innings1_bat_team"], matchData["innings2_bat_team"]
+    log1, log2 = matchData.get("innings1_log", []), matchData.get("innings2_log", [])
+    entries = list(log1) + list(log2)
+    if not entries:
+        return matchData
+    states = (states_from_log(log1, 1, first, second)
+              + states_from_log(log2, 2, second, first, target=matchData["innings1_runs"] + 1))
+
+    starts = range(0, len(states), STATES_PER_CHUNK)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    jobs = [(states[a:a + STATES_PER_CHUNK], rollouts, s, formWindow) for a, s in zip(starts, seeds)]
+    counts = np.concatenate(list(pools.run(_rollout, jobs, pools.worker_count(workers, len(jobs)))))
+
+    for entry, state, (wins, ties) in zip(entries, states, counts):
+        p = float(wins) / rollouts
+        entry["winProbability"] = {state["battingTeam"]: p,
+                                   state["bowlingTeam"]: (rollouts - int(wins) - int(ties)) / rollouts}
+    return matchData